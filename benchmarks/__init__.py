@@ -0,0 +1 @@
+"""Benchmarks, run as modules e.g. `uv run python -m benchmarks.group_lookups`."""
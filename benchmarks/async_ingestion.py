@@ -0,0 +1,94 @@
+"""Benchmark async ingestion of paged `Event` data, with simulated fetch latency.
+
+Compares `Event.list_from_data()` called on the event loop after each fetch
+against `Event.aiter_from_data()`, reporting total time and how long a task
+waiting on the event loop was delayed, e.g.:
+
+    uv run python -m benchmarks.async_ingestion
+"""
+
+from __future__ import annotations
+
+import asyncio
+import gc
+import time
+from typing import TYPE_CHECKING
+
+from spond_classes import Event
+from spond_classes.synthetic import group_data, iter_events_data
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Callable, Coroutine
+
+    from spond_classes.typing import DictFromJSON
+
+PAGES = 5
+EVENTS_PER_PAGE = 10_000
+FETCH_SECONDS = 0.2
+TICK_SECONDS = 0.001
+LONG_LAG_SECONDS = 0.02
+
+
+async def _pages(data: list[DictFromJSON]) -> AsyncIterator[list[DictFromJSON]]:
+    """Yield pages of `data`, each after a simulated fetch."""
+    for start in range(0, len(data), EVENTS_PER_PAGE):
+        await asyncio.sleep(FETCH_SECONDS)
+        yield data[start : start + EVENTS_PER_PAGE]
+
+
+async def _lags(stop: asyncio.Event) -> list[float]:
+    """Return delays beyond `TICK_SECONDS` of each tick of a ticking task."""
+    lags = []
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(TICK_SECONDS)
+        lags.append(time.perf_counter() - start - TICK_SECONDS)
+    return lags
+
+
+async def _measure(
+    ingest: Callable[[], Coroutine[None, None, int]],
+) -> tuple[float, list[float], int]:
+    """Return total seconds, event loop lags in seconds and result of `ingest()`."""
+    stop = asyncio.Event()
+    lag_task = asyncio.create_task(_lags(stop))
+    start = time.perf_counter()
+    result = await ingest()
+    duration = time.perf_counter() - start
+    stop.set()
+    return duration, await lag_task, result
+
+
+def main() -> None:
+    """Count events ingested each way."""
+    data = list(iter_events_data(group_data(), events=PAGES * EVENTS_PER_PAGE))
+    Event.list_from_data(data[:1])  # warm up
+    # Exclude the data from garbage collections, which otherwise dominate lags
+    gc.freeze()
+
+    async def blocking() -> int:
+        count = 0
+        async for page in _pages(data):
+            count += len(Event.list_from_data(page))
+        return count
+
+    async def overlapped() -> int:
+        return len([event async for event in Event.aiter_from_data(_pages(data))])
+
+    fetching = PAGES * FETCH_SECONDS * 1000
+    print(f"{PAGES} pages of {EVENTS_PER_PAGE} events, {fetching:.0f} ms fetching:")
+    for label, ingest in (
+        ("list_from_data() on loop", blocking),
+        ("aiter_from_data()", overlapped),
+    ):
+        duration, lags, count = asyncio.run(_measure(ingest))
+        long_lags = sum(lag > LONG_LAG_SECONDS for lag in lags)
+        print(
+            f"  {label:25} {count} events in {duration * 1000:8.2f} ms, "
+            f"loop lags > {LONG_LAG_SECONDS * 1000:.0f} ms: {long_lags:3}, "
+            f"max {max(lags) * 1000:7.2f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""Benchmark `AttendanceMatrix` against per-object attendance rate calculation."""
+
+from __future__ import annotations
+
+import timeit
+
+from spond_classes import AttendanceMatrix, Event, Group
+from spond_classes.synthetic import group_data, iter_events_data
+
+MEMBERS = 2_000
+EVENTS = 300
+RESPONSES = 200
+REPEAT = 3
+
+
+def _naive_attendance_rates(group: Group, events: list[Event]) -> dict[str, float]:
+    """Calculate attendance rate per member, iterating `Event.responses` lists."""
+    rates = {}
+    for member in group.members:
+        accepted = responded = 0
+        for event in events:
+            responses = event.responses
+            if member.uid in responses.accepted_uids:
+                accepted += 1
+                responded += 1
+            elif (
+                member.uid in responses.declined_uids
+                or member.uid in responses.unanswered_uids
+                or member.uid in responses.waiting_list_uids
+                or member.uid in responses.unconfirmed_uids
+            ):
+                responded += 1
+        rates[member.uid] = accepted / responded if responded else 0.0
+    return rates
+
+
+def main() -> None:
+    """Time attendance rate per member each way."""
+    data = group_data(members=MEMBERS)
+    group = Group.from_dict(data)
+    events = Event.list_from_data(
+        iter_events_data(data, events=EVENTS, responses=RESPONSES)
+    )
+
+    naive = min(
+        timeit.repeat(
+            lambda: _naive_attendance_rates(group, events), number=1, repeat=REPEAT
+        )
+    )
+    matrix = min(
+        timeit.repeat(
+            lambda: AttendanceMatrix(group, events).member_attendance_rates(),
+            number=1,
+            repeat=REPEAT,
+        )
+    )
+    print(f"Attendance rates, {MEMBERS} members x {EVENTS} events:")
+    print(f"  per object:        {naive * 1000:8.2f} ms")
+    print(f"  AttendanceMatrix:  {matrix * 1000:8.2f} ms (includes building matrix)")
+
+
+if __name__ == "__main__":
+    main()
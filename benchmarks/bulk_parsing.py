@@ -0,0 +1,49 @@
+"""Benchmark `list_from_data()` against `from_dict()` per item."""
+
+from __future__ import annotations
+
+import timeit
+from typing import TYPE_CHECKING
+
+from spond_classes import Event, Group
+from spond_classes.synthetic import group_data, iter_events_data
+
+if TYPE_CHECKING:
+    from spond_classes.typing import DictFromJSON
+
+EVENTS = 20_000
+GROUPS = 20
+REPEAT = 5
+
+
+def _compare(label: str, cls: type[Event | Group], items: list[DictFromJSON]) -> None:
+    """Time construction of a list each way, best of `REPEAT`."""
+    per_item = min(
+        timeit.repeat(
+            lambda: [cls.from_dict(item) for item in items], number=1, repeat=REPEAT
+        )
+    )
+    bulk = min(
+        timeit.repeat(lambda: cls.list_from_data(items), number=1, repeat=REPEAT)
+    )
+    print(f"{label}:")
+    print(f"  from_dict() per item: {per_item * 1000:8.2f} ms")
+    print(f"  list_from_data():     {bulk * 1000:8.2f} ms")
+
+
+def main() -> None:
+    """Compare for `Event`s and `Group`s."""
+    _compare(
+        f"{EVENTS} events",
+        Event,
+        list(iter_events_data(group_data(), events=EVENTS)),
+    )
+    _compare(
+        f"{GROUPS} groups of 500 members",
+        Group,
+        [group_data(members=500, seed=seed) for seed in range(GROUPS)],
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""Benchmark export to columns against dumping each model to a row `dict`.
+
+e.g.:
+
+    uv run python -m benchmarks.columnar
+"""
+
+from __future__ import annotations
+
+import timeit
+import tracemalloc
+from typing import TYPE_CHECKING
+
+from spond_classes import Event, Group
+from spond_classes.synthetic import group_data, iter_events_data, iter_groups_data
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+EVENTS = 100_000
+GROUPS = 100
+MEMBERS = 1_000
+REPEAT = 3
+
+
+def _measure(label: str, func: Callable[[], object]) -> None:
+    """Print best duration of `REPEAT` calls of `func`, then its peak memory."""
+    duration = min(timeit.repeat(func, number=1, repeat=REPEAT))
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"  {label:36} {duration * 1000:9.2f} ms, peak {peak / 1e6:7.1f} MB")
+
+
+def main() -> None:
+    """Export `Event`s and `Member`s each way."""
+    events = Event.list_from_data(iter_events_data(group_data(), events=EVENTS))
+    groups = Group.list_from_data(iter_groups_data(groups=GROUPS, members=MEMBERS))
+
+    print(f"{EVENTS} events:")
+    _measure(
+        "rows via model_dump()",
+        lambda: [event.model_dump(exclude={"responses"}) for event in events],
+    )
+    _measure("Event.list_to_columns()", lambda: Event.list_to_columns(events))
+    _measure(
+        "responses rows via model_dump()",
+        lambda: [
+            (event.uid, uid, status.removesuffix("_uids"))
+            for event in events
+            for status, uids in event.responses.model_dump().items()
+            for uid in uids
+        ],
+    )
+    _measure(
+        "Event.list_responses_to_columns()",
+        lambda: Event.list_responses_to_columns(events),
+    )
+
+    print(f"{GROUPS * MEMBERS} members:")
+    _measure(
+        "rows via model_dump()",
+        lambda: [
+            member.model_dump(exclude={"fields"})
+            for group in groups
+            for member in group.members
+        ],
+    )
+    _measure(
+        "Group.list_members_to_columns()",
+        lambda: Group.list_members_to_columns(groups),
+    )
+
+
+if __name__ == "__main__":
+    main()
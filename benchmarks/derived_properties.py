@@ -0,0 +1,86 @@
+"""Benchmark derived properties, on first and repeated access.
+
+Only `sort_key` is cached, as the others cost less to compute than to cache.
+
+e.g.:
+
+    uv run python -m benchmarks.derived_properties
+"""
+
+from __future__ import annotations
+
+import timeit
+from operator import attrgetter
+from typing import TYPE_CHECKING
+
+from spond_classes import Event, Group
+from spond_classes.profile_ import _name_sort_key
+from spond_classes.synthetic import group_data, iter_events_data, iter_groups_data
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from spond_classes import Member
+
+EVENTS = 100_000
+GROUPS = 100
+MEMBERS = 500
+REPEAT = 5
+
+
+def _discard_cached(models: list[Member] | list[Event]) -> None:
+    """Discard cached values, so the next access computes them."""
+    for model in models:
+        model._invalidate_cache()  # noqa: SLF001
+
+
+def _compare(
+    label: str, models: list[Member] | list[Event], func: Callable[[], object]
+) -> None:
+    """Print best duration of `REPEAT` calls of `func`, on first then repeated
+    access.
+    """
+    first = min(
+        timeit.repeat(
+            func, setup=lambda: _discard_cached(models), number=1, repeat=REPEAT
+        )
+    )
+    repeated = min(timeit.repeat(func, number=1, repeat=REPEAT))
+    print(f"  {label:44} first {first * 1000:8.2f} ms, then {repeated * 1000:8.2f} ms")
+
+
+def main() -> None:
+    """Access properties of `Member`s and `Event`s."""
+    groups = Group.list_from_data(iter_groups_data(groups=GROUPS, members=MEMBERS))
+    members = [member for group in groups for member in group.members]
+    events = Event.list_from_data(iter_events_data(group_data(), events=EVENTS))
+
+    print(f"{len(members)} members:")
+    _compare("full_name", members, lambda: [member.full_name for member in members])
+    _compare(
+        "sorted(key=name keys built per sort)",
+        members,
+        lambda: sorted(
+            members,
+            key=lambda member: (
+                _name_sort_key(member.last_name),
+                _name_sort_key(member.first_name),
+            ),
+        ),
+    )
+    _compare(
+        "sorted(key=attrgetter('sort_key'))",
+        members,
+        lambda: sorted(members, key=attrgetter("sort_key")),
+    )
+    print(f"{EVENTS} events:")
+    _compare("url", events, lambda: [event.url for event in events])
+    _compare(
+        "is_cancelled or is_hidden",
+        events,
+        lambda: [event for event in events if event.is_cancelled or event.is_hidden],
+    )
+
+
+if __name__ == "__main__":
+    main()
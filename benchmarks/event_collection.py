@@ -0,0 +1,45 @@
+"""Benchmark `EventCollection` queries against scanning a list of `Event`s."""
+
+from __future__ import annotations
+
+import timeit
+from datetime import timedelta
+
+from spond_classes import Event, EventCollection
+from spond_classes.synthetic import group_data, iter_events_data
+
+EVENTS = 100_000
+NUMBER = 100
+
+
+def main() -> None:
+    """Time each query each way, per call."""
+    events = Event.list_from_data(iter_events_data(group_data(), events=EVENTS))
+    collection = EventCollection(events)
+    start = events[EVENTS // 2].start_time
+    end = start + timedelta(days=7)
+    collection.where(type="EVENT", cancelled=False)  # build indexes
+
+    cases = {
+        "starting_between": (
+            lambda: [e for e in events if start <= e.start_time < end],
+            lambda: collection.starting_between(start, end),
+        ),
+        "overlapping": (
+            lambda: [e for e in events if e.start_time < end and e.end_time > start],
+            lambda: collection.overlapping(start, end),
+        ),
+        "where(type, cancelled)": (
+            lambda: [e for e in events if e.type == "EVENT" and not e.is_cancelled],
+            lambda: collection.where(type="EVENT", cancelled=False),
+        ),
+    }
+    print(f"{EVENTS} events, ms per call:")
+    for label, (scan, indexed) in cases.items():
+        scan_ms = timeit.timeit(scan, number=NUMBER) / NUMBER * 1000
+        indexed_ms = timeit.timeit(indexed, number=NUMBER) / NUMBER * 1000
+        print(f"  {label:24} scan: {scan_ms:8.3f}  indexed: {indexed_ms:8.3f}")
+
+
+if __name__ == "__main__":
+    main()
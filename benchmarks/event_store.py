@@ -0,0 +1,56 @@
+"""Benchmark `EventStore` lookups against loading a full list of `Event`s."""
+
+from __future__ import annotations
+
+import json
+import tempfile
+import timeit
+import tracemalloc
+from pathlib import Path
+
+from spond_classes import Event, EventStore
+from spond_classes.synthetic import group_data, iter_events_data
+
+EVENTS = 200_000
+LOOKUPS = 10
+REPEAT = 5
+
+
+def main() -> None:
+    """Time getting `LOOKUPS` `Event`s by uid each way, best of `REPEAT`."""
+    events = Event.list_from_data(iter_events_data(group_data(), events=EVENTS))
+    uids = [event.uid for event in events[:: EVENTS // LOOKUPS]]
+    with tempfile.TemporaryDirectory() as directory:
+        json_path = Path(directory) / "events.json"
+        json_path.write_text(
+            json.dumps(
+                [event.model_dump(mode="json", by_alias=True) for event in events]
+            )
+        )
+        store_path = Path(directory) / "events.store"
+        EventStore.write(store_path, events)
+        del events
+
+        def full_list() -> list[Event]:
+            by_uid = {
+                event.uid: event
+                for event in Event.list_from_json(json_path.read_bytes())
+            }
+            return [by_uid[uid] for uid in uids]
+
+        def store() -> list[Event]:
+            with EventStore(store_path) as store_:
+                return [store_.event_by_uid(uid) for uid in uids]
+
+        print(f"{LOOKUPS} lookups in {EVENTS} events:")
+        for label, func in (("full list", full_list), ("EventStore", store)):
+            best = min(timeit.repeat(func, number=1, repeat=REPEAT))
+            tracemalloc.start()
+            func()
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            print(f"  {label:10}: {best * 1000:10.2f} ms, peak {peak / 1e6:8.2f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""Benchmark memory and time to construct frozen models against mutable ones.
+
+Tuples only avoid the spare capacity of lists, so memory use is about the same.
+
+e.g.:
+
+    uv run python -m benchmarks.frozen_models
+"""
+
+from __future__ import annotations
+
+import gc
+import timeit
+import tracemalloc
+from typing import TYPE_CHECKING
+
+from spond_classes import Event, Group
+from spond_classes.frozen import FrozenEvent, FrozenGroup
+from spond_classes.synthetic import group_data, iter_events_data, iter_groups_data
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+EVENTS = 50_000
+GROUPS = 50
+MEMBERS = 200
+REPEAT = 3
+
+
+def _measure(label: str, func: Callable[[], object]) -> None:
+    """Print best duration of `REPEAT` calls of `func`, then memory its result
+    retains.
+    """
+    duration = min(timeit.repeat(func, number=1, repeat=REPEAT))
+    gc.collect()
+    tracemalloc.start()
+    result = func()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    print(f"  {label:34} {duration * 1000:9.2f} ms, retains {retained / 1e6:7.1f} MB")
+
+
+def main() -> None:
+    """Construct `Event`s and `Group`s each way."""
+    events_data = list(iter_events_data(group_data(), events=EVENTS))
+    groups_data = list(iter_groups_data(groups=GROUPS, members=MEMBERS))
+
+    print(f"{EVENTS} events:")
+    _measure("Event.list_from_data()", lambda: Event.list_from_data(events_data))
+    _measure(
+        "FrozenEvent.list_from_data()",
+        lambda: FrozenEvent.list_from_data(events_data),
+    )
+
+    print(f"{GROUPS} groups of {MEMBERS} members:")
+    _measure("Group.list_from_data()", lambda: Group.list_from_data(groups_data))
+    _measure(
+        "FrozenGroup.list_from_data()",
+        lambda: FrozenGroup.list_from_data(groups_data),
+    )
+
+
+if __name__ == "__main__":
+    main()
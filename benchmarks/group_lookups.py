@@ -0,0 +1,57 @@
+"""Benchmark `Group` lookups against linear scans of `Group.members`."""
+
+from __future__ import annotations
+
+import timeit
+
+from spond_classes import Group, Member, Subgroup
+from spond_classes.synthetic import group_data
+
+MEMBERS = 10_000
+LOOKUPS = 1_000
+SUBGROUPS = 100
+
+
+def _linear_member_by_uid(group: Group, uid: str) -> Member:
+    """Look up a `Member` as `Group.member_by_uid()` did before indexing."""
+    for member in group.members:
+        if member.uid == uid:
+            return member
+    raise LookupError(uid)
+
+
+def _linear_members_by_subgroup(group: Group, subgroup: Subgroup) -> list[Member]:
+    """Filter `Member`s as `Group.members_by_subgroup()` did before indexing."""
+    return [member for member in group.members if subgroup.uid in member.subgroup_uids]
+
+
+def main() -> None:
+    """Time lookups each way."""
+    group = Group.from_dict(group_data(members=MEMBERS, subgroups=SUBGROUPS))
+    step = MEMBERS // LOOKUPS
+    uids = [member.uid for member in group.members[::step]]
+
+    linear = timeit.timeit(
+        lambda: [_linear_member_by_uid(group, uid) for uid in uids], number=1
+    )
+    indexed = timeit.timeit(
+        lambda: [group.member_by_uid(uid) for uid in uids], number=1
+    )
+    print(f"{LOOKUPS} lookups among {MEMBERS} members:")
+    print(f"  linear scan: {linear * 1000:8.2f} ms")
+    print(f"  indexed:     {indexed * 1000:8.2f} ms (includes building index)")
+
+    linear = timeit.timeit(
+        lambda: [_linear_members_by_subgroup(group, sg) for sg in group.subgroups],
+        number=1,
+    )
+    indexed = timeit.timeit(
+        lambda: [group.members_by_subgroup(sg) for sg in group.subgroups], number=1
+    )
+    print(f"Members of each of {SUBGROUPS} subgroups, among {MEMBERS} members:")
+    print(f"  linear scan: {linear * 1000:8.2f} ms")
+    print(f"  indexed:     {indexed * 1000:8.2f} ms (includes building index)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""Benchmark incremental updates against constructing new instances."""
+
+from __future__ import annotations
+
+import copy
+import timeit
+
+from spond_classes import Event, Group
+from spond_classes.synthetic import group_data, iter_events_data
+
+MEMBERS = 5_000
+EVENTS = 2_000
+REPEAT = 5
+
+
+def _group() -> None:
+    """Time syncing a `Group` with one changed `Member` each way, best of `REPEAT`.
+
+    Each update alternates between two versions of the data, so each is a change.
+    """
+    data = group_data(members=MEMBERS)
+    changed_data = copy.deepcopy(data)
+    changed_data["members"][0]["firstName"] = "Changed"
+    group = Group.from_dict(data)
+    group.update_from_dict(changed_data)  # record fingerprints
+    versions = [changed_data, data]  # current data first
+
+    def update() -> None:
+        versions.reverse()
+        group.update_from_dict(versions[0])
+
+    rebuilt = min(timeit.repeat(lambda: Group.from_dict(data), number=1, repeat=REPEAT))
+    updated = min(timeit.repeat(update, number=1, repeat=REPEAT))
+    print(f"Group of {MEMBERS} members, 1 changed:")
+    print(f"  from_dict:        {rebuilt * 1000:8.2f} ms")
+    print(f"  update_from_dict: {updated * 1000:8.2f} ms")
+
+
+def _events(every: int) -> None:
+    """Time syncing `Event`s, with a changed response in every `every`th, each way,
+    best of `REPEAT`.
+
+    Each update alternates between two versions of the data, so each is a change.
+    """
+    data = list(iter_events_data(group_data(), events=EVENTS))
+    changed_data = copy.deepcopy(data)
+    for item in changed_data[::every]:
+        responses = item["responses"]
+        responses["declinedIds"] += responses["acceptedIds"][:1]
+        del responses["acceptedIds"][:1]
+    events = Event.list_from_data(data)
+    for event, item in zip(events, changed_data, strict=True):
+        event.update_from_dict(item)  # record fingerprints
+    versions = [changed_data, data]  # current data first
+
+    def update() -> None:
+        versions.reverse()
+        for event, item in zip(events, versions[0], strict=True):
+            event.update_from_dict(item)
+
+    rebuilt = min(
+        timeit.repeat(lambda: Event.list_from_data(data), number=1, repeat=REPEAT)
+    )
+    updated = min(timeit.repeat(update, number=1, repeat=REPEAT))
+    print(f"{EVENTS} events, 1 in {every} with a changed response:")
+    print(f"  list_from_data:   {rebuilt * 1000:8.2f} ms")
+    print(f"  update_from_dict: {updated * 1000:8.2f} ms")
+
+
+def main() -> None:
+    """Compare for a `Group` and `Event`s."""
+    _group()
+    _events(every=1)
+    _events(every=100)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""Benchmark `list_from_json()` against `json.loads()` then `list_from_data()`."""
+
+from __future__ import annotations
+
+import json
+import timeit
+import tracemalloc
+from typing import TYPE_CHECKING
+
+from spond_classes import Event
+from spond_classes.synthetic import group_data, iter_events_data
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+EVENTS = 20_000
+REPEAT = 5
+
+
+def _peak_memory(func: Callable[[], object]) -> int:
+    """Return peak memory allocated while calling `func`, in bytes."""
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def main() -> None:
+    """Time and measure peak memory each way."""
+    json_data = json.dumps(list(iter_events_data(group_data(), events=EVENTS))).encode()
+
+    def via_dicts() -> list[Event]:
+        return Event.list_from_data(json.loads(json_data))
+
+    def direct() -> list[Event]:
+        return Event.list_from_json(json_data)
+
+    print(f"{EVENTS} events from {len(json_data) / 1e6:.1f} MB JSON:")
+    for label, func in (
+        ("json.loads(), list_from_data()", via_dicts),
+        ("list_from_json()", direct),
+    ):
+        seconds = min(timeit.repeat(func, number=1, repeat=REPEAT))
+        peak = _peak_memory(func)
+        print(f"  {label:31} {seconds * 1000:8.2f} ms, peak {peak / 1e6:6.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""Benchmark `list_to_json()` against `model_dump()` per model then `json.dumps()`.
+
+e.g.:
+
+    uv run python -m benchmarks.json_serialisation
+"""
+
+from __future__ import annotations
+
+import io
+import json
+import timeit
+from typing import TYPE_CHECKING, Any
+
+from spond_classes import Event, Group
+from spond_classes.synthetic import group_data, iter_events_data, iter_groups_data
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+EVENTS = 50_000
+GROUPS = 50
+MEMBERS = 500
+REPEAT = 3
+
+
+def _compare(label: str, cls: type[Event | Group], models: Sequence[Any]) -> None:
+    """Time serialising `models` each way, best of `REPEAT`."""
+    print(f"{label}:")
+    for method, func in (
+        (
+            "model_dump() + json.dumps()",
+            lambda: json.dumps(
+                [model.model_dump(by_alias=True, mode="json") for model in models]
+            ).encode(),
+        ),
+        ("list_to_json()", lambda: cls.list_to_json(models)),
+        ("list_to_json_file()", lambda: cls.list_to_json_file(models, io.BytesIO())),
+    ):
+        duration = min(timeit.repeat(func, number=1, repeat=REPEAT))
+        print(f"  {method:28} {duration * 1000:9.2f} ms")
+
+
+def main() -> None:
+    """Serialise `Event`s and `Group`s each way."""
+    events = Event.list_from_data(iter_events_data(group_data(), events=EVENTS))
+    groups = Group.list_from_data(iter_groups_data(groups=GROUPS, members=MEMBERS))
+    _compare(f"{EVENTS} events", Event, events)
+    _compare(f"{GROUPS} groups of {MEMBERS} members", Group, groups)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,33 @@
+"""Benchmark `Group.from_dict(lazy_members=True)` when few members are used."""
+
+from __future__ import annotations
+
+import timeit
+
+from spond_classes import Group
+from spond_classes.synthetic import group_data
+
+MEMBERS = 5_000
+REPEAT = 5
+
+
+def main() -> None:
+    """Time construction then access to group name and first member, each way."""
+    data = group_data(members=MEMBERS)
+
+    def eager() -> str:
+        group = Group.from_dict(data)
+        return f"{group.name}: {group.members[0].full_name}"
+
+    def lazy() -> str:
+        group = Group.from_dict(data, lazy_members=True)
+        return f"{group.name}: {group.members[0].full_name}"
+
+    print(f"Group of {MEMBERS} members, name and one member accessed:")
+    for label, func in (("eager", eager), ("lazy_members", lazy)):
+        seconds = min(timeit.repeat(func, number=1, repeat=REPEAT))
+        print(f"  {label:12} {seconds * 1000:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""Benchmark `list_from_data(executor=...)` scaling across numbers of workers.
+
+Worker counts are powers of 2 up to the number of CPUs, e.g.:
+
+    uv run python -m benchmarks.parallel_parsing
+"""
+
+from __future__ import annotations
+
+import os
+import timeit
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import TYPE_CHECKING
+
+from spond_classes import Event, Group
+from spond_classes.synthetic import group_data, iter_events_data, iter_groups_data
+
+if TYPE_CHECKING:
+    from spond_classes.typing import DictFromJSON
+
+EVENTS = 50_000
+GROUPS = 40
+MEMBERS = 500
+REPEAT = 3
+
+
+def _scale(label: str, cls: type[Event | Group], data: list[DictFromJSON]) -> None:
+    """Time with each kind of executor and number of workers, best of `REPEAT`."""
+    cpus = os.cpu_count() or 1
+    worker_counts = [2**i for i in range(cpus.bit_length()) if 2**i <= cpus]
+    serial = min(
+        timeit.repeat(lambda: cls.list_from_data(data), number=1, repeat=REPEAT)
+    )
+    print(f"{label}:")
+    print(f"  {'serial':28}: {serial * 1000:9.2f} ms")
+    for executor_class in (ProcessPoolExecutor, ThreadPoolExecutor):
+        for workers in worker_counts:
+            with executor_class(max_workers=workers) as executor:
+                cls.list_from_data(data[:workers], executor=executor)  # warm up
+                parallel = min(
+                    timeit.repeat(
+                        lambda: cls.list_from_data(data, executor=executor),
+                        number=1,
+                        repeat=REPEAT,
+                    )
+                )
+            print(
+                f"  {executor_class.__name__ + f' x {workers}':28}: "
+                f"{parallel * 1000:9.2f} ms ({serial / parallel:.2f}x)"
+            )
+
+
+def main() -> None:
+    """Compare for `Event`s and `Group`s."""
+    print(f"{os.cpu_count()} CPUs")
+    _scale(
+        f"{EVENTS} events",
+        Event,
+        list(iter_events_data(group_data(), events=EVENTS)),
+    )
+    _scale(
+        f"{GROUPS} groups of {MEMBERS} members",
+        Group,
+        list(iter_groups_data(groups=GROUPS, members=MEMBERS)),
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""Benchmark memory use and membership lookups with `ProfileRegistry`.
+
+Uses groups whose members are drawn from a smaller number of people, e.g.:
+
+    uv run python -m benchmarks.profile_registry
+"""
+
+from __future__ import annotations
+
+import gc
+import timeit
+import tracemalloc
+
+from spond_classes import Group, ProfileRegistry
+from spond_classes.synthetic import iter_groups_data
+
+GROUPS = 100
+MEMBERS = 200
+PEOPLE = 2_000
+LOOKUPS = 100
+
+
+def main() -> None:
+    """Measure memory of `Group`s before and after adding them to a registry, then
+    time finding all memberships of some people.
+    """
+    data = list(iter_groups_data(groups=GROUPS, members=MEMBERS, people=PEOPLE))
+    tracemalloc.start()
+    groups = Group.list_from_data(data)
+    before, _ = tracemalloc.get_traced_memory()
+    registry = ProfileRegistry()
+    for group in groups:
+        registry.add_group(group)
+    gc.collect()
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f"{GROUPS} groups of {MEMBERS} members, from {PEOPLE} people:")
+    print(f"  memory without registry: {before / 1e6:8.2f} MB")
+    print(f"  memory with registry:    {after / 1e6:8.2f} MB (incl. registry)")
+
+    uids = [profile.uid for profile in registry][:LOOKUPS]
+
+    def scan() -> None:
+        for uid in uids:
+            [
+                (group, member)
+                for group in groups
+                for member in group.members
+                if member.profile is not None and member.profile.uid == uid
+            ]
+
+    def indexed() -> None:
+        for uid in uids:
+            registry.memberships(uid)
+
+    print(f"  memberships of {LOOKUPS} people:")
+    for label, func in (("scan", scan), ("memberships()", indexed)):
+        duration = min(timeit.repeat(func, number=1, repeat=3))
+        print(f"    {label:14} {duration * 1000:9.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
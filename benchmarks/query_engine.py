@@ -0,0 +1,79 @@
+"""Benchmark `QueryEngine` against nested loops, for an organisation-wide query.
+
+Finds members in a subgroup of a group who declined at least 3 events in a month,
+e.g.:
+
+    uv run python -m benchmarks.query_engine
+"""
+
+from __future__ import annotations
+
+import timeit
+from datetime import datetime, timezone
+
+from spond_classes import Event, Group, QueryEngine
+from spond_classes.query import in_group, in_subgroup, responded
+from spond_classes.synthetic import iter_events_data, iter_groups_data
+
+GROUPS = 50
+MEMBERS = 200
+EVENTS_PER_GROUP = 200
+START = datetime(2024, 3, 1, tzinfo=timezone.utc)
+END = datetime(2024, 4, 1, tzinfo=timezone.utc)
+AT_LEAST = 3
+REPEAT = 5
+
+
+def main() -> None:
+    """Time the query each way, and building the engine."""
+    groups_data = list(iter_groups_data(groups=GROUPS, members=MEMBERS))
+    groups = Group.list_from_data(groups_data)
+    events = [
+        event
+        for i, group_data in enumerate(groups_data)
+        for event in Event.list_from_data(
+            iter_events_data(group_data, events=EVENTS_PER_GROUP, seed=i)
+        )
+    ]
+    group = groups[GROUPS // 2]
+    subgroup_uid = group.subgroups[0].uid
+
+    def nested_loops() -> list[str]:
+        result = []
+        for group_ in groups:
+            if group_.uid != group.uid:
+                continue
+            for member in group_.members:
+                if subgroup_uid not in member.subgroup_uids:
+                    continue
+                declined = sum(
+                    START <= event.start_time < END
+                    and member.uid in event.responses.declined_uids
+                    for event in events
+                )
+                if declined >= AT_LEAST:
+                    result.append(member.uid)
+        return result
+
+    build_start = timeit.default_timer()
+    engine = QueryEngine(groups, events)
+    build = timeit.default_timer() - build_start
+    predicate = (
+        in_group(group.uid)
+        & in_subgroup(subgroup_uid)
+        & responded("declined", at_least=AT_LEAST, start=START, end=END)
+    )
+
+    def indexed() -> list[str]:
+        return [member.uid for member in engine.members(predicate)]
+
+    assert indexed() == nested_loops()  # noqa: S101
+    print(f"{GROUPS} groups of {MEMBERS} members, {len(events)} events:")
+    print(f"  build QueryEngine: {build * 1000:9.2f} ms")
+    for label, func in (("nested loops", nested_loops), ("QueryEngine", indexed)):
+        duration = min(timeit.repeat(func, number=1, repeat=REPEAT))
+        print(f"  {label:17}: {duration * 1000:9.3f} ms ({len(func())} members)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""Benchmark `load_snapshot()` against validating construction from source data."""
+
+from __future__ import annotations
+
+import json
+import tempfile
+import timeit
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from spond_classes import Event, Group
+from spond_classes.snapshot import content_hash, load_snapshot, save_snapshot
+from spond_classes.synthetic import group_data, iter_events_data, iter_groups_data
+
+if TYPE_CHECKING:
+    from spond_classes.typing import DictFromJSON
+
+EVENTS = 20_000
+GROUPS = 20
+REPEAT = 5
+
+
+def _compare(
+    label: str, cls: type[Event | Group], items: list[DictFromJSON], path: Path
+) -> None:
+    """Time each way of getting a list of models, best of `REPEAT`."""
+    items_json = json.dumps(items).encode()
+    key = content_hash(items_json)
+    save_snapshot(path, cls.list_from_json(items_json), key=key)
+    validated = min(
+        timeit.repeat(lambda: cls.list_from_json(items_json), number=1, repeat=REPEAT)
+    )
+    snapshot = min(
+        timeit.repeat(
+            lambda: load_snapshot(path, cls, key=content_hash(items_json)),
+            number=1,
+            repeat=REPEAT,
+        )
+    )
+    print(f"{label}:")
+    print(f"  list_from_json:         {validated * 1000:8.2f} ms")
+    print(f"  load_snapshot (+ hash): {snapshot * 1000:8.2f} ms")
+    print(f"  JSON size:     {len(items_json) / 1e6:6.2f} MB")
+    print(f"  snapshot size: {path.stat().st_size / 1e6:6.2f} MB")
+
+
+def main() -> None:
+    """Compare for `Event`s and `Group`s."""
+    with tempfile.TemporaryDirectory() as directory:
+        _compare(
+            f"{EVENTS} events",
+            Event,
+            list(iter_events_data(group_data(), events=EVENTS)),
+            Path(directory) / "events.snapshot",
+        )
+        _compare(
+            f"{GROUPS} groups of 500 members",
+            Group,
+            list(iter_groups_data(groups=GROUPS, members=500)),
+            Path(directory) / "groups.snapshot",
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""Benchmark peak memory of `iter_from_json_file()` against `list_from_json()`, and
+reading a single large item against `json.loads()`.
+"""
+
+from __future__ import annotations
+
+import json
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from spond_classes import Event
+from spond_classes._parsing import _JSONArrayReader
+from spond_classes.synthetic import group_data, iter_events_data
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+EVENTS = 20_000
+MEMBERS = 30_000
+# Reading must stay within this factor of `json.loads()`, i.e. linear in item size
+MAX_SLOWDOWN = 10
+
+
+def _measure(func: Callable[[], object]) -> tuple[float, int]:
+    """Return duration in seconds and peak memory in bytes of calling `func`."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    func()
+    duration = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return duration, peak
+
+
+def main() -> None:
+    """Count accepted responses over all events each way."""
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "events.json"
+        path.write_text(json.dumps(list(iter_events_data(group_data(), events=EVENTS))))
+
+        def eager() -> int:
+            events = Event.list_from_json(path.read_bytes())
+            return sum(len(event.responses.accepted_uids) for event in events)
+
+        def streamed() -> int:
+            with path.open("rb") as file:
+                return sum(
+                    len(event.responses.accepted_uids)
+                    for event in Event.iter_from_json_file(file)
+                )
+
+        print(f"{EVENTS} events from {path.stat().st_size / 1e6:.1f} MB file:")
+        for label, func in (
+            ("list_from_json()", eager),
+            ("iter_from_json_file()", streamed),
+        ):
+            duration, peak = _measure(func)
+            print(f"  {label:22} {duration * 1000:8.2f} ms, peak {peak / 1e6:6.1f} MB")
+
+        path.write_text(json.dumps([group_data(members=MEMBERS)]))
+        json_data = path.read_bytes()
+
+        def loaded() -> object:
+            return json.loads(json_data)
+
+        def read() -> object:
+            with path.open("rb") as file:
+                return list(_JSONArrayReader(file))
+
+        print(f"1 group of {MEMBERS} members, {len(json_data) / 1e6:.1f} MB file:")
+        durations = {}
+        for label, decode in (("json.loads()", loaded), ("_JSONArrayReader", read)):
+            durations[label], peak = _measure(decode)
+            print(
+                f"  {label:22} {durations[label] * 1000:8.2f} ms, "
+                f"peak {peak / 1e6:6.1f} MB"
+            )
+        assert durations["_JSONArrayReader"] < MAX_SLOWDOWN * durations["json.loads()"]  # noqa: S101
+
+
+if __name__ == "__main__":
+    main()
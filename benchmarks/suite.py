@@ -0,0 +1,162 @@
+"""Benchmark suite covering each parsing and query entry point.
+
+Reports throughput, latency percentiles and peak memory for each case, e.g.:
+
+    uv run python -m benchmarks.suite --members 1000 --events 5000
+
+Use `--help` for options.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import time
+import tracemalloc
+from pathlib import Path
+from typing import TYPE_CHECKING, NamedTuple
+
+from spond_classes import Event, Group, Profile
+from spond_classes.synthetic import iter_events_data, iter_groups_data, profile_data
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+class Result(NamedTuple):
+    """Measurements for a benchmark case."""
+
+    name: str
+    ops_per_sec: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    peak_memory_mb: float
+
+
+def _measure(name: str, func: Callable[[], object], repeat: int) -> Result:
+    """Call `func` `repeat` times to measure latency, then once for peak memory."""
+    func()  # warm up, e.g. build cached adapters and indexes
+    latencies = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        latencies.append(time.perf_counter() - start)
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    percentiles = statistics.quantiles(latencies, n=100, method="inclusive")
+    return Result(
+        name=name,
+        ops_per_sec=len(latencies) / sum(latencies),
+        p50_ms=percentiles[49] * 1000,
+        p95_ms=percentiles[94] * 1000,
+        p99_ms=percentiles[98] * 1000,
+        peak_memory_mb=peak / 1e6,
+    )
+
+
+def _cases(args: argparse.Namespace) -> dict[str, Callable[[], object]]:
+    """Return a function to benchmark for each case, keyed by name."""
+    groups_data = list(
+        iter_groups_data(
+            groups=args.groups,
+            members=args.members,
+            subgroups=args.subgroups,
+            roles=args.roles,
+            seed=args.seed,
+        )
+    )
+    group_data_ = groups_data[0]
+    group = Group.from_dict(group_data_)
+    member_uids = [member.uid for member in group.members]
+    events_data_ = list(
+        iter_events_data(
+            group_data_,
+            events=args.events,
+            responses=args.responses,
+            seed=args.seed,
+        )
+    )
+    event_data = events_data_[0]
+    events = Event.list_from_data(events_data_)
+    events_json = json.dumps(events_data_).encode()
+    trusted_groups_data = [
+        group.model_dump(by_alias=True) for group in Group.list_from_data(groups_data)
+    ]
+    profile_data_ = profile_data(seed=args.seed)
+
+    member_uid = member_uids[len(member_uids) // 2]
+    role = group.roles[0]
+    subgroup = group.subgroups[0]
+    event = events[0]
+    response_uid = event.responses.accepted_uids[0]
+
+    return {
+        # Parsing
+        "Event.from_dict": lambda: Event.from_dict(event_data),
+        "Event.list_from_data": lambda: Event.list_from_data(events_data_),
+        "Event.list_from_json": lambda: Event.list_from_json(events_json),
+        "Group.from_dict": lambda: Group.from_dict(group_data_),
+        "Group.from_dict(lazy_members)": lambda: Group.from_dict(
+            group_data_, lazy_members=True
+        ),
+        "Group.list_from_data": lambda: Group.list_from_data(groups_data),
+        "Group.list_from_data(trusted)": lambda: Group.list_from_data(
+            trusted_groups_data, trusted=True
+        ),
+        "Profile.from_dict": lambda: Profile.from_dict(profile_data_),
+        # Queries
+        "Group.member_by_uid": lambda: group.member_by_uid(member_uid),
+        "Group.role_by_uid": lambda: group.role_by_uid(role.uid),
+        "Group.subgroup_by_uid": lambda: group.subgroup_by_uid(subgroup.uid),
+        "Group.members_by_role": lambda: group.members_by_role(role),
+        "Group.members_by_subgroup": lambda: group.members_by_subgroup(subgroup),
+        "Event.response_status": lambda: event.response_status(response_uid),
+    }
+
+
+def _parse_args() -> argparse.Namespace:
+    """Return command line arguments."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--groups", type=int, default=5)
+    parser.add_argument("--members", type=int, default=500, help="per group")
+    parser.add_argument("--subgroups", type=int, default=20, help="per group")
+    parser.add_argument("--roles", type=int, default=5, help="per group")
+    parser.add_argument("--events", type=int, default=2_000)
+    parser.add_argument("--responses", type=int, default=50, help="per event")
+    parser.add_argument("--repeat", type=int, default=20, help="calls per case")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("-k", "--filter", default="", help="run matching cases only")
+    parser.add_argument("--json", type=Path, help="also write results to JSON file")
+    return parser.parse_args()
+
+
+def main() -> None:
+    """Run the benchmark suite and print results."""
+    args = _parse_args()
+    results = [
+        _measure(name, func, args.repeat)
+        for name, func in _cases(args).items()
+        if args.filter in name
+    ]
+    print(
+        f"{'case':32} {'ops/sec':>12} {'p50 ms':>10} {'p95 ms':>10} "
+        f"{'p99 ms':>10} {'peak MB':>9}"
+    )
+    for result in results:
+        print(
+            f"{result.name:32} {result.ops_per_sec:12.1f} {result.p50_ms:10.3f} "
+            f"{result.p95_ms:10.3f} {result.p99_ms:10.3f} "
+            f"{result.peak_memory_mb:9.2f}"
+        )
+    if args.json:
+        args.json.write_text(
+            json.dumps([result._asdict() for result in results], indent=2)
+        )
+
+
+if __name__ == "__main__":
+    main()
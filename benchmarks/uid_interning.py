@@ -0,0 +1,47 @@
+"""Benchmark memory used by `Event`s, with and without `UidTable` interning."""
+
+from __future__ import annotations
+
+import gc
+import json
+import tracemalloc
+
+from spond_classes import Event, Group, UidTable
+from spond_classes.synthetic import group_data, iter_events_data
+
+MEMBERS = 2_000
+EVENTS = 20_000
+RESPONSES = 50
+
+
+def _retained_memory(intern: bool) -> int:  # noqa: FBT001
+    """Return memory retained by `Event`s parsed via `json.loads()`, in bytes."""
+    data = group_data(members=MEMBERS)
+    group = Group.from_dict(data)
+    json_data = json.dumps(
+        list(iter_events_data(data, events=EVENTS, responses=RESPONSES))
+    )
+    table = UidTable()
+    if intern:
+        table.intern_group(group)
+    gc.collect()
+    tracemalloc.start()
+    events = Event.list_from_data(json.loads(json_data))
+    if intern:
+        for event in events:
+            table.intern_event(event)
+    gc.collect()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return retained
+
+
+def main() -> None:
+    """Measure retained memory each way."""
+    print(f"{EVENTS} events, {RESPONSES} responses each from {MEMBERS} members:")
+    for label, intern in (("not interned", False), ("interned", True)):
+        print(f"  {label:13} {_retained_memory(intern) / 1e6:6.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
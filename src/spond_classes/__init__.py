@@ -16,28 +16,62 @@ These are the classes intended for direct user instantiation:
 - `Event` via `Event.from_dict()` or `Event.list_from_data()`
 - `Group` via `Group.from_dict()` or `Group.list_from_data()`
 - `Profile` via `profile.from_dict()`
+
+Each also has `from_json()` and `list_from_json()` equivalents, which parse raw JSON
+directly, without intermediate `dict`s.
+
+`FrozenEvent`, `FrozenGroup`, `FrozenProfile` are frozen, hashable variants, see the
+`frozen` module.
 """
 
 # Explicitly import classes and functions into the package namespace to define the API.
 
 from __future__ import annotations
 
-from . import typing
+from . import columnar, frozen, parallel, query, snapshot, synthetic, typing
+from .attendance import AttendanceMatrix
+from .changes import CollectionChanges, EventChanges, GroupChanges, ResponseChange
 from .event import Event, Responses
+from .event_collection import EventCollection
+from .event_store import EventStore
+from .frozen import FrozenEvent, FrozenGroup, FrozenProfile
 from .group import FieldDef, Group
+from .interning import UidTable
 from .member import Member
 from .profile_ import Profile
+from .query import QueryEngine
+from .registry import Membership, ProfileRegistry
 from .role import Role
 from .subgroup import Subgroup
 
 __all__ = [
+    "AttendanceMatrix",
+    "CollectionChanges",
     "Event",
+    "EventChanges",
+    "EventCollection",
+    "EventStore",
     "Responses",
     "FieldDef",
+    "FrozenEvent",
+    "FrozenGroup",
+    "FrozenProfile",
     "Group",
+    "GroupChanges",
     "Member",
+    "Membership",
     "Profile",
+    "ProfileRegistry",
+    "QueryEngine",
+    "ResponseChange",
     "Role",
     "Subgroup",
+    "UidTable",
+    "columnar",
+    "frozen",
+    "parallel",
+    "query",
+    "snapshot",
+    "synthetic",
     "typing",
 ]
@@ -0,0 +1,62 @@
+"""Module containing `_CachingModel` base class."""
+
+from __future__ import annotations
+
+import sys
+
+if sys.version_info < (3, 11):
+    from typing_extensions import Self
+
+else:
+    from typing import Self
+
+from functools import cached_property
+from typing import TYPE_CHECKING, ClassVar
+
+from pydantic import BaseModel
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+
+class _CachingModel(BaseModel):
+    """Base class for models with `functools.cached_property` attributes.
+
+    Cached values are stored in the instance `__dict__`, outside the model fields, so
+    they don't affect validation, serialisation or equality.
+
+    Any field assignment invalidates all cached values, so they're rebuilt on next
+    access. In-place mutation of a field (e.g. appending to a `list`) is not detected.
+    """
+
+    _cached_property_names: ClassVar[frozenset[str]] = frozenset()
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: object) -> None:
+        """Collect names of cached properties, including inherited ones."""
+        super().__pydantic_init_subclass__(**kwargs)
+        cls._cached_property_names = frozenset(
+            name
+            for klass in cls.__mro__
+            for name, value in vars(klass).items()
+            if isinstance(value, cached_property)
+        )
+
+    def __setattr__(self, name: str, value: object) -> None:
+        """Set attribute, then invalidate cached values."""
+        super().__setattr__(name, value)
+        self._invalidate_cache()
+
+    def model_copy(
+        self, *, update: Mapping[str, object] | None = None, deep: bool = False
+    ) -> Self:
+        """Return a copy of the model, without stale cached values."""
+        copied = super().model_copy(update=update, deep=deep)
+        if update:
+            copied._invalidate_cache()  # noqa: SLF001
+        return copied
+
+    def _invalidate_cache(self) -> None:
+        """Discard all cached values."""
+        for name in self._cached_property_names:
+            self.__dict__.pop(name, None)
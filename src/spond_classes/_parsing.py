@@ -0,0 +1,538 @@
+"""Module containing helpers to construct and serialise models efficiently."""
+
+from __future__ import annotations
+
+import asyncio
+import codecs
+import hashlib
+import json
+import math
+import os
+import re
+import types
+from collections.abc import Mapping, Sequence
+from datetime import datetime
+from itertools import groupby, islice, repeat
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    Any,
+    NoReturn,
+    TypeAlias,
+    TypeVar,
+    Union,
+    cast,
+    get_args,
+    get_origin,
+    overload,
+)
+
+from pydantic import BaseModel, TypeAdapter, ValidationError
+from pydantic.fields import FieldInfo
+
+from .typing import _ensure_dict
+
+if TYPE_CHECKING:
+    from collections.abc import (
+        AsyncIterable,
+        AsyncIterator,
+        Callable,
+        Iterable,
+        Iterator,
+    )
+    from concurrent.futures import Executor
+
+    from .typing import DictFromJSON
+
+_M = TypeVar("_M", bound=BaseModel)
+
+_JSON_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_READ_SIZE = 64 * 1024
+# Longest JSON token other than a string or number, i.e. '-Infinity'
+_MAX_TOKEN_SIZE = len("-Infinity")
+_THREAD_CHUNK_SIZE = 50
+_WRITE_CHUNK_SIZE = 1000
+
+_list_adapters: dict[type[BaseModel], TypeAdapter[Any]] = {}
+_ConstructPlan: TypeAlias = list[
+    tuple[str, str, "Callable[[Any], Any] | None", FieldInfo]
+]
+_USE_MODEL_CONSTRUCT: _ConstructPlan = []
+_construct_plans: dict[type[BaseModel], _ConstructPlan] = {}
+_datetime_adapter = TypeAdapter(datetime)
+
+
+def _list_adapter(model: type[BaseModel]) -> TypeAdapter[Any]:
+    """Return a `TypeAdapter` for a `list` of `model`, creating it on first use."""
+    adapter = _list_adapters.get(model)
+    if adapter is None:
+        adapter = _list_adapters[model] = TypeAdapter(list[model])  # type: ignore[valid-type]
+    return adapter
+
+
+def _list_from_data(
+    model: type[_M],
+    data: Iterable[DictFromJSON],
+    *,
+    trusted: bool = False,
+    executor: Executor | None = None,
+) -> list[_M]:
+    """Construct a list of `model` instances, validating `data` in a single call.
+
+    If `trusted`, construct without validation instead.
+
+    If `executor` is given, split `data` into chunks, each constructed by a call in
+    `executor`. If any chunk is invalid, `data` is validated again in a single call,
+    to raise the same error as without `executor`.
+
+    Raises
+    ------
+    `TypeError`
+        if an item in `data` is not a `dict`.
+    """
+    items = list(data)
+    for item in items:
+        _ensure_dict(item)
+    if executor is not None and len(items) > 1:
+        try:
+            chunks = executor.map(
+                _chunk_from_data, repeat(model), _split(items), repeat(trusted)
+            )
+            return [instance for chunk in chunks for instance in chunk]
+        except ValidationError:
+            pass
+    if trusted:
+        return [_construct(model, item) for item in items]
+    return cast("list[_M]", _list_adapter(model).validate_python(items))
+
+
+def _chunk_from_data(
+    model: type[_M],
+    items: list[DictFromJSON],
+    trusted: bool,  # noqa: FBT001
+) -> list[_M]:
+    """Construct a list of `model` instances from a chunk of `items`, in a worker.
+
+    Positional arguments only, for `Executor.map()`.
+    """
+    return _list_from_data(model, items, trusted=trusted)
+
+
+def _split(items: list[DictFromJSON]) -> Iterator[list[DictFromJSON]]:
+    """Yield consecutive chunks of `items`, several per CPU, to balance load."""
+    chunk_size = math.ceil(len(items) / (4 * (os.cpu_count() or 1)))
+    for start in range(0, len(items), chunk_size):
+        yield items[start : start + chunk_size]
+
+
+def _construct(model: type[_M], dict_: Mapping[str, Any]) -> _M:
+    """Construct a `model` instance from trusted data, without validation.
+
+    Nested models are constructed recursively. Datetimes may be `datetime`
+    instances, or ISO 8601 strings which are parsed. Other values are used as is.
+
+    Equivalent to `model.model_construct()` with conversion of nested values, but
+    with field handling planned once per model, which is much faster.
+    """
+    plan = _construct_plans.get(model)
+    if plan is None:
+        plan = _construct_plans[model] = _construct_plan(model)
+    if plan is _USE_MODEL_CONSTRUCT:
+        return model.model_construct(**dict_)
+    values = {}
+    fields_set = set()
+    for name, key, convert, field in plan:
+        if key in dict_:
+            value = dict_[key]
+            values[name] = value if convert is None or value is None else convert(value)
+            fields_set.add(name)
+        elif not field.is_required():
+            values[name] = field.get_default(
+                call_default_factory=True, validated_data=values
+            )
+    instance = model.__new__(model)
+    # Set the same instance attributes as `BaseModel.model_construct()`
+    object.__setattr__(instance, "__dict__", values)
+    object.__setattr__(instance, "__pydantic_fields_set__", fields_set)
+    object.__setattr__(instance, "__pydantic_extra__", None)
+    object.__setattr__(instance, "__pydantic_private__", None)
+    return instance
+
+
+def _construct_plan(model: type[BaseModel]) -> _ConstructPlan:
+    """Return field name, data key, conversion function and `FieldInfo` for each
+    field of `model`.
+
+    Models needing further initialisation use `model_construct()` instead.
+    """
+    if (
+        model.__pydantic_post_init__
+        or model.__private_attributes__
+        or model.model_config.get("extra") == "allow"
+    ):
+        return _USE_MODEL_CONSTRUCT
+    return [
+        (name, field.alias or name, _converter(field.annotation), field)
+        for name, field in model.model_fields.items()
+    ]
+
+
+def _converter(annotation: Any) -> Callable[[Any], Any] | None:  # noqa: ANN401
+    """Return a function to convert a trusted value to `annotation`, if needed."""
+    origin = get_origin(annotation)
+    if origin in (Union, types.UnionType):
+        # Optional values are only converted if not `None`, so ignore `None`
+        converters = {_converter(arg) for arg in get_args(annotation)} - {None}
+        return converters.pop() if len(converters) == 1 else None
+    if origin in (list, tuple, Mapping):
+        return _collection_converter(origin, get_args(annotation))
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return lambda value: (
+            value if isinstance(value, annotation) else _construct(annotation, value)
+        )
+    if annotation is datetime:
+        return _to_datetime
+    return None
+
+
+def _collection_converter(
+    origin: type, args: tuple[Any, ...]
+) -> Callable[[Any], Any] | None:
+    """Return a function to convert a trusted `list`, `tuple` or `Mapping` value, if
+    needed.
+
+    Only variable-length `tuple`s, i.e. `tuple[X, ...]`, are supported. `Mapping`s
+    are converted to read-only mappings.
+    """
+    if origin is Mapping:
+        return lambda value: types.MappingProxyType(dict(value))
+    convert_item = _converter(args[0])
+    if convert_item is None:
+        return None if origin is list else tuple
+    if origin is list:
+        return lambda value: [convert_item(item) for item in value]
+    return lambda value: tuple([convert_item(item) for item in value])
+
+
+def _fingerprint(dict_: Mapping[str, Any]) -> bytes:
+    """Return a digest of the content of JSON data `dict_`, independent of key
+    order.
+    """
+    json_data = json.dumps(dict_, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.blake2b(json_data.encode(), digest_size=16).digest()
+
+
+def _list_from_json(model: type[_M], json_data: str | bytes) -> list[_M]:
+    """Construct a list of `model` instances, validating JSON `json_data` directly."""
+    return cast("list[_M]", _list_adapter(model).validate_json(json_data))
+
+
+def _list_to_json(instances: Iterable[BaseModel]) -> bytes:
+    """Serialise `instances` to a JSON array with Spond API keys, in a single call
+    per run of instances of the same class.
+    """
+    runs = _runs(instances)
+    if len(runs) == 1:
+        model, run = runs[0]
+        return _list_adapter(model).dump_json(run, by_alias=True)
+    return b"[" + _json_items(runs) + b"]"
+
+
+def _runs(instances: Iterable[BaseModel]) -> list[tuple[type[BaseModel], list[Any]]]:
+    """Return consecutive runs of `instances` of the same class, with the class.
+
+    Each run is serialised by its own class, so subclasses, e.g. frozen variants,
+    are serialised by their own fields, rather than those of the declared class.
+    """
+    return [(model, list(run)) for model, run in groupby(instances, type)]
+
+
+def _json_items(runs: list[tuple[type[BaseModel], list[Any]]]) -> bytes:
+    """Serialise `runs` to JSON array items with Spond API keys, without brackets."""
+    return b",".join(
+        # Without the run's own brackets
+        _list_adapter(model).dump_json(run, by_alias=True)[1:-1]
+        for model, run in runs
+    )
+
+
+def _write_json_array(instances: Iterable[BaseModel], file: IO[bytes]) -> None:
+    """Write `instances` to `file` as a JSON array with Spond API keys, as for
+    `_list_to_json()`.
+
+    Instances are serialised in chunks, so only one chunk is held in memory as JSON.
+    """
+    iterator = iter(instances)
+    file.write(b"[")
+    separator = b""
+    while chunk := list(islice(iterator, _WRITE_CHUNK_SIZE)):
+        file.write(separator)
+        file.write(_json_items(_runs(chunk)))
+        separator = b","
+    file.write(b"]")
+
+
+def _iter_from_data(model: type[_M], data: Iterable[DictFromJSON]) -> Iterator[_M]:
+    """Yield `model` instances, constructing each only when it's requested.
+
+    Raises
+    ------
+    `TypeError`
+        if an item in `data` is not a `dict`.
+    """
+    for item in data:
+        _ensure_dict(item)
+        yield model(**item)
+
+
+async def _alist_from_data(
+    parse: Callable[[Iterable[DictFromJSON]], list[_M]], data: Iterable[DictFromJSON]
+) -> list[_M]:
+    """Return `parse(data)`, called in a worker thread so the event loop isn't
+    blocked.
+    """
+    return await asyncio.to_thread(_parse_in_chunks, parse, data)
+
+
+async def _aiter_from_data(
+    parse: Callable[[Iterable[DictFromJSON]], list[_M]],
+    data: AsyncIterable[DictFromJSON | Iterable[DictFromJSON]],
+    *,
+    batch_size: int,
+) -> AsyncIterator[_M]:
+    """Yield model instances from `data`, calling `parse` on each batch in a worker
+    thread while the next batch is received.
+
+    Instances are yielded once the following batch has been received, or `data` is
+    exhausted.
+    """
+    pending: list[asyncio.Future[list[_M]]] = []
+    try:
+        async for batch in _batches(data, batch_size):
+            pending.append(asyncio.ensure_future(_alist_from_data(parse, batch)))
+            if len(pending) > 1:
+                for instance in await pending.pop(0):
+                    yield instance
+        while pending:
+            for instance in await pending.pop(0):
+                yield instance
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+async def _batches(
+    data: AsyncIterable[DictFromJSON | Iterable[DictFromJSON]], batch_size: int
+) -> AsyncIterator[Iterable[DictFromJSON]]:
+    """Yield batches of `data`, whose items are `dict`s, collected into batches of up
+    to `batch_size`, or pages of `dict`s, each yielded as a batch.
+    """
+    batch: list[DictFromJSON] = []
+    async for item in data:
+        if isinstance(item, dict):
+            batch.append(item)
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+        else:
+            if batch:
+                yield batch
+                batch = []
+            yield item
+    if batch:
+        yield batch
+
+
+def _parse_in_chunks(
+    parse: Callable[[Iterable[DictFromJSON]], list[_M]], data: Iterable[DictFromJSON]
+) -> list[_M]:
+    """Return `parse(data)`, calling it on chunks of `data`.
+
+    Validation holds the GIL for a whole call, so in a worker thread, other threads
+    such as the event loop's only run between chunks. If any chunk is invalid,
+    `data` is parsed again in a single call, to raise the same error as
+    `parse(data)`.
+    """
+    items = list(data)
+    try:
+        return [
+            instance
+            for start in range(0, len(items), _THREAD_CHUNK_SIZE)
+            for instance in parse(items[start : start + _THREAD_CHUNK_SIZE])
+        ]
+    except ValidationError:
+        return parse(items)
+
+
+def _iter_from_json_file(model: type[_M], file: IO[str] | IO[bytes]) -> Iterator[_M]:
+    """Yield `model` instances from a JSON array, reading `file` incrementally.
+
+    Raises
+    ------
+    `json.JSONDecodeError`
+        if the content of `file` is not a JSON array.
+    `TypeError`
+        if an item in the array is not an object.
+    """
+    return _iter_from_data(model, _JSONArrayReader(file))
+
+
+class _JSONArrayReader:
+    """Incremental reader of a JSON array from a text or binary file object.
+
+    Only the current item and a read buffer are held in memory, regardless of the
+    size of the array.
+    """
+
+    def __init__(self, file: IO[str] | IO[bytes]) -> None:
+        self._file = file
+        self._decoder = json.JSONDecoder()
+        self._text_decoder = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+
+    def __iter__(self) -> Iterator[Any]:
+        """Yield each item of the array."""
+        self._expect("[")
+        if self._peek() == "]":
+            self._pos += 1
+        else:
+            while True:
+                yield self._decode_item()
+                if self._peek() == "]":
+                    self._pos += 1
+                    break
+                self._expect(",")
+        if self._peek() != "":
+            self._fail("Extra data")
+
+    def _read(self, size: int = _READ_SIZE) -> bool:
+        """Append up to `size` more of the file to the buffer; return whether there
+        was any.
+        """
+        chunk = self._file.read(size)
+        if isinstance(chunk, bytes):
+            chunk = self._text_decoder.decode(chunk, final=not chunk)
+        if not chunk:
+            self._eof = True
+            return False
+        self._buffer = self._buffer[self._pos :] + chunk
+        self._pos = 0
+        return True
+
+    def _peek(self) -> str:
+        """Skip whitespace, then return the next character, or '' at end of file."""
+        while True:
+            match = _JSON_WHITESPACE.match(self._buffer, self._pos)
+            self._pos = match.end() if match else self._pos
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._read():
+                return ""
+
+    def _expect(self, char: str) -> None:
+        """Consume `char` as the next non-whitespace character."""
+        if self._peek() != char:
+            self._fail(f"Expecting '{char}'")
+        self._pos += 1
+
+    def _decode_item(self) -> Any:  # noqa: ANN401
+        """Decode the next complete item, reading more of the file as needed.
+
+        While the item is incomplete, each read is double the size of the last, so
+        an item larger than the buffer is decoded a number of times logarithmic in
+        its size, rather than linear. An error before the end of the buffer is
+        raised without reading the rest of the file.
+        """
+        self._peek()
+        read_size = _READ_SIZE
+        while True:
+            try:
+                item, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError as e:
+                # Only an error in a string or token running to the end of the
+                # buffer may be due to truncation, e.g. at 'tr' of 'true'
+                if (
+                    not e.msg.startswith("Unterminated string")
+                    and e.pos < len(self._buffer) - _MAX_TOKEN_SIZE
+                ) or not self._read(read_size):
+                    raise
+                read_size *= 2
+                continue
+            # Only a number ending at the end of the buffer may be truncated
+            if (
+                end < len(self._buffer)
+                or not isinstance(item, int | float)
+                or isinstance(item, bool)
+                or not self._read(read_size)
+            ):
+                self._pos = end
+                return item
+
+    def _fail(self, msg: str) -> NoReturn:
+        """Raise `json.JSONDecodeError` at the current position."""
+        raise json.JSONDecodeError(msg, self._buffer, self._pos)
+
+
+def _to_datetime(value: datetime | str) -> datetime:
+    """Return `value` as a `datetime`, parsing it if it's an ISO 8601 string."""
+    if isinstance(value, datetime):
+        return value
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:  # e.g. 'Z' suffix before Python 3.11
+        return _datetime_adapter.validate_python(value)
+
+
+class _LazyModelList(Sequence[_M]):
+    """Read-only sequence of models, each constructed from its data on first access.
+
+    Validation errors are raised on access, rather than on creation.
+    """
+
+    def __init__(
+        self, model: type[_M], data: Iterable[DictFromJSON], *, trusted: bool = False
+    ) -> None:
+        self._model = model
+        self._trusted = trusted
+        self._data: list[DictFromJSON | None] = list(data)
+        self._items: list[_M | None] = [None] * len(self._data)
+
+    def __len__(self) -> int:
+        """Return the number of items."""
+        return len(self._items)
+
+    @overload
+    def __getitem__(self, index: int) -> _M: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[_M]: ...
+
+    def __getitem__(self, index: int | slice) -> _M | list[_M]:
+        """Return item(s), constructing them if this is their first access."""
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        item = self._items[index]
+        if item is None:
+            data = cast("DictFromJSON", self._data[index])
+            item = (
+                _construct(self._model, data)
+                if self._trusted
+                else self._model.model_validate(data)
+            )
+            self._items[index] = item
+            self._data[index] = None  # No longer needed
+        return item
+
+    def __eq__(self, other: object) -> bool:
+        """Return whether items are equal to those of another sequence."""
+        if isinstance(other, Sequence) and not isinstance(other, str):
+            return list(self) == list(other)
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        """Return representation of all items, constructing them."""
+        return repr(list(self))
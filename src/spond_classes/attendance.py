@@ -0,0 +1,168 @@
+"""Module containing `AttendanceMatrix` class."""
+
+from __future__ import annotations
+
+from types import MappingProxyType
+from typing import TYPE_CHECKING, get_args
+
+from .typing import ResponseStatus
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Mapping
+
+    from .event import Event
+    from .group import Group
+
+NO_RESPONSE = 0
+"""Code for a `Member` with no response to an `Event`, e.g. not invited."""
+
+STATUS_CODES: Mapping[ResponseStatus, int] = MappingProxyType(
+    {status: code for code, status in enumerate(get_args(ResponseStatus), start=1)}
+)
+"""Code for each `ResponseStatus`."""
+
+
+class AttendanceMatrix:
+    """Responses of each `Member` of a `Group` to each of a collection of `Event`s.
+
+    Stored as a compact row-major matrix of small integer codes, one row per `Member`
+    and one column per `Event`. See `STATUS_CODES` and `NO_RESPONSE`.
+
+    Aggregate methods count codes in whole rows or columns at once, rather than per
+    response.
+    """
+
+    def __init__(self, group: Group, events: Iterable[Event]) -> None:
+        """Construct from the responses of `group`'s `Member`s to `events`.
+
+        Responses from uids which aren't `Member`s of `group` are ignored. If uids of
+        `Member`s or `events` aren't unique, only the first with a given uid is
+        included, as results are keyed by uid.
+        """
+        row_by_uid: dict[str, int] = {}
+        for member in group.members:
+            row_by_uid.setdefault(member.uid, len(row_by_uid))
+        event_by_uid: dict[str, Event] = {}
+        for event in events:
+            event_by_uid.setdefault(event.uid, event)
+        events = list(event_by_uid.values())
+        self.member_uids: tuple[str, ...] = tuple(row_by_uid)
+        """Uid of the `Member` for each row."""
+        self.event_uids: tuple[str, ...] = tuple(event_by_uid)
+        """Uid of the `Event` for each column."""
+
+        columns = len(events)
+        self._codes = bytearray(len(row_by_uid) * columns)
+        # Reversed, so if a uid is in more than one list, the first status is stored
+        statuses = list(STATUS_CODES.items())[::-1]
+        for column, event in enumerate(events):
+            for status, code in statuses:
+                for uid in getattr(event.responses, f"{status}_uids"):
+                    row = row_by_uid.get(uid)
+                    if row is not None:
+                        self._codes[row * columns + column] = code
+        self._row_by_uid = row_by_uid
+        self._column_by_uid = {uid: i for i, uid in enumerate(self.event_uids)}
+
+    def __str__(self) -> str:
+        """Return simple human-readable description."""
+        rows, columns = self.shape
+        return f"{self.__class__.__name__}({rows} members x {columns} events)"
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        """Return the number of rows (`Member`s) and columns (`Event`s)."""
+        return len(self.member_uids), len(self.event_uids)
+
+    @property
+    def codes(self) -> memoryview:
+        """Return a read-only view of the codes, as unsigned bytes in row-major order.
+
+        Supports the buffer protocol, e.g. for NumPy:
+        `numpy.frombuffer(matrix.codes, dtype=numpy.uint8).reshape(matrix.shape)`.
+        """
+        return memoryview(self._codes).toreadonly()
+
+    def status(self, member_uid: str, event_uid: str) -> ResponseStatus | None:
+        """Return the `ResponseStatus` of a `Member` for an `Event`.
+
+        Parameters
+        ----------
+        member_uid
+        event_uid
+
+        Returns
+        -------
+        `ResponseStatus`, or `None` if the `Member` has no response.
+
+        Raises
+        ------
+        LookupError
+            If `member_uid` or `event_uid` is not found.
+        """
+        try:
+            row = self._row_by_uid[member_uid]
+            column = self._column_by_uid[event_uid]
+        except KeyError as e:
+            err_msg = f"No Member or Event found with id='{e.args[0]}'."
+            raise LookupError(err_msg) from None
+        code = self._codes[row * len(self.event_uids) + column]
+        return None if code == NO_RESPONSE else get_args(ResponseStatus)[code - 1]
+
+    def member_counts(self, status: ResponseStatus) -> dict[str, int]:
+        """Return the number of `Event`s with `status`, for each `Member` uid."""
+        code = STATUS_CODES[status]
+        return {
+            uid: row.count(code)
+            for uid, row in zip(self.member_uids, self._rows(), strict=True)
+        }
+
+    def event_counts(self, status: ResponseStatus) -> dict[str, int]:
+        """Return the number of `Member`s with `status`, for each `Event` uid."""
+        code = STATUS_CODES[status]
+        return {
+            uid: column.count(code)
+            for uid, column in zip(self.event_uids, self._columns(), strict=True)
+        }
+
+    def member_attendance_rates(self) -> dict[str, float]:
+        """Return the proportion of responses which are 'accepted', for each `Member`
+        uid.
+
+        A `Member` with no responses has rate 0.0.
+        """
+        return {
+            uid: _attendance_rate(row)
+            for uid, row in zip(self.member_uids, self._rows(), strict=True)
+        }
+
+    def event_attendance_rates(self) -> dict[str, float]:
+        """Return the proportion of responses which are 'accepted', for each `Event`
+        uid.
+
+        An `Event` with no responses from `Member`s has rate 0.0.
+        """
+        return {
+            uid: _attendance_rate(column)
+            for uid, column in zip(self.event_uids, self._columns(), strict=True)
+        }
+
+    def _rows(self) -> Iterator[bytearray]:
+        """Yield the codes of each row."""
+        columns = len(self.event_uids)
+        for row in range(len(self.member_uids)):
+            yield self._codes[row * columns : (row + 1) * columns]
+
+    def _columns(self) -> Iterator[bytearray]:
+        """Yield the codes of each column."""
+        columns = len(self.event_uids)
+        for column in range(columns):
+            yield self._codes[column::columns]
+
+
+def _attendance_rate(codes: bytearray) -> float:
+    """Return the proportion of responses in `codes` which are 'accepted'."""
+    responses = len(codes) - codes.count(NO_RESPONSE)
+    if not responses:
+        return 0.0
+    return codes.count(STATUS_CODES["accepted"]) / responses
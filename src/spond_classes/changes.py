@@ -0,0 +1,72 @@
+"""Module containing classes describing changes made by incremental updates."""
+
+from __future__ import annotations
+
+from pydantic import BaseModel, Field
+
+from .typing import ResponseStatus
+
+
+class CollectionChanges(BaseModel):
+    """Changes to a collection of items with uids, e.g. `Group.members`."""
+
+    added: list[str] = Field(default_factory=list)
+    """Uids of items which were added."""
+    removed: list[str] = Field(default_factory=list)
+    """Uids of items which were removed."""
+    modified: list[str] = Field(default_factory=list)
+    """Uids of items whose content changed."""
+
+    def __bool__(self) -> bool:
+        """Return whether there are any changes."""
+        return bool(self.added or self.removed or self.modified)
+
+
+class GroupChanges(BaseModel):
+    """Changes made to a `Group` by `Group.update_from_dict()`."""
+
+    fields: list[str] = Field(default_factory=list)
+    """Names of other fields which changed, e.g. 'name'."""
+    members: CollectionChanges = Field(default_factory=CollectionChanges)
+    """Changes to `Group.members`."""
+    roles: CollectionChanges = Field(default_factory=CollectionChanges)
+    """Changes to `Group.roles`."""
+    subgroups: CollectionChanges = Field(default_factory=CollectionChanges)
+    """Changes to `Group.subgroups`."""
+    field_defs: CollectionChanges = Field(default_factory=CollectionChanges)
+    """Changes to `Group.field_defs`."""
+
+    def __bool__(self) -> bool:
+        """Return whether there are any changes."""
+        return bool(
+            self.fields
+            or self.members
+            or self.roles
+            or self.subgroups
+            or self.field_defs
+        )
+
+
+class ResponseChange(BaseModel):
+    """Change to the response of a member to an `Event`."""
+
+    uid: str
+    """Uid of the member."""
+    before: ResponseStatus | None
+    """`ResponseStatus` before the change, or `None` if there was no response."""
+    after: ResponseStatus | None
+    """`ResponseStatus` after the change, or `None` if there is no longer a
+    response."""
+
+
+class EventChanges(BaseModel):
+    """Changes made to an `Event` by `Event.update_from_dict()`."""
+
+    fields: list[str] = Field(default_factory=list)
+    """Names of fields other than `responses` which changed, e.g. 'heading'."""
+    responses: list[ResponseChange] = Field(default_factory=list)
+    """Changes to `Event.responses`."""
+
+    def __bool__(self) -> bool:
+        """Return whether there are any changes."""
+        return bool(self.fields or self.responses)
@@ -0,0 +1,169 @@
+"""Module containing helpers to export models to columns, e.g. for DataFrames.
+
+Columns are built in a single pass over each attribute, rather than by dumping
+each model to a `dict`.
+
+`Event.list_to_columns()`, `Event.list_responses_to_columns()`,
+`Group.members_to_columns()`, `Group.list_members_to_columns()` return a `dict` of
+column name to `list` of values, which can be passed directly to e.g.
+`pandas.DataFrame()` or `polars.DataFrame()`.
+
+`to_record_batch()` converts them to a `pyarrow.RecordBatch`, if `pyarrow` is
+installed.
+"""
+
+from __future__ import annotations
+
+import importlib
+from itertools import repeat
+from operator import attrgetter
+from typing import TYPE_CHECKING, Any, get_args
+
+from .typing import ResponseStatus
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Mapping
+    from types import ModuleType
+
+    from .event import Event
+    from .group import Group
+
+_EVENT_COLUMNS = (
+    "uid",
+    "heading",
+    "type",
+    "created_time",
+    "start_time",
+    "end_time",
+    "invite_time",
+    "cancelled",
+    "hidden",
+)
+_MEMBER_COLUMNS = (
+    "uid",
+    "created_time",
+    "first_name",
+    "last_name",
+    "respondent",
+    "email",
+    "phone_number",
+    "subgroup_uids",
+    "role_uids",
+)
+# Each `ResponseStatus`, and the name of the `Responses` field of its uids
+_RESPONSE_FIELDS = tuple(
+    (status, f"{status}_uids") for status in get_args(ResponseStatus)
+)
+# Function returning the Arrow type of each column exported by this package
+_ARROW_TYPES: Mapping[str, Callable[[ModuleType], Any]] = {
+    "uid": lambda pa: pa.string(),
+    "heading": lambda pa: pa.string(),
+    "type": lambda pa: pa.string(),
+    "created_time": lambda pa: pa.timestamp("us", tz="UTC"),
+    "start_time": lambda pa: pa.timestamp("us", tz="UTC"),
+    "end_time": lambda pa: pa.timestamp("us", tz="UTC"),
+    "invite_time": lambda pa: pa.timestamp("us", tz="UTC"),
+    "cancelled": lambda pa: pa.bool_(),
+    "hidden": lambda pa: pa.bool_(),
+    "group_uid": lambda pa: pa.string(),
+    "first_name": lambda pa: pa.string(),
+    "last_name": lambda pa: pa.string(),
+    "respondent": lambda pa: pa.bool_(),
+    "email": lambda pa: pa.string(),
+    "phone_number": lambda pa: pa.string(),
+    "profile_uid": lambda pa: pa.string(),
+    "subgroup_uids": lambda pa: pa.list_(pa.string()),
+    "role_uids": lambda pa: pa.list_(pa.string()),
+    "event_uid": lambda pa: pa.string(),
+    "member_uid": lambda pa: pa.string(),
+    "status": lambda pa: pa.string(),
+}
+
+
+def to_record_batch(columns: Mapping[str, list[Any]]) -> Any:  # noqa: ANN401
+    """Return `columns` as a `pyarrow.RecordBatch`.
+
+    Columns exported by this package have explicit Arrow types, e.g. timestamps in
+    UTC. Types of other columns are inferred.
+
+    Parameters
+    ----------
+    columns
+        e.g. as returned by `Event.list_to_columns()`.
+
+    Returns
+    -------
+    `pyarrow.RecordBatch`
+
+    Raises
+    ------
+    `ImportError`
+        if `pyarrow` is not installed.
+    """
+    pa = _pyarrow()
+    return pa.RecordBatch.from_arrays(
+        [
+            pa.array(values, type=_ARROW_TYPES[name](pa))
+            if name in _ARROW_TYPES
+            else pa.array(values)
+            for name, values in columns.items()
+        ],
+        names=list(columns),
+    )
+
+
+def _pyarrow() -> ModuleType:
+    """Return the `pyarrow` module, which is an optional dependency.
+
+    Raises
+    ------
+    `ImportError`
+        if `pyarrow` is not installed.
+    """
+    try:
+        return importlib.import_module("pyarrow")
+    except ModuleNotFoundError:
+        err_msg = "pyarrow is required for Arrow export: `pip install pyarrow`."
+        raise ImportError(err_msg) from None
+
+
+def _events_to_columns(events: Iterable[Event]) -> dict[str, list[Any]]:
+    """Return a column for each scalar field of `events`, one row per `Event`."""
+    events = list(events)
+    return {name: list(map(attrgetter(name), events)) for name in _EVENT_COLUMNS}
+
+
+def _responses_to_columns(events: Iterable[Event]) -> dict[str, list[Any]]:
+    """Return 'event_uid', 'member_uid', 'status' columns, one row per response."""
+    event_uids: list[str] = []
+    member_uids: list[str] = []
+    statuses: list[ResponseStatus] = []
+    for event in events:
+        responses = event.responses
+        for status, name in _RESPONSE_FIELDS:
+            uids = getattr(responses, name)
+            if uids:
+                event_uids += [event.uid] * len(uids)
+                member_uids += uids
+                statuses += [status] * len(uids)
+    return {"event_uid": event_uids, "member_uid": member_uids, "status": statuses}
+
+
+def _members_to_columns(groups: Iterable[Group]) -> dict[str, list[Any]]:
+    """Return 'group_uid', 'profile_uid' and a column for each scalar or `list`
+    field of `groups`' `Member`s, one row per `Member`.
+    """
+    group_uids: list[str] = []
+    members = []
+    for group in groups:
+        group_members = list(group.members)
+        group_uids.extend(repeat(group.uid, len(group_members)))
+        members.extend(group_members)
+    columns: dict[str, list[Any]] = {"group_uid": group_uids}
+    columns.update(
+        {name: list(map(attrgetter(name), members)) for name in _MEMBER_COLUMNS}
+    )
+    columns["profile_uid"] = [
+        None if member.profile is None else member.profile.uid for member in members
+    ]
+    return columns
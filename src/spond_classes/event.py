@@ -11,20 +11,47 @@ else:
     from typing import Self
 
 from datetime import datetime
-from typing import TYPE_CHECKING, Literal
+from functools import cached_property
+from types import MappingProxyType
+from typing import IO, TYPE_CHECKING, Any, cast, get_args
 
-from pydantic import BaseModel, Field
+from pydantic import Field
 
-from .typing import _ensure_dict
+from ._caching import _CachingModel
+from ._parsing import (
+    _aiter_from_data,
+    _alist_from_data,
+    _iter_from_data,
+    _iter_from_json_file,
+    _list_from_data,
+    _list_from_json,
+    _list_to_json,
+    _write_json_array,
+)
+from .changes import EventChanges, ResponseChange
+from .columnar import _events_to_columns, _responses_to_columns
+from .typing import EventType, ResponseStatus, _ensure_dict
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable
+    import builtins
+    from collections.abc import (
+        AsyncIterable,
+        AsyncIterator,
+        Iterable,
+        Iterator,
+        Mapping,
+    )
+    from concurrent.futures import Executor
 
     from .typing import DictFromJSON
 
 
-class Responses(BaseModel):
-    """Represents the responses to an `Event`."""
+class Responses(_CachingModel):
+    """Represents the responses to an `Event`.
+
+    Lookups by uid use indexes built on first use. Reassigning a field discards
+    them; mutating a list in place does not.
+    """
 
     # Lists which always exist in API data, but may be empty
     accepted_uids: list[str] = Field(alias="acceptedIds")
@@ -43,8 +70,69 @@ class Responses(BaseModel):
     """`unconfirmedIds` in Spond API.
     May be empty."""
 
+    @cached_property
+    def uid_sets(self) -> Mapping[ResponseStatus, frozenset[str]]:
+        """Return the set of uids for each `ResponseStatus`."""
+        return MappingProxyType(
+            {
+                status: frozenset(getattr(self, f"{status}_uids"))
+                for status in get_args(ResponseStatus)
+            }
+        )
+
+    @cached_property
+    def _status_by_uid(self) -> dict[str, ResponseStatus]:
+        """Index of `ResponseStatus` by uid, built on first access.
+
+        If a uid is in more than one list, the first `ResponseStatus` is indexed.
+        """
+        index: dict[str, ResponseStatus] = {}
+        for status in get_args(ResponseStatus):
+            for uid in getattr(self, f"{status}_uids"):
+                index.setdefault(uid, status)
+        return index
+
+    def diff(self, other: Responses) -> list[ResponseChange]:
+        """Return the changes from these responses to `other`.
+
+        Parameters
+        ----------
+        other
+            newer `Responses`.
+
+        Returns
+        -------
+        `list[ResponseChange]`, one per uid whose `ResponseStatus` differs, in the
+        order of `other`'s lists, then of uids with no response in `other`.
+        """
+        before, after = self._status_by_uid, other._status_by_uid
+        changes = [
+            ResponseChange(uid=uid, before=before.get(uid), after=status)
+            for uid, status in after.items()
+            if before.get(uid) != status
+        ]
+        changes.extend(
+            ResponseChange(uid=uid, before=status, after=None)
+            for uid, status in before.items()
+            if uid not in after
+        )
+        return changes
+
+    def status_of(self, uid: str) -> ResponseStatus | None:
+        """Return the `ResponseStatus` of the member with matching `uid`.
+
+        Parameters
+        ----------
+        uid
+
+        Returns
+        -------
+        `ResponseStatus`, or `None` if `uid` is not found.
+        """
+        return self._status_by_uid.get(uid)
+
 
-class Event(BaseModel):
+class Event(_CachingModel):
     """Represents an event in the Spond system."""
 
     uid: str = Field(alias="id")
@@ -54,7 +142,7 @@ class Event(BaseModel):
     """Same name in Spond API."""
     responses: Responses
     """Same name in Spond API."""
-    type: Literal["AVAILABILITY", "EVENT", "RECURRING"]
+    type: EventType
     """Same name in Spond API.
 
     'AVAILABILITY': availability request.
@@ -100,21 +188,157 @@ class Event(BaseModel):
     @property
     def is_cancelled(self) -> bool:
         """Return whether the `Event` is cancelled."""
-        return getattr(self, "cancelled", False)
+        return bool(self.cancelled)
 
     @property
     def is_hidden(self) -> bool:
         """Return whether the `Event` is hidden."""
-        return getattr(self, "hidden", False)
+        return bool(self.hidden)
+
+    @cached_property
+    def _update_source(self) -> DictFromJSON | None:
+        """Copy of the data the `Event` was last updated from. Recorded by
+        `update_from_dict()`.
+        """
+        return None
+
+    def update_from_dict(self, dict_: DictFromJSON) -> EventChanges:
+        """Update the `Event` in place from newer data, and return the changes.
+
+        Data is compared with that of the last update. If it's unchanged, nothing is
+        validated; if only `responses` changed, only `responses` is validated. Before
+        the first update, or after a field is reassigned, the whole `Event` is
+        validated and compared instead.
+
+        Parameters
+        ----------
+        dict_
+            as returned by `spond.spond.Spond.get_event()`
+            or from the list returned by `spond.spond.Spond.get_events()`.
+
+        Returns
+        -------
+        `EventChanges`
+
+        Raises
+        ------
+        `TypeError`
+            if `dict_` is not a `dict`.
+        `ValueError`
+            if `dict_` is for a different `Event`.
+        `pydantic.ValidationError`
+            if `dict_` is not valid. The `Event` is then unchanged.
+        """
+        _ensure_dict(dict_)
+        previous = self._update_source
+        if previous is not None and dict_ == previous:
+            return EventChanges()
+        if (
+            previous is not None
+            and "responses" in dict_
+            and {**dict_, "responses": None} == {**previous, "responses": None}
+        ):
+            changes = EventChanges(
+                responses=self._update_responses(
+                    self._responses_model().model_validate(dict_["responses"])
+                )
+            )
+        else:
+            updated = self.model_validate(dict_)
+            if updated.uid != self.uid:
+                err_msg = (
+                    f"Can't update Event with id='{self.uid}' "
+                    f"from data with id='{updated.uid}'."
+                )
+                raise ValueError(err_msg)
+            changes = EventChanges(
+                fields=[
+                    name
+                    for name in type(self).model_fields
+                    if name != "responses"
+                    and getattr(updated, name) != getattr(self, name)
+                ]
+            )
+            for name in changes.fields:
+                setattr(self, name, getattr(updated, name))
+            changes.responses = self._update_responses(updated.responses)
+        # After reassignment, which discards cached values. Values other than
+        # `responses` are scalars, so needn't be copied.
+        self.__dict__["_update_source"] = {
+            **dict_,
+            "responses": _copy_responses(dict_["responses"]),
+        }
+        return changes
+
+    def update_responses(self, responses: DictFromJSON) -> list[ResponseChange]:
+        """Update `responses` in place from newer data, and return the changes.
+
+        Parameters
+        ----------
+        responses
+            `responses` from the `dict` returned by `spond.spond.Spond.get_event()`.
+
+        Returns
+        -------
+        `list[ResponseChange]`, see `Responses.diff()`.
+
+        Raises
+        ------
+        `pydantic.ValidationError`
+            if `responses` is not valid. The `Event` is then unchanged.
+        """
+        return self._update_responses(self._responses_model().model_validate(responses))
+
+    @classmethod
+    def _responses_model(cls) -> builtins.type[Responses]:
+        """Return the model of the `responses` field, e.g. `FrozenResponses` for a
+        frozen variant.
+        """
+        # `builtins.type`, as `type` is a field
+        return cast(
+            "builtins.type[Responses]", cls.model_fields["responses"].annotation
+        )
+
+    def _update_responses(self, responses: Responses) -> list[ResponseChange]:
+        """Replace `responses`, if changed, and return the changes."""
+        changes = self.responses.diff(responses)
+        if responses != self.responses:
+            self.responses = responses
+        return changes
+
+    def response_status(self, uid: str) -> ResponseStatus | None:
+        """Return the `ResponseStatus` of the member with matching `uid`.
+
+        Parameters
+        ----------
+        uid
+
+        Returns
+        -------
+        `ResponseStatus`, or `None` if `uid` is not found.
+        """
+        return self.responses.status_of(uid)
 
     @classmethod
-    def list_from_data(cls, data: Iterable[DictFromJSON]) -> list[Self]:
+    def list_from_data(
+        cls,
+        data: Iterable[DictFromJSON],
+        *,
+        executor: Executor | None = None,
+    ) -> list[Self]:
         """Construct a list of `Event`s from the list returned by `Spond.get_events()`.
 
         Parameters
         ----------
         data
             as returned by `spond.spond.Spond.get_events()`.
+        executor
+            if given, construct in parallel, by splitting `data` into chunks, each
+            constructed by a call in `executor`, e.g. from
+            `parallel.default_executor()`. Order and errors are the same as without
+            `executor`. This is only faster for large `data`, and with a
+            `ProcessPoolExecutor`, only if constructing outweighs the cost of
+            transferring data to and from processes.
 
         Returns
         -------
@@ -125,7 +349,112 @@ class Event(BaseModel):
         `TypeError`
             if an item in `data` is not a `dict`.
         """
-        return [cls.from_dict(item) for item in data]
+        return _list_from_data(cls, data, executor=executor)
+
+    @classmethod
+    def iter_from_data(cls, data: Iterable[DictFromJSON]) -> Iterator[Self]:
+        """Yield `Event`s from the list returned by `Spond.get_events()`.
+
+        Each `Event` is constructed only when it's requested, so memory use doesn't
+        grow with the size of `data`.
+
+        Parameters
+        ----------
+        data
+            as returned by `spond.spond.Spond.get_events()`, or any iterable of such
+            `dict`s.
+
+        Yields
+        ------
+        `Event`
+
+        Raises
+        ------
+        `TypeError`
+            if an item in `data` is not a `dict`.
+        """
+        return _iter_from_data(cls, data)
+
+    @classmethod
+    def iter_from_json_file(cls, file: IO[str] | IO[bytes]) -> Iterator[Self]:
+        """Yield `Event`s from a JSON file, reading it incrementally.
+
+        Memory use doesn't grow with the size of the file.
+
+        Parameters
+        ----------
+        file
+            text or binary (UTF-8) file object containing a JSON array, serialised
+            from `spond.spond.Spond.get_events()`.
+
+        Yields
+        ------
+        `Event`
+
+        Raises
+        ------
+        `json.JSONDecodeError`
+            if the content of `file` is not a JSON array.
+        `TypeError`
+            if an item in the array is not an object.
+        """
+        return _iter_from_json_file(cls, file)
+
+    @classmethod
+    async def alist_from_data(cls, data: Iterable[DictFromJSON]) -> list[Self]:
+        """Construct a list of `Event`s in a worker thread, without blocking the
+        event loop.
+
+        Parameters
+        ----------
+        data
+            as returned by `spond.spond.Spond.get_events()`.
+
+        Returns
+        -------
+        `list[Event]`
+
+        Raises
+        ------
+        `TypeError`
+            if an item in `data` is not a `dict`.
+        """
+        return await _alist_from_data(cls.list_from_data, data)
+
+    @classmethod
+    def aiter_from_data(
+        cls,
+        data: AsyncIterable[DictFromJSON | Iterable[DictFromJSON]],
+        *,
+        batch_size: int = 500,
+    ) -> AsyncIterator[Self]:
+        """Yield `Event`s from an async stream of data, e.g. pages as they're fetched.
+
+        Each batch is constructed in a worker thread while the next is received, so
+        fetching and construction overlap, and the event loop isn't blocked. `Event`s
+        from a batch are yielded once the next batch is received, or `data` ends.
+
+        Parameters
+        ----------
+        data
+            async iterable of `dict`s, each an item of the list returned by
+            `spond.spond.Spond.get_events()`, or of pages, i.e. lists of such `dict`s.
+        batch_size
+            maximum number of `dict`s from `data` constructed together. Each page is
+            constructed together, regardless of size.
+
+        Yields
+        ------
+        `Event`, in the order of `data`.
+
+        Raises
+        ------
+        `TypeError`
+            if an item in `data` is not a `dict`, or a page of them.
+        `pydantic.ValidationError`
+            if an item is not valid. Indexes in the error are relative to its batch.
+        """
+        return _aiter_from_data(cls.list_from_data, data, batch_size=batch_size)
 
     @classmethod
     def from_dict(cls, dict_: DictFromJSON) -> Self:
@@ -148,3 +477,118 @@ class Event(BaseModel):
         """
         _ensure_dict(dict_)
         return cls(**dict_)
+
+    @classmethod
+    def list_to_columns(cls, events: Iterable[Event]) -> dict[str, list[Any]]:
+        """Return the fields of `events` other than `responses` as columns.
+
+        Parameters
+        ----------
+        events
+
+        Returns
+        -------
+        `dict` of field name to `list` of values, one per `Event`, e.g. for
+        `pandas.DataFrame()`, or `columnar.to_record_batch()`.
+        """
+        return _events_to_columns(events)
+
+    @classmethod
+    def list_responses_to_columns(cls, events: Iterable[Event]) -> dict[str, list[Any]]:
+        """Return the responses to `events` as a long table of columns.
+
+        Parameters
+        ----------
+        events
+
+        Returns
+        -------
+        `dict` of 'event_uid', 'member_uid', 'status' to `list` of values, one per
+        response, e.g. for `pandas.DataFrame()`, or `columnar.to_record_batch()`.
+        """
+        return _responses_to_columns(events)
+
+    @classmethod
+    def list_from_json(cls, json_data: str | bytes) -> list[Self]:
+        """Construct a list of `Event`s from JSON, without an intermediate `list`.
+
+        Parameters
+        ----------
+        json_data
+            JSON array, serialised from `spond.spond.Spond.get_events()`.
+
+        Returns
+        -------
+        `list[Event]`
+
+        Raises
+        ------
+        `pydantic.ValidationError`
+            if `json_data` is not valid JSON, or not a valid array of `Event`s.
+        """
+        return _list_from_json(cls, json_data)
+
+    @classmethod
+    def list_to_json(cls, events: Iterable[Event]) -> bytes:
+        """Serialise `Event`s to JSON, with the same keys as Spond API.
+
+        Round-trips losslessly with `Event.list_from_json()`, or `Event.from_dict()`
+        for each item after `json.loads()`.
+
+        Parameters
+        ----------
+        events
+
+        Returns
+        -------
+        `bytes`
+            UTF-8 JSON array of objects.
+        """
+        return _list_to_json(events)
+
+    @classmethod
+    def list_to_json_file(cls, events: Iterable[Event], file: IO[bytes]) -> None:
+        """Write `Event`s to a file as JSON, with the same keys as Spond API.
+
+        `events` are serialised a chunk at a time, so memory use doesn't grow with
+        their number, e.g. when `events` is a generator. Read back with
+        `Event.iter_from_json_file()`.
+
+        Parameters
+        ----------
+        events
+        file
+            binary file object to write a UTF-8 JSON array of objects to.
+        """
+        _write_json_array(events, file)
+
+    @classmethod
+    def from_json(cls, json_data: str | bytes) -> Self:
+        """Construct an `Event` from JSON, without an intermediate `dict`.
+
+        Parameters
+        ----------
+        json_data
+            JSON object, serialised from `spond.spond.Spond.get_event()`
+            or an item of the list returned by `spond.spond.Spond.get_events()`.
+
+        Returns
+        -------
+        `Event`
+
+        Raises
+        ------
+        `pydantic.ValidationError`
+            if `json_data` is not valid JSON, or not a valid `Event`.
+        """
+        return cls.model_validate_json(json_data)
+
+
+def _copy_responses(responses: object) -> object:
+    """Return a copy of `responses` data, which is unaffected by changes to it."""
+    if not isinstance(responses, dict):
+        return responses
+    return {
+        key: list(value) if isinstance(value, list) else value
+        for key, value in responses.items()
+    }
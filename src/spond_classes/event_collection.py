@@ -0,0 +1,197 @@
+"""Module containing `EventCollection` class."""
+
+from __future__ import annotations
+
+import bisect
+from collections.abc import Sequence
+from datetime import timezone
+from functools import cached_property
+from itertools import accumulate
+from operator import itemgetter
+from typing import TYPE_CHECKING, overload
+
+from .event import Event
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator
+    from datetime import datetime
+
+    from .typing import EventType
+
+
+class EventCollection(Sequence[Event]):
+    """Read-only sequence of `Event`s in start time order, with indexed queries.
+
+    Time range queries use binary search rather than scanning all `Event`s. Filters
+    use indexes built on first use.
+
+    Naive datetimes passed to queries are treated as UTC, as by `EventStore`.
+    """
+
+    def __init__(self, events: Iterable[Event]) -> None:
+        """Construct from `events`, e.g. as returned by `Event.list_from_data()`.
+
+        `Event`s with the same start time keep their order in `events`.
+        """
+        keyed = sorted(
+            ((_utc(event.start_time), event) for event in events),
+            key=itemgetter(0),
+        )
+        self._events: tuple[Event, ...] = tuple(event for _, event in keyed)
+        self._start_times = [start_time for start_time, _ in keyed]
+        self._end_times = [_utc(event.end_time) for event in self._events]
+        # Latest end time of each `Event` and those before it, so non-decreasing
+        self._max_end_times = list(accumulate(self._end_times, max))
+        self._where_cache: dict[
+            tuple[EventType | None, bool | None, bool | None], EventCollection
+        ] = {}
+
+    def __len__(self) -> int:
+        """Return the number of `Event`s."""
+        return len(self._events)
+
+    @overload
+    def __getitem__(self, index: int) -> Event: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[Event]: ...
+
+    def __getitem__(self, index: int | slice) -> Event | list[Event]:
+        """Return `Event`(s) by position in start time order."""
+        if isinstance(index, slice):
+            return list(self._events[index])
+        return self._events[index]
+
+    def __iter__(self) -> Iterator[Event]:
+        """Yield all `Event`s, in start time order."""
+        return iter(self._events)
+
+    def __str__(self) -> str:
+        """Return simple human-readable description."""
+        return f"{self.__class__.__name__}({len(self)} events)"
+
+    def starting_between(self, start: datetime, end: datetime) -> list[Event]:
+        """Return `Event`s which start at or after `start`, and before `end`.
+
+        Parameters
+        ----------
+        start
+        end
+
+        Returns
+        -------
+        `list[Event]`, in start time order.
+        """
+        first = bisect.bisect_left(self._start_times, _utc(start))
+        last = bisect.bisect_left(self._start_times, _utc(end))
+        return list(self._events[first:last])
+
+    def overlapping(self, start: datetime, end: datetime) -> list[Event]:
+        """Return `Event`s which are in progress at any time after `start` and before
+        `end`, i.e. which start before `end` and end after `start`.
+
+        Parameters
+        ----------
+        start
+        end
+
+        Returns
+        -------
+        `list[Event]`, in start time order.
+        """
+        # `Event`s before `first` all end at or before `start`
+        first = bisect.bisect_right(self._max_end_times, _utc(start))
+        last = bisect.bisect_left(self._start_times, _utc(end))
+        start = _utc(start)
+        return [
+            self._events[i] for i in range(first, last) if self._end_times[i] > start
+        ]
+
+    def where(
+        self,
+        *,
+        type: EventType | None = None,  # noqa: A002
+        cancelled: bool | None = None,
+        hidden: bool | None = None,
+    ) -> EventCollection:
+        """Return the `Event`s matching all the given criteria.
+
+        Results are cached, so repeating a query is fast.
+
+        Parameters
+        ----------
+        type
+            if given, only `Event`s of this `Event.type`.
+        cancelled
+            if given, only `Event`s whose `Event.is_cancelled` matches.
+        hidden
+            if given, only `Event`s whose `Event.is_hidden` matches.
+
+        Returns
+        -------
+        `EventCollection`
+        """
+        key = (type, cancelled, hidden)
+        if key in self._where_cache:
+            return self._where_cache[key]
+        candidates = []
+        if type is not None:
+            candidates.append(self._positions_by_type.get(type, frozenset()))
+        if cancelled is not None:
+            candidates.append(self._positions_by_cancelled[cancelled])
+        if hidden is not None:
+            candidates.append(self._positions_by_hidden[hidden])
+        if not candidates:
+            return self
+        candidates.sort(key=len)
+        result = self._where_cache[key] = self._subset(
+            sorted(candidates[0].intersection(*candidates[1:]))
+        )
+        return result
+
+    @cached_property
+    def _positions_by_type(self) -> dict[EventType, frozenset[int]]:
+        """Index of `Event` positions by `Event.type`, built on first access."""
+        positions: dict[EventType, set[int]] = {}
+        for i, event in enumerate(self._events):
+            positions.setdefault(event.type, set()).add(i)
+        return {type_: frozenset(value) for type_, value in positions.items()}
+
+    @cached_property
+    def _positions_by_cancelled(self) -> dict[bool, frozenset[int]]:
+        """Index of `Event` positions by `Event.is_cancelled`, built on first access."""
+        return self._positions_by_flag(lambda event: event.is_cancelled)
+
+    @cached_property
+    def _positions_by_hidden(self) -> dict[bool, frozenset[int]]:
+        """Index of `Event` positions by `Event.is_hidden`, built on first access."""
+        return self._positions_by_flag(lambda event: event.is_hidden)
+
+    def _positions_by_flag(
+        self, flag: Callable[[Event], bool]
+    ) -> dict[bool, frozenset[int]]:
+        """Return positions of `Event`s for which `flag` is `True`, and `False`."""
+        true = frozenset(i for i, event in enumerate(self._events) if flag(event))
+        return {True: true, False: frozenset(range(len(self._events))) - true}
+
+    def _subset(self, positions: list[int]) -> EventCollection:
+        """Return a collection of the `Event`s at ascending `positions`, reusing
+        their sort keys.
+        """
+        subset = EventCollection([])
+        subset._events = tuple(self._events[i] for i in positions)
+        subset._start_times = [self._start_times[i] for i in positions]
+        subset._end_times = [self._end_times[i] for i in positions]
+        subset._max_end_times = list(accumulate(subset._end_times, max))
+        return subset
+
+
+def _utc(datetime_: datetime) -> datetime:
+    """Return `datetime_` in UTC, treating naive as UTC.
+
+    Aware datetimes with the same `tzinfo` instance compare much faster than those
+    with different ones, as each comparison otherwise calls `utcoffset()`.
+    """
+    if datetime_.tzinfo is None:
+        return datetime_.replace(tzinfo=timezone.utc)
+    return datetime_.astimezone(timezone.utc)
@@ -0,0 +1,245 @@
+"""Module containing `EventStore` class."""
+
+from __future__ import annotations
+
+import sys
+
+if sys.version_info < (3, 11):
+    from typing_extensions import Self
+else:
+    from typing import Self
+
+import bisect
+import mmap
+import os
+import struct
+import tempfile
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from .event import Event
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+    from types import TracebackType
+
+_MAGIC = b"SPONDEVS"
+_VERSION = 1
+# Magic, format version, number of events
+_HEADER = struct.Struct("<8sHxxI")
+# Offset of JSON, length of JSON, start time in microseconds since the epoch.
+# One per event, in start time order.
+_RECORD = struct.Struct("<QIq")
+# Offset of uid, length of uid, record number. One per event, in uid order.
+_UID_ENTRY = struct.Struct("<QII")
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+class EventStore:
+    """Read-only store of `Event`s in a memory-mapped file.
+
+    Each `Event` is only constructed when it's requested, by uid or by start time,
+    using indexes in the file. The file is mapped into memory rather than read, so
+    processes opening the same store share its pages through the OS cache.
+
+    Create a store with `EventStore.write()`, then open it with `EventStore()`,
+    preferably as a context manager, e.g.:
+
+        EventStore.write(path, Event.list_from_data(data))
+        with EventStore(path) as store:
+            event = store.event_by_uid(uid)
+
+    Naive datetimes are treated as UTC.
+    """
+
+    def __init__(self, path: str | os.PathLike[str]) -> None:
+        """Open the store at `path`.
+
+        Raises
+        ------
+        `ValueError`
+            if `path` is not a store written by `EventStore.write()`.
+        """
+        err_msg = f"'{path}' is not an event store."
+        with Path(path).open("rb") as file:
+            try:
+                self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:  # empty file
+                raise ValueError(err_msg) from None
+        try:
+            magic, version, count = _HEADER.unpack_from(self._mmap)
+        except struct.error:
+            magic, version, count = b"", 0, 0
+        if magic != _MAGIC or version != _VERSION:
+            self.close()
+            raise ValueError(err_msg)
+        self._count: int = count
+        self._records_offset = _HEADER.size
+        self._uids_offset = self._records_offset + count * _RECORD.size
+
+    def __enter__(self) -> Self:
+        """Return the store, to close on exit."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Close the store."""
+        self.close()
+
+    def __len__(self) -> int:
+        """Return the number of `Event`s."""
+        return self._count
+
+    def __iter__(self) -> Iterator[Event]:
+        """Yield all `Event`s, in start time order."""
+        for record in range(self._count):
+            yield self._event(record)
+
+    def __contains__(self, uid: object) -> bool:
+        """Return whether an `Event` with matching `uid` is in the store."""
+        return isinstance(uid, str) and self._record_by_uid(uid) is not None
+
+    def close(self) -> None:
+        """Close the store. `Event`s already constructed remain usable."""
+        self._mmap.close()
+
+    def event_by_uid(self, uid: str) -> Event:
+        """Return the `Event` with matching `uid`.
+
+        Parameters
+        ----------
+        uid
+
+        Returns
+        -------
+        `Event`
+
+        Raises
+        ------
+        LookupError
+            If `uid` is not found.
+        """
+        record = self._record_by_uid(uid)
+        if record is None:
+            err_msg = f"No Event found with id='{uid}'."
+            raise LookupError(err_msg)
+        return self._event(record)
+
+    def starting_between(self, start: datetime, end: datetime) -> Iterator[Event]:
+        """Yield `Event`s which start at or after `start`, and before `end`, in start
+        time order.
+
+        Parameters
+        ----------
+        start
+        end
+
+        Yields
+        ------
+        `Event`
+        """
+        start_us, end_us = _microseconds(start), _microseconds(end)
+        first = bisect.bisect_left(range(self._count), start_us, key=self._start_at)
+        last = bisect.bisect_left(range(self._count), end_us, key=self._start_at)
+        for record in range(first, max(first, last)):
+            yield self._event(record)
+
+    @classmethod
+    def write(cls, path: str | os.PathLike[str], events: Iterable[Event]) -> None:
+        """Write `events` to a new store file.
+
+        The file is replaced atomically, so a concurrent `EventStore()` never opens a
+        partially written store.
+
+        Parameters
+        ----------
+        path
+            file to create or replace.
+        events
+            e.g. as returned by `Event.list_from_data()`.
+        """
+        events = sorted(events, key=lambda event: _microseconds(event.start_time))
+        count = len(events)
+        uids = [event.uid.encode() for event in events]
+        jsons = [event.model_dump_json(by_alias=True).encode() for event in events]
+
+        offset = _HEADER.size + count * (_RECORD.size + _UID_ENTRY.size)
+        uid_entries = []
+        for record, uid in enumerate(uids):
+            uid_entries.append((uid, offset, record))
+            offset += len(uid)
+        uid_entries.sort(key=lambda entry: entry[0])
+        records = []
+        for event, json_ in zip(events, jsons, strict=True):
+            records.append((offset, len(json_), _microseconds(event.start_time)))
+            offset += len(json_)
+
+        path = Path(path)
+        with tempfile.NamedTemporaryFile(
+            dir=path.parent, prefix=f".{path.name}.", delete=False
+        ) as file:
+            temp_path = Path(file.name)
+            try:
+                file.write(_HEADER.pack(_MAGIC, _VERSION, count))
+                for record_ in records:
+                    file.write(_RECORD.pack(*record_))
+                for uid, uid_offset, record in uid_entries:
+                    file.write(_UID_ENTRY.pack(uid_offset, len(uid), record))
+                file.writelines(uids)
+                file.writelines(jsons)
+            except BaseException:
+                file.close()
+                temp_path.unlink()
+                raise
+        # As created by `open()`, rather than only readable by the owner
+        umask = os.umask(0)
+        os.umask(umask)
+        temp_path.chmod(0o666 & ~umask)
+        temp_path.replace(path)
+
+    def _event(self, record: int) -> Event:
+        """Construct the `Event` in `record`."""
+        offset, length, _ = _RECORD.unpack_from(
+            self._mmap, self._records_offset + record * _RECORD.size
+        )
+        return Event.model_validate_json(self._mmap[offset : offset + length])
+
+    def _start_at(self, record: int) -> int:
+        """Return the start time of the `Event` in `record`, in microseconds."""
+        return int(
+            _RECORD.unpack_from(
+                self._mmap, self._records_offset + record * _RECORD.size
+            )[2]
+        )
+
+    def _uid_entry(self, index: int) -> tuple[bytes, int]:
+        """Return the uid and record number of the `index`th uid in uid order."""
+        offset, length, record = _UID_ENTRY.unpack_from(
+            self._mmap, self._uids_offset + index * _UID_ENTRY.size
+        )
+        return self._mmap[offset : offset + length], record
+
+    def _record_by_uid(self, uid: str) -> int | None:
+        """Return the record number of the `Event` with matching `uid`, if any."""
+        uid_bytes = uid.encode()
+        index = bisect.bisect_left(
+            range(self._count), uid_bytes, key=lambda i: self._uid_entry(i)[0]
+        )
+        if index < self._count:
+            found, record = self._uid_entry(index)
+            if found == uid_bytes:
+                return record
+        return None
+
+
+def _microseconds(datetime_: datetime) -> int:
+    """Return `datetime_` as microseconds since the epoch, treating naive as UTC."""
+    if datetime_.tzinfo is None:
+        datetime_ = datetime_.replace(tzinfo=timezone.utc)
+    return (datetime_ - _EPOCH) // _MICROSECOND
@@ -0,0 +1,166 @@
+"""Module containing frozen, hashable variants of the models.
+
+Each is a subclass of the equivalent mutable model, e.g. `FrozenEvent` of `Event`,
+so it has the same fields, aliases, serialisation, constructors and derived
+properties, and can be used wherever the mutable model is read.
+
+Fields of frozen models can't be assigned, and collections are tuples, or read-only
+mappings, so instances can be shared between threads, and used as `dict` keys or
+`set` members, e.g. to memoise results per `Event`:
+
+    events = FrozenEvent.list_from_data(data)
+
+    @functools.cache
+    def accepted_count(event: FrozenEvent) -> int:
+        return len(event.responses.accepted_uids)
+
+Models with a `uid` are hashed by it, so hashing doesn't depend on the size of the
+model. They're equal only if all fields are equal, as for the mutable models.
+
+Methods which update in place, e.g. `FrozenEvent.update_from_dict()`, raise
+`pydantic.ValidationError` if there's any change.
+
+Data round-trips between frozen and mutable models, e.g. with
+`FrozenEvent.from_model(event)` or
+`Event.from_dict(frozen_event.model_dump(by_alias=True))`.
+"""
+
+from __future__ import annotations
+
+import sys
+
+if sys.version_info < (3, 11):
+    from typing_extensions import Self
+
+else:
+    from typing import Self
+
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Annotated
+
+from pydantic import (
+    AfterValidator,
+    BaseModel,
+    ConfigDict,
+    Field,
+    PlainSerializer,
+)
+
+from ._parsing import _construct
+from .event import Event, Responses
+from .group import FieldDef, Group
+from .member import Member
+from .profile_ import Profile
+from .role import Role
+from .subgroup import Subgroup
+
+_ReadOnlyFields = Annotated[
+    Mapping[str, int | str],
+    AfterValidator(MappingProxyType),
+    PlainSerializer(dict, return_type=dict[str, int | str]),
+]
+
+
+class _FrozenWithUid(BaseModel):
+    """Base class for frozen variants of models with a `uid`, which they're hashed
+    by.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    if TYPE_CHECKING:  # Field of the mutable model
+        uid: str
+
+    def __hash__(self) -> int:
+        """Return hash of `uid`."""
+        return hash(self.uid)
+
+    @classmethod
+    def from_model(cls, model: BaseModel) -> Self:
+        """Construct a frozen copy of a mutable model, without validation.
+
+        Parameters
+        ----------
+        model
+            instance of the equivalent mutable model, e.g. an `Event` for
+            `FrozenEvent`.
+
+        Returns
+        -------
+        instance of the class.
+        """
+        return _construct(cls, model.model_dump(by_alias=True))
+
+
+class FrozenProfile(_FrozenWithUid, Profile):
+    """Frozen, hashable variant of `Profile`."""
+
+    model_config = ConfigDict(frozen=True)
+
+
+class FrozenMember(_FrozenWithUid, Member):
+    """Frozen, hashable variant of `Member`."""
+
+    model_config = ConfigDict(frozen=True)
+
+    # Collections, as immutable types
+    subgroup_uids: tuple[str, ...] = Field(alias="subGroups")  # type: ignore[assignment]
+    fields: _ReadOnlyFields = Field(alias="fields")  # type: ignore[assignment]
+    profile: FrozenProfile | None = None
+    role_uids: tuple[str, ...] | None = Field(alias="roles", default=None)  # type: ignore[assignment]
+
+
+class FrozenRole(_FrozenWithUid, Role):
+    """Frozen, hashable variant of `Role`."""
+
+    model_config = ConfigDict(frozen=True)
+
+
+class FrozenSubgroup(_FrozenWithUid, Subgroup):
+    """Frozen, hashable variant of `Subgroup`."""
+
+    model_config = ConfigDict(frozen=True)
+
+
+class FrozenFieldDef(_FrozenWithUid, FieldDef):
+    """Frozen, hashable variant of `FieldDef`."""
+
+    model_config = ConfigDict(frozen=True)
+
+
+class FrozenGroup(_FrozenWithUid, Group):
+    """Frozen, hashable variant of `Group`."""
+
+    model_config = ConfigDict(frozen=True)
+
+    # Collections, as immutable types
+    contact_person: FrozenProfile | None = Field(alias="contactPerson", default=None)
+    members: tuple[FrozenMember, ...]  # type: ignore[assignment]
+    roles: tuple[FrozenRole, ...]  # type: ignore[assignment]
+    subgroups: tuple[FrozenSubgroup, ...] = Field(alias="subGroups")  # type: ignore[assignment]
+    field_defs: tuple[FrozenFieldDef, ...] = Field(alias="fieldDefs")  # type: ignore[assignment]
+
+
+class FrozenResponses(Responses):
+    """Frozen, hashable variant of `Responses`.
+
+    Hashed by all uids, as there's no `uid` of its own.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    # Collections, as immutable types
+    accepted_uids: tuple[str, ...] = Field(alias="acceptedIds")  # type: ignore[assignment]
+    declined_uids: tuple[str, ...] = Field(alias="declinedIds")  # type: ignore[assignment]
+    unanswered_uids: tuple[str, ...] = Field(alias="unansweredIds")  # type: ignore[assignment]
+    waiting_list_uids: tuple[str, ...] = Field(alias="waitinglistIds")  # type: ignore[assignment]
+    unconfirmed_uids: tuple[str, ...] = Field(alias="unconfirmedIds")  # type: ignore[assignment]
+
+
+class FrozenEvent(_FrozenWithUid, Event):
+    """Frozen, hashable variant of `Event`."""
+
+    model_config = ConfigDict(frozen=True)
+
+    responses: FrozenResponses
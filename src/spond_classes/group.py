@@ -9,10 +9,29 @@ if sys.version_info < (3, 11):
 else:
     from typing import Self
 
-from typing import TYPE_CHECKING
-
-from pydantic import BaseModel, Field
-
+from functools import cached_property, partial
+from types import MappingProxyType
+from typing import IO, TYPE_CHECKING, Any, TypeVar, cast, get_args
+
+from pydantic import BaseModel, Field, SerializerFunctionWrapHandler, field_serializer
+
+from ._caching import _CachingModel
+from ._parsing import (
+    _aiter_from_data,
+    _alist_from_data,
+    _construct,
+    _fingerprint,
+    _iter_from_data,
+    _iter_from_json_file,
+    _LazyModelList,
+    _list_adapter,
+    _list_from_data,
+    _list_from_json,
+    _list_to_json,
+    _write_json_array,
+)
+from .changes import CollectionChanges, GroupChanges
+from .columnar import _members_to_columns
 from .member import Member
 from .profile_ import Profile
 from .role import Role
@@ -20,7 +39,15 @@ from .subgroup import Subgroup
 from .typing import _ensure_dict
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable
+    from collections.abc import (
+        AsyncIterable,
+        AsyncIterator,
+        Iterable,
+        Iterator,
+        Mapping,
+        Sequence,
+    )
+    from concurrent.futures import Executor
 
     from .typing import DictFromJSON
 
@@ -34,13 +61,21 @@ class FieldDef(BaseModel):
     name: str
 
 
-class Group(BaseModel):
+_HasUid = TypeVar("_HasUid", Member, Role, Subgroup, FieldDef)
+_COLLECTIONS = ("members", "roles", "subgroups", "field_defs")
+"""Names of `Group` fields which are collections."""
+
+
+class Group(_CachingModel):
     """Represents a group in the Spond system.
 
     A `Group` has:
     - zero, one or more `Member`s
     - zero, one or more `Role`s
     - zero, one or more `Subgroup`s
+
+    Lookups by `uid` use indexes built on first use. Reassigning a field discards
+    them; mutating `members`, `roles` or `subgroups` in place does not.
     """
 
     uid: str = Field(alias="id")
@@ -72,6 +107,17 @@ class Group(BaseModel):
     Derived from `fieldDefs` in Spond API.
     May be empty."""
 
+    @field_serializer("members", mode="wrap")
+    def _serialize_members(
+        self, members: Sequence[Member], handler: SerializerFunctionWrapHandler
+    ) -> object:
+        """Serialise `members`, constructing them first if lazy."""
+        if isinstance(members, _LazyModelList):
+            # As the type of the field, which is `tuple` for a frozen variant
+            frozen = self.model_config.get("frozen", False)
+            members = tuple(members) if frozen else list(members)
+        return handler(members)
+
     def __str__(self) -> str:
         """Return simple human-readable description.
 
@@ -79,14 +125,170 @@ class Group(BaseModel):
         """
         return f"{self.__class__.__name__}(uid='{self.uid}', name='{self.name}', …)"
 
+    @cached_property
+    def _members_by_uid(self) -> dict[str, Member]:
+        """Index of `Member`s by `uid`, built on first access."""
+        return _index_by_uid(self.members)
+
+    @cached_property
+    def _roles_by_uid(self) -> dict[str, Role]:
+        """Index of `Role`s by `uid`, built on first access."""
+        return _index_by_uid(self.roles)
+
+    @cached_property
+    def _subgroups_by_uid(self) -> dict[str, Subgroup]:
+        """Index of `Subgroup`s by `uid`, built on first access."""
+        return _index_by_uid(self.subgroups)
+
+    @cached_property
+    def members_by_subgroup_uid(self) -> Mapping[str, tuple[Member, ...]]:
+        """Return `Member`s keyed by the `uid` of each `Subgroup` they're in.
+
+        Includes every `Subgroup` of the `Group`, even if it has no `Member`s.
+        Built on first access, for efficient repeated or bulk queries.
+        """
+        return _inverted_index(
+            self.subgroups, ((member, member.subgroup_uids) for member in self.members)
+        )
+
+    @cached_property
+    def members_by_role_uid(self) -> Mapping[str, tuple[Member, ...]]:
+        """Return `Member`s keyed by the `uid` of each `Role` they have.
+
+        Includes every `Role` of the `Group`, even if no `Member` has it.
+        Built on first access, for efficient repeated or bulk queries.
+        """
+        return _inverted_index(
+            self.roles, ((member, member.role_uids or ()) for member in self.members)
+        )
+
+    @cached_property
+    def _fingerprints(self) -> dict[str, dict[str, bytes]]:
+        """Fingerprints of the data each collection item was last updated from, by
+        field name, then `uid`. Recorded by `update_from_dict()`.
+        """
+        return {}
+
+    @classmethod
+    def _item_model(cls, name: str) -> type[Any]:
+        """Return the model of the items of the collection field `name`."""
+        return cast("type[Any]", get_args(cls.model_fields[name].annotation)[0])
+
     @classmethod
-    def list_from_data(cls, data: Iterable[DictFromJSON]) -> list[Self]:
+    def list_from_data(
+        cls,
+        data: Iterable[DictFromJSON],
+        *,
+        trusted: bool = False,
+        lazy_members: bool = False,
+        executor: Executor | None = None,
+    ) -> list[Self]:
         """Construct a list of `Group`s from the list returned by `Spond.get_groups()`.
 
         Parameters
         ----------
         data
             as returned by `spond.spond.Spond.get_groups()`.
+        trusted
+            if `True`, construct without validation, which is faster. Only use with
+            data known to be valid, e.g. previously serialised with
+            `model_dump(by_alias=True)`.
+        lazy_members
+            if `True`, `members` is a read-only sequence, which constructs each
+            `Member` on first access. This is faster if few `Member`s are used.
+            `Member` validation errors are then raised on access.
+        executor
+            if given, construct in parallel, by splitting `data` into chunks, each
+            constructed by a call in `executor`, e.g. from
+            `parallel.default_executor()`. Order and errors are the same as without
+            `executor`. This is only faster for large `data`, and with a
+            `ProcessPoolExecutor`, only if constructing outweighs the cost of
+            transferring data to and from processes.
+            Ignored if `lazy_members`.
+
+        Returns
+        -------
+        `list[Group]`
+
+        Raises
+        ------
+        `TypeError`
+            if an item in `data` is not a `dict`.
+        """
+        if lazy_members:
+            return [
+                cls.from_dict(item, trusted=trusted, lazy_members=True) for item in data
+            ]
+        return _list_from_data(cls, data, trusted=trusted, executor=executor)
+
+    @classmethod
+    def iter_from_data(cls, data: Iterable[DictFromJSON]) -> Iterator[Self]:
+        """Yield `Group`s from the list returned by `Spond.get_groups()`.
+
+        Each `Group` is constructed only when it's requested, so memory use doesn't
+        grow with the size of `data`.
+
+        Parameters
+        ----------
+        data
+            as returned by `spond.spond.Spond.get_groups()`, or any iterable of such
+            `dict`s.
+
+        Yields
+        ------
+        `Group`
+
+        Raises
+        ------
+        `TypeError`
+            if an item in `data` is not a `dict`.
+        """
+        return _iter_from_data(cls, data)
+
+    @classmethod
+    def iter_from_json_file(cls, file: IO[str] | IO[bytes]) -> Iterator[Self]:
+        """Yield `Group`s from a JSON file, reading it incrementally.
+
+        Memory use doesn't grow with the size of the file.
+
+        Parameters
+        ----------
+        file
+            text or binary (UTF-8) file object containing a JSON array, serialised
+            from `spond.spond.Spond.get_groups()`.
+
+        Yields
+        ------
+        `Group`
+
+        Raises
+        ------
+        `json.JSONDecodeError`
+            if the content of `file` is not a JSON array.
+        `TypeError`
+            if an item in the array is not an object.
+        """
+        return _iter_from_json_file(cls, file)
+
+    @classmethod
+    async def alist_from_data(
+        cls,
+        data: Iterable[DictFromJSON],
+        *,
+        trusted: bool = False,
+        lazy_members: bool = False,
+    ) -> list[Self]:
+        """Construct a list of `Group`s in a worker thread, without blocking the
+        event loop.
+
+        Parameters
+        ----------
+        data
+            as returned by `spond.spond.Spond.get_groups()`.
+        trusted
+            as for `Group.list_from_data()`.
+        lazy_members
+            as for `Group.list_from_data()`.
 
         Returns
         -------
@@ -97,10 +299,60 @@ class Group(BaseModel):
         `TypeError`
             if an item in `data` is not a `dict`.
         """
-        return [cls.from_dict(item) for item in data]
+        return await _alist_from_data(
+            partial(cls.list_from_data, trusted=trusted, lazy_members=lazy_members),
+            data,
+        )
+
+    @classmethod
+    def aiter_from_data(
+        cls,
+        data: AsyncIterable[DictFromJSON | Iterable[DictFromJSON]],
+        *,
+        trusted: bool = False,
+        lazy_members: bool = False,
+        batch_size: int = 500,
+    ) -> AsyncIterator[Self]:
+        """Yield `Group`s from an async stream of data, e.g. pages as they're fetched.
+
+        Each batch is constructed in a worker thread while the next is received, so
+        fetching and construction overlap, and the event loop isn't blocked. `Group`s
+        from a batch are yielded once the next batch is received, or `data` ends.
+
+        Parameters
+        ----------
+        data
+            async iterable of `dict`s, each an item of the list returned by
+            `spond.spond.Spond.get_groups()`, or of pages, i.e. lists of such `dict`s.
+        trusted
+            as for `Group.list_from_data()`.
+        lazy_members
+            as for `Group.list_from_data()`.
+        batch_size
+            maximum number of `dict`s from `data` constructed together. Each page is
+            constructed together, regardless of size.
+
+        Yields
+        ------
+        `Group`, in the order of `data`.
+
+        Raises
+        ------
+        `TypeError`
+            if an item in `data` is not a `dict`, or a page of them.
+        `pydantic.ValidationError`
+            if an item is not valid. Indexes in the error are relative to its batch.
+        """
+        return _aiter_from_data(
+            partial(cls.list_from_data, trusted=trusted, lazy_members=lazy_members),
+            data,
+            batch_size=batch_size,
+        )
 
     @classmethod
-    def from_dict(cls, dict_: DictFromJSON) -> Self:
+    def from_dict(
+        cls, dict_: DictFromJSON, *, trusted: bool = False, lazy_members: bool = False
+    ) -> Self:
         """Construct a `Group`.
 
         Parameters
@@ -108,6 +360,14 @@ class Group(BaseModel):
         dict_
             as returned by `spond.spond.Spond.get_group()`
             or from the list returned by `spond.spond.Spond.get_groups()`.
+        trusted
+            if `True`, construct without validation, which is faster. Only use with
+            data known to be valid, e.g. previously serialised with
+            `model_dump(by_alias=True)`.
+        lazy_members
+            if `True`, `members` is a read-only sequence, which constructs each
+            `Member` on first access. This is faster if few `Member`s are used.
+            `Member` validation errors are then raised on access.
 
         Returns
         -------
@@ -119,8 +379,195 @@ class Group(BaseModel):
             if `dict_` is not a `dict`.
         """
         _ensure_dict(dict_)
+        if lazy_members and isinstance(members_data := dict_.get("members"), list):
+            group = cls.from_dict({**dict_, "members": []}, trusted=trusted)
+            # Not assigned, as it may be a frozen variant. It has no cached values.
+            group.__dict__["members"] = _LazyModelList(
+                cls._item_model("members"), members_data, trusted=trusted
+            )
+            return group
+        if trusted:
+            return _construct(cls, dict_)
         return cls(**dict_)
 
+    @classmethod
+    def list_from_json(cls, json_data: str | bytes) -> list[Self]:
+        """Construct a list of `Group`s from JSON, without an intermediate `list`.
+
+        Parameters
+        ----------
+        json_data
+            JSON array, serialised from `spond.spond.Spond.get_groups()`.
+
+        Returns
+        -------
+        `list[Group]`
+
+        Raises
+        ------
+        `pydantic.ValidationError`
+            if `json_data` is not valid JSON, or not a valid array of `Group`s.
+        """
+        return _list_from_json(cls, json_data)
+
+    @classmethod
+    def list_to_json(cls, groups: Iterable[Group]) -> bytes:
+        """Serialise `Group`s to JSON, with the same keys as Spond API.
+
+        Round-trips losslessly with `Group.list_from_json()`, or `Group.from_dict()`
+        for each item after `json.loads()`.
+
+        Parameters
+        ----------
+        groups
+
+        Returns
+        -------
+        `bytes`
+            UTF-8 JSON array of objects.
+        """
+        return _list_to_json(groups)
+
+    @classmethod
+    def list_to_json_file(cls, groups: Iterable[Group], file: IO[bytes]) -> None:
+        """Write `Group`s to a file as JSON, with the same keys as Spond API.
+
+        `groups` are serialised a chunk at a time, so memory use doesn't grow with
+        their number, e.g. when `groups` is a generator. Read back with
+        `Group.iter_from_json_file()`.
+
+        Parameters
+        ----------
+        groups
+        file
+            binary file object to write a UTF-8 JSON array of objects to.
+        """
+        _write_json_array(groups, file)
+
+    @classmethod
+    def from_json(cls, json_data: str | bytes) -> Self:
+        """Construct a `Group` from JSON, without an intermediate `dict`.
+
+        Parameters
+        ----------
+        json_data
+            JSON object, serialised from `spond.spond.Spond.get_group()`
+            or an item of the list returned by `spond.spond.Spond.get_groups()`.
+
+        Returns
+        -------
+        `Group`
+
+        Raises
+        ------
+        `pydantic.ValidationError`
+            if `json_data` is not valid JSON, or not a valid `Group`.
+        """
+        return cls.model_validate_json(json_data)
+
+    def update_from_dict(self, dict_: DictFromJSON) -> GroupChanges:
+        """Update the `Group` in place from newer data, and return the changes.
+
+        Items of `members`, `roles`, `subgroups` and `field_defs` are matched by
+        `uid`. Unchanged items are kept rather than constructed again, so the cost of
+        an update is proportional to the number of changes rather than the size of
+        the `Group`.
+
+        Items are compared using fingerprints of the data they were last updated
+        from. Before the first update, or after a field is reassigned, changes are
+        found by validating all items and comparing them instead. Modifying an item
+        in place is not detected.
+
+        Parameters
+        ----------
+        dict_
+            as returned by `spond.spond.Spond.get_group()`
+            or from the list returned by `spond.spond.Spond.get_groups()`.
+
+        Returns
+        -------
+        `GroupChanges`
+
+        Raises
+        ------
+        `TypeError`
+            if `dict_`, or an item in one of its collections, is not a `dict`.
+        `ValueError`
+            if `dict_` is for a different `Group`.
+        `pydantic.ValidationError`
+            if `dict_` is not valid. The `Group` is then unchanged.
+        """
+        _ensure_dict(dict_)
+        fields = type(self).model_fields
+        keys = {name: fields[name].alias or name for name in _COLLECTIONS}
+        # Validate all except collections, which are validated only if changed
+        updated = self.model_validate(
+            {**dict_, **{key: [] for key in keys.values() if key in dict_}}
+        )
+        if updated.uid != self.uid:
+            err_msg = (
+                f"Can't update Group with id='{self.uid}' "
+                f"from data with id='{updated.uid}'."
+            )
+            raise ValueError(err_msg)
+
+        changed_fields = [
+            name
+            for name in fields
+            if name not in _COLLECTIONS
+            and getattr(updated, name) != getattr(self, name)
+        ]
+        collections = {}
+        collection_changes = {}
+        fingerprints = {}
+        for name in _COLLECTIONS:
+            (
+                collections[name],
+                collection_changes[name],
+                fingerprints[name],
+            ) = _update_items(
+                self._item_model(name),
+                getattr(self, name),
+                dict_[keys[name]],
+                self._fingerprints.get(name),
+            )
+
+        for name in changed_fields:
+            setattr(self, name, getattr(updated, name))
+        for name, items in collections.items():
+            current = getattr(self, name)
+            if len(items) != len(current) or any(
+                item is not current_item
+                for item, current_item in zip(items, current, strict=True)
+            ):
+                setattr(self, name, items)
+        # After reassignment, which discards cached values
+        self._fingerprints.update(fingerprints)
+        return GroupChanges(fields=changed_fields, **collection_changes)
+
+    def members_to_columns(self) -> dict[str, list[Any]]:
+        """Return the `Member`s as columns.
+
+        See `Group.list_members_to_columns()`.
+        """
+        return _members_to_columns([self])
+
+    @classmethod
+    def list_members_to_columns(cls, groups: Iterable[Group]) -> dict[str, list[Any]]:
+        """Return the `Member`s of `groups` as columns.
+
+        Parameters
+        ----------
+        groups
+
+        Returns
+        -------
+        `dict` of 'group_uid', 'profile_uid' and `Member` field names other than
+        `fields` and `profile` to `list` of values, one per `Member`, e.g. for
+        `pandas.DataFrame()`, or `columnar.to_record_batch()`.
+        """
+        return _members_to_columns(groups)
+
     def member_by_uid(self, uid: str) -> Member:
         """Return the `Member` with matching `uid`.
 
@@ -137,11 +584,11 @@ class Group(BaseModel):
         LookupError
             If `uid` is not found.
         """
-        for member in self.members:
-            if member.uid == uid:
-                return member
-        err_msg = f"No Member found with id='{uid}'."
-        raise LookupError(err_msg)
+        try:
+            return self._members_by_uid[uid]
+        except KeyError:
+            err_msg = f"No Member found with id='{uid}'."
+            raise LookupError(err_msg) from None
 
     def role_by_uid(self, uid: str) -> Role:
         """Return the `Role` with matching `uid`.
@@ -159,11 +606,11 @@ class Group(BaseModel):
         LookupError
             If `uid` is not found.
         """
-        for role in self.roles:
-            if role.uid == uid:
-                return role
-        err_msg = f"No Role found with id='{uid}'."
-        raise LookupError(err_msg)
+        try:
+            return self._roles_by_uid[uid]
+        except KeyError:
+            err_msg = f"No Role found with id='{uid}'."
+            raise LookupError(err_msg) from None
 
     def subgroup_by_uid(self, uid: str) -> Subgroup:
         """Return the `Subgroup` with matching `uid`.
@@ -181,11 +628,11 @@ class Group(BaseModel):
         LookupError
             If `uid` is not found.
         """
-        for subgroup in self.subgroups:
-            if subgroup.uid == uid:
-                return subgroup
-        err_msg = f"No Subgroup found with id='{uid}'."
-        raise LookupError(err_msg)
+        try:
+            return self._subgroups_by_uid[uid]
+        except KeyError:
+            err_msg = f"No Subgroup found with id='{uid}'."
+            raise LookupError(err_msg) from None
 
     def members_by_subgroup(self, subgroup: Subgroup) -> list[Member]:
         """Return `Member`s in the `Subgroup`.
@@ -207,9 +654,7 @@ class Group(BaseModel):
         if not isinstance(subgroup, Subgroup):
             err_msg = "`subgroup` must be a Subgroup."
             raise TypeError(err_msg)
-        return [
-            member for member in self.members if subgroup.uid in member.subgroup_uids
-        ]
+        return list(self.members_by_subgroup_uid.get(subgroup.uid, ()))
 
     def members_by_role(self, role: Role) -> list[Member]:
         """Return `Member`s with the `Role`.
@@ -231,8 +676,84 @@ class Group(BaseModel):
         if not isinstance(role, Role):
             err_msg = "`role` must be a Role."
             raise TypeError(err_msg)
-        return [
-            member
-            for member in self.members
-            if member.role_uids and role.uid in member.role_uids
-        ]
+        return list(self.members_by_role_uid.get(role.uid, ()))
+
+
+def _index_by_uid(items: Iterable[_HasUid]) -> dict[str, _HasUid]:
+    """Return a `dict` of `items` keyed by `uid`.
+
+    If `uid`s aren't unique, the first item with a given `uid` is indexed.
+    """
+    index: dict[str, _HasUid] = {}
+    for item in items:
+        index.setdefault(item.uid, item)
+    return index
+
+
+def _inverted_index(
+    keys: Iterable[Role | Subgroup],
+    members_with_uids: Iterable[tuple[Member, Iterable[str]]],
+) -> Mapping[str, tuple[Member, ...]]:
+    """Return a read-only mapping of `uid` to the `Member`s which reference it.
+
+    Every `uid` in `keys` is present, even if no `Member` references it.
+    `Member`s are in their original order, each at most once per `uid`.
+    """
+    index: dict[str, list[Member]] = {key.uid: [] for key in keys}
+    for member, uids in members_with_uids:
+        for uid in dict.fromkeys(uids):
+            index.setdefault(uid, []).append(member)
+    return MappingProxyType({uid: tuple(members) for uid, members in index.items()})
+
+
+def _update_items(
+    model: type[_HasUid],
+    current: Sequence[_HasUid],
+    items: Iterable[DictFromJSON],
+    fingerprints: Mapping[str, bytes] | None,
+) -> tuple[list[_HasUid], CollectionChanges, dict[str, bytes]]:
+    """Return items updated from `items` data, the changes, and their fingerprints.
+
+    Items of `current` are kept if their `fingerprints` match, or if not known, if
+    they're equal to the validated data. Other data is validated in a single call.
+
+    Raises
+    ------
+    `TypeError`
+        if an item in `items` is not a `dict`.
+    """
+    current_by_uid = _index_by_uid(current)
+    updated: list[_HasUid | None] = []
+    new_fingerprints: dict[str, bytes] = {}
+    to_validate: list[tuple[int, DictFromJSON]] = []
+    for item in items:
+        _ensure_dict(item)
+        uid: str = item.get("id", "")
+        fingerprint = new_fingerprints[uid] = _fingerprint(item)
+        if (
+            fingerprints is not None
+            and uid in current_by_uid
+            and fingerprints.get(uid) == fingerprint
+        ):
+            updated.append(current_by_uid[uid])
+        else:
+            to_validate.append((len(updated), item))
+            updated.append(None)
+
+    changes = CollectionChanges()
+    validated: list[_HasUid] = _list_adapter(model).validate_python(
+        [item for _, item in to_validate]
+    )
+    for (i, _), new in zip(to_validate, validated, strict=True):
+        existing = current_by_uid.get(new.uid)
+        if existing is None:
+            changes.added.append(new.uid)
+        elif existing == new:
+            new = existing  # noqa: PLW2901
+        else:
+            changes.modified.append(new.uid)
+        updated[i] = new
+    result = cast("list[_HasUid]", updated)
+    new_uids = {item.uid for item in result}
+    changes.removed = [uid for uid in current_by_uid if uid not in new_uids]
+    return result, changes, new_fingerprints
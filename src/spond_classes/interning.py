@@ -0,0 +1,129 @@
+"""Module containing `UidTable` class."""
+
+from __future__ import annotations
+
+from array import array
+from typing import TYPE_CHECKING, get_args
+
+from .typing import ResponseStatus
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from .event import Event
+    from .group import Group
+
+
+class UidTable:
+    """Table of uid strings, shared by the models interned with it.
+
+    The same uid typically appears in many models, e.g. a `Member` uid in the
+    `Responses` of many `Event`s. Interning replaces each copy with a single shared
+    `str`, reducing memory use.
+
+    Each uid is also assigned an `int` code, so collections of uids can be stored
+    compactly as arrays.
+
+    Note that `Event.list_from_json()`, `Group.list_from_json()` already share
+    strings within a single JSON payload.
+    """
+
+    def __init__(self) -> None:
+        self._codes: dict[str, int] = {}
+        self._uids: list[str] = []
+
+    def __len__(self) -> int:
+        """Return the number of uids."""
+        return len(self._uids)
+
+    def __contains__(self, uid: object) -> bool:
+        """Return whether `uid` is in the table."""
+        return uid in self._codes
+
+    def intern(self, uid: str) -> str:
+        """Return the shared `str` equal to `uid`, adding `uid` if it's new."""
+        return self._uids[self.code(uid)]
+
+    def intern_event(self, event: Event) -> Event:
+        """Replace uids in `event` and its `Responses` with shared `str`s.
+
+        Returns
+        -------
+        `Event`
+            `event`, modified in place.
+        """
+        event.uid = self.intern(event.uid)
+        responses = event.responses
+        for status in get_args(ResponseStatus):
+            name = f"{status}_uids"
+            setattr(responses, name, self._intern_all(getattr(responses, name)))
+        return event
+
+    def intern_group(self, group: Group) -> Group:
+        """Replace uids in `group` and its subordinate instances with shared `str`s.
+
+        Returns
+        -------
+        `Group`
+            `group`, modified in place.
+        """
+        group.uid = self.intern(group.uid)
+        for role in group.roles:
+            role.uid = self.intern(role.uid)
+        for subgroup in group.subgroups:
+            subgroup.uid = self.intern(subgroup.uid)
+        for field_def in group.field_defs:
+            field_def.uid = self.intern(field_def.uid)
+        for member in group.members:
+            member.uid = self.intern(member.uid)
+            member.subgroup_uids = self._intern_all(member.subgroup_uids)
+            if member.role_uids is not None:
+                member.role_uids = self._intern_all(member.role_uids)
+            if member.profile is not None:
+                member.profile.uid = self.intern(member.profile.uid)
+        if group.contact_person is not None:
+            group.contact_person.uid = self.intern(group.contact_person.uid)
+        # Reassign lists, to discard indexes keyed by the original `str`s
+        group.members = group.members
+        group.roles = group.roles
+        group.subgroups = group.subgroups
+        return group
+
+    def code(self, uid: str) -> int:
+        """Return the `int` code for `uid`, adding `uid` if it's new."""
+        code = self._codes.get(uid)
+        if code is None:
+            code = self._codes[uid] = len(self._uids)
+            self._uids.append(uid)
+        return code
+
+    def uid(self, code: int) -> str:
+        """Return the uid for `code`.
+
+        Raises
+        ------
+        LookupError
+            If `code` is not found.
+        """
+        if not 0 <= code < len(self._uids):
+            err_msg = f"No uid found with code={code}."
+            raise LookupError(err_msg)
+        return self._uids[code]
+
+    def encode(self, uids: Iterable[str]) -> array[int]:
+        """Return compact array of the `int` codes of `uids`, adding any new ones."""
+        return array("L", map(self.code, uids))
+
+    def decode(self, codes: Iterable[int]) -> list[str]:
+        """Return list of the uids of `codes`.
+
+        Raises
+        ------
+        LookupError
+            If a code is not found.
+        """
+        return [self.uid(code) for code in codes]
+
+    def _intern_all(self, uids: Iterable[str]) -> list[str]:
+        """Return list of the shared `str`s equal to `uids`."""
+        return [self.intern(uid) for uid in uids]
@@ -3,18 +3,22 @@
 from __future__ import annotations
 
 from datetime import datetime
+from functools import cached_property
 
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import EmailStr, Field
 
-from .profile_ import Profile
+from ._caching import _CachingModel
+from .profile_ import Profile, _name_sort_key
 
 
-class Member(BaseModel):
+class Member(_CachingModel):
     """Represents a member in the Spond system.
 
     A `Member` is an individual's `Group`-specific record.
 
     A `Member` may have a `Profile`.
+
+    `sort_key` is computed on first use. Reassigning a field discards it.
     """
 
     uid: str = Field(alias="id")
@@ -64,3 +68,12 @@ class Member(BaseModel):
     def full_name(self) -> str:
         """Return the `Member`'s full name, for convenience."""
         return f"{self.first_name} {self.last_name}"
+
+    @cached_property
+    def sort_key(self) -> tuple[str, str]:
+        """Return a key to sort by last name, then first name.
+
+        Names are compared case-insensitively, ignoring accents, e.g.
+        `sorted(group.members, key=attrgetter("sort_key"))`.
+        """
+        return _name_sort_key(self.last_name), _name_sort_key(self.first_name)
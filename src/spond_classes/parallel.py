@@ -0,0 +1,42 @@
+"""Module containing helpers for parsing in parallel.
+
+See the `executor` parameter of `Event.list_from_data()`, `Group.list_from_data()`.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+
+
+def default_executor(max_workers: int | None = None) -> Executor:
+    """Return a new executor suited to parsing in parallel.
+
+    Parsing is CPU-bound, so threads only run in parallel on free-threaded Python.
+    Otherwise, processes are used.
+
+    Use as a context manager, or call `shutdown()` when finished, e.g.:
+
+        with default_executor() as executor:
+            groups = Group.list_from_data(data, executor=executor)
+
+    Parameters
+    ----------
+    max_workers
+        maximum number of threads or processes. Defaults to the number of CPUs.
+
+    Returns
+    -------
+    `ThreadPoolExecutor` on free-threaded Python, otherwise `ProcessPoolExecutor`.
+    """
+    if _is_gil_enabled():
+        return ProcessPoolExecutor(max_workers)
+    # Its own default is more threads than CPUs, suited to I/O-bound work
+    return ThreadPoolExecutor(max_workers or os.cpu_count())
+
+
+def _is_gil_enabled() -> bool:
+    """Return whether the GIL is enabled, i.e. this isn't free-threaded Python."""
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)  # Python 3.13+
+    return is_gil_enabled is None or bool(is_gil_enabled())
@@ -10,22 +10,28 @@ if sys.version_info < (3, 11):
 else:
     from typing import Self
 
+import unicodedata
+from functools import cached_property
 from typing import TYPE_CHECKING
 
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import EmailStr, Field
 
+from spond_classes._caching import _CachingModel
+from spond_classes._parsing import _construct, _list_from_json
 from spond_classes.typing import _ensure_dict
 
 if TYPE_CHECKING:
     from .typing import DictFromJSON
 
 
-class Profile(BaseModel):
+class Profile(_CachingModel):
     """Represents a profile in the Spond system.
 
     A `Profile` is an individual's account-specific record.
 
     A `Profile` belongs to a `Member`.
+
+    `sort_key` is computed on first use. Reassigning a field discards it.
     """
 
     uid: str = Field(alias="id")
@@ -58,14 +64,27 @@ class Profile(BaseModel):
         """Return the `Profile`'s full name, for convenience."""
         return f"{self.first_name} {self.last_name}"
 
+    @cached_property
+    def sort_key(self) -> tuple[str, str]:
+        """Return a key to sort by last name, then first name.
+
+        Names are compared case-insensitively, ignoring accents, e.g.
+        `sorted(profiles, key=attrgetter("sort_key"))`.
+        """
+        return _name_sort_key(self.last_name), _name_sort_key(self.first_name)
+
     @classmethod
-    def from_dict(cls, dict_: DictFromJSON) -> Self:
+    def from_dict(cls, dict_: DictFromJSON, *, trusted: bool = False) -> Self:
         """Construct a `Profile`.
 
         Parameters
         ----------
         dict_
             as returned by `spond.spond.Spond.get_profile()`.
+        trusted
+            if `True`, construct without validation, which is faster. Only use with
+            data known to be valid, e.g. previously serialised with
+            `model_dump(by_alias=True)`.
 
         Returns
         -------
@@ -77,4 +96,53 @@ class Profile(BaseModel):
             if `dict_` is not a `dict`.
         """
         _ensure_dict(dict_)
+        if trusted:
+            return _construct(cls, dict_)
         return cls(**dict_)
+
+    @classmethod
+    def list_from_json(cls, json_data: str | bytes) -> list[Self]:
+        """Construct a list of `Profile`s from JSON, without an intermediate `list`.
+
+        Parameters
+        ----------
+        json_data
+            JSON array of objects, each serialised from
+            `spond.spond.Spond.get_profile()`.
+
+        Returns
+        -------
+        `list[Profile]`
+
+        Raises
+        ------
+        `pydantic.ValidationError`
+            if `json_data` is not valid JSON, or not a valid array of `Profile`s.
+        """
+        return _list_from_json(cls, json_data)
+
+    @classmethod
+    def from_json(cls, json_data: str | bytes) -> Self:
+        """Construct a `Profile` from JSON, without an intermediate `dict`.
+
+        Parameters
+        ----------
+        json_data
+            JSON object, serialised from `spond.spond.Spond.get_profile()`.
+
+        Returns
+        -------
+        `Profile`
+
+        Raises
+        ------
+        `pydantic.ValidationError`
+            if `json_data` is not valid JSON, or not a valid `Profile`.
+        """
+        return cls.model_validate_json(json_data)
+
+
+def _name_sort_key(name: str) -> str:
+    """Return `name` case-folded, without accents, for sorting."""
+    decomposed = unicodedata.normalize("NFKD", name.casefold())
+    return "".join(char for char in decomposed if not unicodedata.combining(char))
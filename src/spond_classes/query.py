@@ -0,0 +1,432 @@
+"""Module containing `QueryEngine` class, and composable `Predicate`s to query it.
+
+For example, `Member`s in a `Subgroup` who declined more than 3 `Event`s in a
+month:
+
+    engine = QueryEngine(groups, events)
+    members = engine.members(
+        in_subgroup(subgroup_uid)
+        & responded("declined", at_least=4, start=month_start, end=month_end)
+    )
+"""
+
+from __future__ import annotations
+
+import bisect
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Literal, get_args
+
+from .event_collection import EventCollection, _utc
+from .typing import ResponseStatus
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+    from collections.abc import Set as AbstractSet
+
+    from .event import Event
+    from .group import Group
+    from .member import Member
+
+_MIN = datetime.min.replace(tzinfo=timezone.utc)
+_MAX = datetime.max.replace(tzinfo=timezone.utc)
+
+
+class QueryEngine:
+    """In-memory indexes of `Group`s' `Member`s and their responses to `Event`s, for
+    queries using `Predicate`s.
+
+    `Member`s are indexed by uid, `Group`, `Subgroup`, `Role`, and by their
+    responses to `Event`s. A query starts from the most selective indexed
+    `Predicate`, then checks each candidate against the others, rather than
+    scanning all `Member`s.
+
+    Indexes reflect `Group`s and `Event`s when the engine is constructed.
+    """
+
+    def __init__(self, groups: Iterable[Group], events: Iterable[Event] = ()) -> None:
+        """Construct from `groups` and `events`, e.g. as returned by
+        `Group.list_from_data()`, `Event.list_from_data()`.
+
+        `Member` uids are assumed to be unique across `groups`.
+        """
+        self._members: dict[str, Member] = {}
+        self._groups_by_member_uid: dict[str, Group] = {}
+        self._uids_by: dict[_IndexName, dict[str, set[str]]] = {
+            "group": {},
+            "subgroup": {},
+            "role": {},
+        }
+        for group in groups:
+            group_uids = self._uids_by["group"].setdefault(group.uid, set())
+            for member in group.members:
+                self._members[member.uid] = member
+                self._groups_by_member_uid[member.uid] = group
+                group_uids.add(member.uid)
+                for subgroup_uid in member.subgroup_uids:
+                    self._uids_by["subgroup"].setdefault(subgroup_uid, set()).add(
+                        member.uid
+                    )
+                for role_uid in member.role_uids or ():
+                    self._uids_by["role"].setdefault(role_uid, set()).add(member.uid)
+        self._all_uids = frozenset(self._members)
+        self._position_by_uid = {uid: i for i, uid in enumerate(self._members)}
+
+        self.events = EventCollection(events)
+        """`Event`s, in start time order."""
+        self._start_times = [_utc(event.start_time) for event in self.events]
+        self._event_positions_by_uid = {
+            event.uid: i for i, event in enumerate(self.events)
+        }
+        # Positions of `Event`s in start time order, by member uid, for each status
+        self._positions_by_status: dict[ResponseStatus, dict[str, list[int]]] = {
+            status: {} for status in get_args(ResponseStatus)
+        }
+        for position, event in enumerate(self.events):
+            for status, positions_by_uid in self._positions_by_status.items():
+                for uid in getattr(event.responses, f"{status}_uids"):
+                    if uid in self._members:
+                        positions_by_uid.setdefault(uid, []).append(position)
+
+    def __str__(self) -> str:
+        """Return simple human-readable description."""
+        return (
+            f"{self.__class__.__name__}({len(self._members)} members, "
+            f"{len(self.events)} events)"
+        )
+
+    def members(self, predicate: Predicate | None = None) -> list[Member]:
+        """Return the `Member`s matching `predicate`.
+
+        Parameters
+        ----------
+        predicate
+            e.g. `in_group(uid) & responded("accepted")`. If omitted, all `Member`s.
+
+        Returns
+        -------
+        `list[Member]`, in the order of the `Group`s, then `Member`s, ingested.
+        """
+        uids = self._all_uids if predicate is None else self._candidates(predicate)
+        return [
+            self._members[uid]
+            for uid in sorted(uids, key=self._position_by_uid.__getitem__)
+        ]
+
+    def group_of(self, member_uid: str) -> Group:
+        """Return the `Group` of the `Member` with matching `member_uid`.
+
+        Parameters
+        ----------
+        member_uid
+
+        Returns
+        -------
+        `Group`
+
+        Raises
+        ------
+        LookupError
+            If `member_uid` is not found.
+        """
+        try:
+            return self._groups_by_member_uid[member_uid]
+        except KeyError:
+            err_msg = f"No Member found with id='{member_uid}'."
+            raise LookupError(err_msg) from None
+
+    def events_of(
+        self,
+        member_uid: str,
+        status: ResponseStatus,
+        *,
+        start: datetime | None = None,
+        end: datetime | None = None,
+    ) -> list[Event]:
+        """Return the `Event`s to which the `Member` with matching `member_uid`
+        responded with `status`.
+
+        Parameters
+        ----------
+        member_uid
+        status
+        start
+            if given, only `Event`s which start at or after `start`.
+        end
+            if given, only `Event`s which start before `end`.
+
+        Returns
+        -------
+        `list[Event]`, in start time order. Empty if `member_uid` is not found.
+        """
+        positions = self._positions_by_status[status].get(member_uid, [])
+        first, last = self._range(positions, start, end)
+        return [self.events[position] for position in positions[first:last]]
+
+    def members_of(self, event_uid: str, status: ResponseStatus) -> list[Member]:
+        """Return the `Member`s who responded with `status` to the `Event` with
+        matching `event_uid`.
+
+        Responses from uids which aren't `Member`s are ignored.
+
+        Parameters
+        ----------
+        event_uid
+        status
+
+        Returns
+        -------
+        `list[Member]`, in the order of `Event.responses`.
+
+        Raises
+        ------
+        LookupError
+            If `event_uid` is not found.
+        """
+        try:
+            event = self.events[self._event_positions_by_uid[event_uid]]
+        except KeyError:
+            err_msg = f"No Event found with id='{event_uid}'."
+            raise LookupError(err_msg) from None
+        return [
+            self._members[uid]
+            for uid in getattr(event.responses, f"{status}_uids")
+            if uid in self._members
+        ]
+
+    def _estimate(self, predicate: Predicate) -> int:
+        """Return the maximum number of `Member`s matching `predicate`, to plan
+        evaluation.
+        """
+        if isinstance(predicate, _Indexed):
+            return len(self._bucket(predicate))
+        if isinstance(predicate, _Responded):
+            return len(self._positions_by_status[predicate.status])
+        if isinstance(predicate, _And):
+            return min(map(self._estimate, predicate.predicates))
+        if isinstance(predicate, _Or):
+            return min(
+                len(self._all_uids), sum(map(self._estimate, predicate.predicates))
+            )
+        return len(self._all_uids)
+
+    def _candidates(self, predicate: Predicate) -> AbstractSet[str]:
+        """Return the uids of all `Member`s matching `predicate`."""
+        if isinstance(predicate, _Indexed):
+            return self._bucket(predicate)
+        if isinstance(predicate, _And):
+            # Start from the most selective, then check the others for each candidate
+            first, *others = sorted(predicate.predicates, key=self._estimate)
+            return {
+                uid
+                for uid in self._candidates(first)
+                if all(self._matches(other, uid) for other in others)
+            }
+        if isinstance(predicate, _Or):
+            return set().union(*map(self._candidates, predicate.predicates))
+        if isinstance(predicate, _Not):
+            return self._all_uids - self._candidates(predicate.predicate)
+        uids: Iterable[str] = self._all_uids
+        if isinstance(predicate, _Responded):
+            # Only `Member`s with any responses with the status can match
+            uids = self._positions_by_status[predicate.status]
+        return {uid for uid in uids if self._matches(predicate, uid)}
+
+    def _matches(self, predicate: Predicate, uid: str) -> bool:
+        """Return whether the `Member` with `uid` matches `predicate`."""
+        if isinstance(predicate, _Indexed):
+            return uid in self._bucket(predicate)
+        if isinstance(predicate, _Responded):
+            positions = self._positions_by_status[predicate.status].get(uid, [])
+            if len(positions) < predicate.at_least:
+                return False
+            first, last = self._range(positions, predicate.start, predicate.end)
+            return last - first >= predicate.at_least
+        if isinstance(predicate, _Where):
+            return predicate.func(self._members[uid])
+        if isinstance(predicate, (_And, _Or)):
+            combine = all if isinstance(predicate, _And) else any
+            return combine(self._matches(other, uid) for other in predicate.predicates)
+        if isinstance(predicate, _Not):
+            return not self._matches(predicate.predicate, uid)
+        err_msg = f"Unsupported predicate: {predicate!r}"
+        raise TypeError(err_msg)
+
+    def _bucket(self, predicate: _Indexed) -> AbstractSet[str]:
+        """Return the uids of `Member`s in the index bucket of `predicate`."""
+        return self._uids_by[predicate.index].get(predicate.uid, frozenset())
+
+    def _range(
+        self, positions: list[int], start: datetime | None, end: datetime | None
+    ) -> tuple[int, int]:
+        """Return the slice of `Event` `positions` which start at or after `start`,
+        and before `end`.
+        """
+        key = self._start_times.__getitem__
+        start = _MIN if start is None else _utc(start)
+        end = _MAX if end is None else _utc(end)
+        return (
+            bisect.bisect_left(positions, start, key=key),
+            bisect.bisect_left(positions, end, key=key),
+        )
+
+
+class Predicate:
+    """Condition on `Member`s, for `QueryEngine.members()`.
+
+    Combine with `&` (and), `|` (or), `~` (not).
+
+    Construct with `in_group()`, `in_subgroup()`, `has_role()`, `responded()` or
+    `where()`.
+    """
+
+    def __and__(self, other: Predicate) -> Predicate:
+        """Return a `Predicate` matching `Member`s which match both."""
+        return _And(self, other)
+
+    def __or__(self, other: Predicate) -> Predicate:
+        """Return a `Predicate` matching `Member`s which match either."""
+        return _Or(self, other)
+
+    def __invert__(self) -> Predicate:
+        """Return a `Predicate` matching `Member`s which don't match."""
+        return _Not(self)
+
+
+_IndexName = Literal["group", "subgroup", "role"]
+
+
+class _Indexed(Predicate):
+    """Match `Member`s in a bucket of a hash index."""
+
+    def __init__(self, index: _IndexName, uid: str) -> None:
+        self.index = index
+        self.uid = uid
+
+    def __repr__(self) -> str:
+        return f"in_{self.index}({self.uid!r})"
+
+
+class _Responded(Predicate):
+    """Match `Member`s with a number of responses with a status in a time range."""
+
+    def __init__(
+        self,
+        status: ResponseStatus,
+        at_least: int,
+        start: datetime | None,
+        end: datetime | None,
+    ) -> None:
+        self.status = status
+        self.at_least = at_least
+        self.start = start
+        self.end = end
+
+    def __repr__(self) -> str:
+        return (
+            f"responded({self.status!r}, at_least={self.at_least}, "
+            f"start={self.start!r}, end={self.end!r})"
+        )
+
+
+class _Where(Predicate):
+    """Match `Member`s for which a function returns `True`."""
+
+    def __init__(self, func: Callable[[Member], bool]) -> None:
+        self.func = func
+
+    def __repr__(self) -> str:
+        return f"where({self.func!r})"
+
+
+class _And(Predicate):
+    """Match `Member`s matching all `Predicate`s."""
+
+    def __init__(self, *predicates: Predicate) -> None:
+        # Flatten, so all are planned together
+        self.predicates: tuple[Predicate, ...] = tuple(
+            child
+            for predicate in predicates
+            for child in (
+                predicate.predicates if isinstance(predicate, _And) else (predicate,)
+            )
+        )
+
+    def __repr__(self) -> str:
+        return "(" + " & ".join(map(repr, self.predicates)) + ")"
+
+
+class _Or(Predicate):
+    """Match `Member`s matching any `Predicate`."""
+
+    def __init__(self, *predicates: Predicate) -> None:
+        self.predicates = predicates
+
+    def __repr__(self) -> str:
+        return "(" + " | ".join(map(repr, self.predicates)) + ")"
+
+
+class _Not(Predicate):
+    """Match `Member`s not matching a `Predicate`."""
+
+    def __init__(self, predicate: Predicate) -> None:
+        self.predicate = predicate
+
+    def __repr__(self) -> str:
+        return f"~{self.predicate!r}"
+
+
+def in_group(uid: str) -> Predicate:
+    """Return a `Predicate` matching `Member`s of the `Group` with matching `uid`."""
+    return _Indexed("group", uid)
+
+
+def in_subgroup(uid: str) -> Predicate:
+    """Return a `Predicate` matching `Member`s of the `Subgroup` with matching
+    `uid`.
+    """
+    return _Indexed("subgroup", uid)
+
+
+def has_role(uid: str) -> Predicate:
+    """Return a `Predicate` matching `Member`s with the `Role` with matching `uid`."""
+    return _Indexed("role", uid)
+
+
+def responded(
+    status: ResponseStatus,
+    *,
+    at_least: int = 1,
+    start: datetime | None = None,
+    end: datetime | None = None,
+) -> Predicate:
+    """Return a `Predicate` matching `Member`s who responded with `status` to at
+    least `at_least` `Event`s.
+
+    Parameters
+    ----------
+    status
+    at_least
+    start
+        if given, only count `Event`s which start at or after `start`.
+    end
+        if given, only count `Event`s which start before `end`.
+
+    Raises
+    ------
+    `ValueError`
+        if `at_least` is less than 1. Use `~responded()` for `Member`s with no such
+        responses.
+    """
+    if at_least < 1:
+        err_msg = f"`at_least` must be at least 1, got {at_least}."
+        raise ValueError(err_msg)
+    return _Responded(status, at_least, start, end)
+
+
+def where(func: Callable[[Member], bool]) -> Predicate:
+    """Return a `Predicate` matching `Member`s for which `func` returns `True`.
+
+    Not indexed, so `func` is called for each candidate `Member`. Combine with
+    indexed `Predicate`s using `&`, to reduce the candidates.
+    """
+    return _Where(func)
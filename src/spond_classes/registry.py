@@ -0,0 +1,144 @@
+"""Module containing `ProfileRegistry` class and related `Membership` class."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, NamedTuple
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from .group import Group
+    from .member import Member
+    from .profile_ import Profile
+
+
+class Membership(NamedTuple):
+    """A `Member` of a `Group`, whose `Member.profile` is a registered `Profile`."""
+
+    group: Group
+    member: Member
+
+
+class ProfileRegistry:
+    """Registry of the `Profile`s of `Group`s' `Member`s, shared across `Group`s.
+
+    The same person is typically a `Member` of several `Group`s, each with its own
+    copy of their `Profile`. Adding `Group`s replaces each copy with a single shared
+    instance, reducing memory use, and indexes `Membership`s by `Profile` uid.
+
+    A `Profile` whose data differs from the registered one with the same uid, e.g.
+    from newer data, is kept as is, so no data is lost.
+
+    `Membership`s reflect `Group`s when added. After changing a `Group`'s members,
+    e.g. with `Group.update_from_dict()`, add it again.
+    """
+
+    def __init__(self) -> None:
+        self._profiles: dict[str, Profile] = {}
+        # Uids of `Profile`s with `Membership`s, by `Group` uid, as when added
+        self._profile_uids_by_group_uid: dict[str, set[str]] = {}
+        self._memberships: dict[str, list[Membership]] = {}
+
+    def __len__(self) -> int:
+        """Return the number of `Profile`s."""
+        return len(self._profiles)
+
+    def __contains__(self, uid: object) -> bool:
+        """Return whether a `Profile` with matching `uid` is registered."""
+        return uid in self._profiles
+
+    def __iter__(self) -> Iterator[Profile]:
+        """Yield all `Profile`s, in the order first registered."""
+        return iter(self._profiles.values())
+
+    def add_group(self, group: Group) -> Group:
+        """Replace `Profile`s in `group` with registered ones, registering new ones,
+        and index its `Membership`s.
+
+        If a `Group` with the same uid was added before, its `Membership`s are
+        replaced.
+
+        Returns
+        -------
+        `Group`
+            `group`, modified in place.
+        """
+        self.remove_group(group.uid)
+        profile_uids = self._profile_uids_by_group_uid[group.uid] = set()
+        for member in group.members:
+            if member.profile is None:
+                continue
+            profile = self._register(member.profile)
+            if profile is not member.profile:
+                member.profile = profile
+            self._memberships.setdefault(profile.uid, []).append(
+                Membership(group, member)
+            )
+            profile_uids.add(profile.uid)
+        if group.contact_person is not None:
+            contact_person = self._register(group.contact_person)
+            # Only reassign if needed, as that discards the `Group`'s cached values
+            if contact_person is not group.contact_person:
+                group.contact_person = contact_person
+        return group
+
+    def remove_group(self, uid: str) -> None:
+        """Remove `Membership`s of the `Group` with matching `uid`, if it was added.
+
+        Registered `Profile`s are kept.
+        """
+        for profile_uid in self._profile_uids_by_group_uid.pop(uid, set()):
+            memberships = [
+                membership
+                for membership in self._memberships.get(profile_uid, ())
+                if membership.group.uid != uid
+            ]
+            if memberships:
+                self._memberships[profile_uid] = memberships
+            else:
+                self._memberships.pop(profile_uid, None)
+
+    def profile_by_uid(self, uid: str) -> Profile:
+        """Return the registered `Profile` with matching `uid`.
+
+        Parameters
+        ----------
+        uid
+
+        Returns
+        -------
+        `Profile`
+
+        Raises
+        ------
+        LookupError
+            If `uid` is not found.
+        """
+        try:
+            return self._profiles[uid]
+        except KeyError:
+            err_msg = f"No Profile found with id='{uid}'."
+            raise LookupError(err_msg) from None
+
+    def memberships(self, profile_uid: str) -> tuple[Membership, ...]:
+        """Return the `Membership`s of the `Profile` with matching `profile_uid`, in
+        the order `Group`s were added.
+
+        Empty if there are none.
+        """
+        return tuple(self._memberships.get(profile_uid, ()))
+
+    def groups(self, profile_uid: str) -> list[Group]:
+        """Return the `Group`s of which the `Profile` with matching `profile_uid` is a
+        `Member`, in the order they were added.
+
+        Empty if there are none.
+        """
+        return [membership.group for membership in self.memberships(profile_uid)]
+
+    def _register(self, profile: Profile) -> Profile:
+        """Return the registered `Profile` equal to `profile`, registering `profile`
+        if its uid is new. A `Profile` with different data is returned as is.
+        """
+        registered = self._profiles.setdefault(profile.uid, profile)
+        return registered if registered == profile else profile
@@ -0,0 +1,192 @@
+"""Module containing functions to save and load snapshots of models.
+
+A snapshot is a compact binary file of a list of `Event`s or `Group`s. `Group`s
+load much faster than by fetching and validating the source data again; `Event`s
+are validated when loaded, so only save fetching, e.g.:
+
+    key = content_hash(data)
+    groups = load_snapshot(path, Group, key=key)
+    if groups is None:
+        groups = Group.list_from_data(data)
+        save_snapshot(path, groups, key=key)
+
+Each snapshot records the model class and a key, typically the `content_hash()` of
+the source data. `load_snapshot()` returns `None` if they don't match, so stale
+snapshots are never used.
+
+Snapshots are only intended to be loaded by the process which saved them, or
+another using the same version of `spond-classes`; they're not an interchange
+format. Only load snapshots from a trusted source.
+"""
+
+from __future__ import annotations
+
+import gc
+import hashlib
+import json
+import marshal
+import os
+import struct
+import tempfile
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, TypeVar, cast
+
+from pydantic import BaseModel
+
+from ._parsing import _construct, _list_adapter
+from .event import Event
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+_M = TypeVar("_M", bound=BaseModel)
+
+_MAGIC = b"SPONDSNP"
+_VERSION = 1
+# Magic, format version, length of model name, length of key
+_HEADER = struct.Struct("<8sHHH")
+
+
+def content_hash(data: object) -> str:
+    """Return a hash of `data`, identifying its content.
+
+    Parameters
+    ----------
+    data
+        JSON data, e.g. as returned by `spond.spond.Spond.get_events()`, as Python
+        objects or as serialised `str` or `bytes`. Python objects are hashed
+        independent of `dict` key order.
+
+    Returns
+    -------
+    `str`
+        hexadecimal SHA-256 digest.
+    """
+    if isinstance(data, str):
+        data = data.encode()
+    if not isinstance(data, bytes):
+        data = json.dumps(
+            data, sort_keys=True, separators=(",", ":"), default=str
+        ).encode()
+    return hashlib.sha256(data).hexdigest()
+
+
+def save_snapshot(
+    path: str | os.PathLike[str], models: Iterable[_M], *, key: str
+) -> None:
+    """Save `models` to a snapshot file.
+
+    The file is replaced atomically, so a concurrent `load_snapshot()` never reads a
+    partially written snapshot.
+
+    Parameters
+    ----------
+    path
+        file to create or replace.
+    models
+        `Event`s or `Group`s, all of the same class.
+    key
+        identifies the source of `models`, e.g. from `content_hash()`.
+
+    Raises
+    ------
+    `TypeError`
+        if `models` are not all of the same class.
+    """
+    models = list(models)
+    model_classes = {type(model) for model in models}
+    if len(model_classes) > 1:
+        err_msg = "Models must all be of the same class."
+        raise TypeError(err_msg)
+    name = _model_name(model_classes.pop()).encode() if models else b""
+    key_bytes = key.encode()
+    payload = marshal.dumps(
+        [model.model_dump(by_alias=True, mode="json") for model in models]
+    )
+    path = Path(path)
+    with tempfile.NamedTemporaryFile(
+        dir=path.parent, prefix=f".{path.name}.", delete=False
+    ) as file:
+        temp_path = Path(file.name)
+        try:
+            file.write(_HEADER.pack(_MAGIC, _VERSION, len(name), len(key_bytes)))
+            file.write(name)
+            file.write(key_bytes)
+            file.write(payload)
+        except BaseException:
+            file.close()
+            temp_path.unlink()
+            raise
+    # As created by `open()`, rather than only readable by the owner
+    umask = os.umask(0)
+    os.umask(umask)
+    temp_path.chmod(0o666 & ~umask)
+    temp_path.replace(path)
+
+
+def load_snapshot(
+    path: str | os.PathLike[str], model: type[_M], *, key: str
+) -> list[_M] | None:
+    """Load a list of `model` instances from a snapshot file.
+
+    Instances are constructed without validation, as the data was valid when saved,
+    except `Event`s, which are faster to validate.
+
+    Parameters
+    ----------
+    path
+        file created by `save_snapshot()`.
+    model
+        class of the saved models, e.g. `Event`.
+    key
+        as passed to `save_snapshot()`.
+
+    Returns
+    -------
+    `list[model]`, or `None` if `path` doesn't exist, isn't a snapshot of `model`
+    with `key`, or is from an incompatible version.
+    """
+    try:
+        content = Path(path).read_bytes()
+    except FileNotFoundError:
+        return None
+    try:
+        magic, version, name_length, key_length = _HEADER.unpack_from(content)
+    except struct.error:
+        return None
+    if magic != _MAGIC or version != _VERSION:
+        return None
+    offset = _HEADER.size
+    name = content[offset : offset + name_length]
+    offset += name_length
+    saved_key = content[offset : offset + key_length]
+    offset += key_length
+    if saved_key != key.encode() or name not in (_model_name(model).encode(), b""):
+        return None
+    # Loading allocates many objects which are all kept, so the cyclic garbage
+    # collector would repeatedly scan them for nothing
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        # Snapshots are only loaded from trusted sources, see module docstring
+        return _from_items(model, marshal.loads(content[offset:]))  # noqa: S302
+    except (EOFError, TypeError, ValueError):
+        return None
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+
+def _from_items(model: type[_M], items: list[dict[str, Any]]) -> list[_M]:
+    """Construct a list of `model` instances from saved data.
+
+    `Event`s are validated, as converting their fields in Python is slower.
+    """
+    if issubclass(model, Event):
+        return cast("list[_M]", _list_adapter(model).validate_python(items))
+    return [_construct(model, item) for item in items]
+
+
+def _model_name(model: type[BaseModel]) -> str:
+    """Return the fully qualified name of `model`."""
+    return f"{model.__module__}.{model.__qualname__}"
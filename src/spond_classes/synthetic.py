@@ -0,0 +1,200 @@
+"""Module containing generators of synthetic data, for testing at scale.
+
+Data is shaped like that returned by the `spond` package, including Spond API key
+names, so it can be used with any constructor, e.g. `Group.from_dict()`,
+`Event.iter_from_data()`.
+
+Generation is deterministic for a given `seed` (and Python version). Generators
+yield one item at a time, so can be used to stream millions of records without
+holding them in memory.
+
+Responses to generated events are from members of a given group, so data is
+referentially consistent.
+"""
+
+from __future__ import annotations
+
+import random
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from .typing import DictFromJSON
+
+_FIRST_NAMES = ("Ada", "Brendan", "Ciarán", "Dana", "Eilís", "Finn", "Grace", "Hugo")
+_LAST_NAMES = ("Byrne", "Gleason", "Hinds", "Kelly", "Murphy", "Nolan", "O'Neill")
+_RESPONSE_KEYS = (
+    "acceptedIds",
+    "declinedIds",
+    "unansweredIds",
+    "waitinglistIds",
+    "unconfirmedIds",
+)
+_RESPONSE_WEIGHTS = (60, 20, 15, 3, 2)
+_EVENT_TYPES = ("EVENT", "RECURRING", "AVAILABILITY")
+_EVENT_TYPE_WEIGHTS = (60, 35, 5)
+_START = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def profile_data(*, seed: int = 0) -> DictFromJSON:
+    """Return data for a profile, mocking `spond.spond.Spond.get_profile()`."""
+    return _profile_data(random.Random(seed))
+
+
+def group_data(
+    *, members: int = 100, subgroups: int = 10, roles: int = 5, seed: int = 0
+) -> DictFromJSON:
+    """Return data for a group, mocking `spond.spond.Spond.get_group()`.
+
+    Each member is in up to 2 subgroups, has up to 1 role, and has values for the
+    group's custom fields.
+    """
+    return _group_data(random.Random(seed), members, subgroups, roles)
+
+
+def iter_groups_data(  # noqa: PLR0913 - keyword-only
+    *,
+    groups: int = 10,
+    members: int = 100,
+    subgroups: int = 10,
+    roles: int = 5,
+    people: int | None = None,
+    seed: int = 0,
+) -> Iterator[DictFromJSON]:
+    """Yield data for `groups` groups, mocking `spond.spond.Spond.get_groups()`.
+
+    See `group_data()`.
+
+    If `people` is given, members' profiles are drawn from that many profiles, so
+    the same person is a member of several groups. `people` must be at least
+    `members`.
+    """
+    rng = random.Random(seed)
+    pool = None if people is None else [_profile_data(rng) for _ in range(people)]
+    for _ in range(groups):
+        profiles = None if pool is None else rng.sample(pool, k=members)
+        yield _group_data(rng, members, subgroups, roles, profiles)
+
+
+def iter_events_data(
+    group: DictFromJSON, *, events: int = 100, responses: int = 20, seed: int = 0
+) -> Iterator[DictFromJSON]:
+    """Yield data for `events` events, mocking `spond.spond.Spond.get_events()`.
+
+    Events start at intervals from 2024-01-01, in order.
+
+    Parameters
+    ----------
+    group
+        data for the group the events are for, e.g. from `group_data()`.
+        Each event has responses from up to `responses` of its members.
+    events
+    responses
+    seed
+    """
+    rng = random.Random(seed)
+    member_uids = [member["id"] for member in group["members"]]
+    start = _START
+    for i in range(events):
+        responders = rng.sample(member_uids, k=min(responses, len(member_uids)))
+        event_responses: DictFromJSON = {key: [] for key in _RESPONSE_KEYS}
+        keys = rng.choices(_RESPONSE_KEYS, _RESPONSE_WEIGHTS, k=len(responders))
+        for key, uid in zip(keys, responders, strict=True):
+            event_responses[key].append(uid)
+        start += timedelta(hours=rng.randint(1, 48))
+        end = start + timedelta(minutes=30 * rng.randint(1, 8))
+        created = start - timedelta(days=rng.randint(7, 60))
+        event: DictFromJSON = {
+            "id": _uid(rng),
+            "heading": f"Event {i}",
+            "responses": event_responses,
+            "type": rng.choices(_EVENT_TYPES, _EVENT_TYPE_WEIGHTS)[0],
+            "createdTime": _timestamp(created),
+            "startTimestamp": _timestamp(start),
+            "endTimestamp": _timestamp(end),
+        }
+        if rng.random() < 0.5:  # noqa: PLR2004
+            event["inviteTime"] = _timestamp(created + timedelta(days=1))
+        if rng.random() < 0.05:  # noqa: PLR2004
+            event["cancelled"] = True
+        if rng.random() < 0.05:  # noqa: PLR2004
+            event["hidden"] = True
+        yield event
+
+
+def _uid(rng: random.Random) -> str:
+    """Return a random uid, formatted like those in Spond API."""
+    return f"{rng.getrandbits(128):032X}"
+
+
+def _timestamp(datetime_: datetime) -> str:
+    """Return `datetime_` formatted like timestamps in Spond API."""
+    return datetime_.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _profile_data(rng: random.Random) -> DictFromJSON:
+    """Return data for a profile, using `rng`."""
+    first_name = rng.choice(_FIRST_NAMES)
+    last_name = rng.choice(_LAST_NAMES)
+    uid = _uid(rng)
+    return {
+        "id": uid,
+        "firstName": first_name,
+        "lastName": last_name,
+        "email": f"{uid[:8].lower()}@example.com",
+        "phoneNumber": f"+44{rng.randrange(10**9, 10**10)}",
+    }
+
+
+def _group_data(
+    rng: random.Random,
+    members: int,
+    subgroups: int,
+    roles: int,
+    profiles: list[DictFromJSON] | None = None,
+) -> DictFromJSON:
+    """Return data for a group, using `rng`, and `profiles` for members if given."""
+    group_uid = _uid(rng)
+    subgroup_uids = [_uid(rng) for _ in range(subgroups)]
+    role_uids = [_uid(rng) for _ in range(roles)]
+    field_def_uids = [_uid(rng) for _ in range(2)]
+    created = _START - timedelta(days=365)
+    members_data = []
+    for i in range(members):
+        profile = _profile_data(rng) if profiles is None else dict(profiles[i])
+        members_data.append(
+            {
+                "id": _uid(rng),
+                "createdTime": _timestamp(
+                    created + timedelta(minutes=rng.randrange(525_600))
+                ),
+                "firstName": profile["firstName"],
+                "lastName": profile["lastName"],
+                "email": profile["email"],
+                "phoneNumber": profile["phoneNumber"],
+                "respondent": rng.random() < 0.9,  # noqa: PLR2004
+                "subGroups": rng.sample(subgroup_uids, k=min(2, subgroups)),
+                "roles": rng.sample(role_uids, k=min(1, roles)),
+                "fields": {
+                    field_def_uids[0]: rng.randrange(1, 100),
+                    field_def_uids[1]: rng.choice(("S", "M", "L")),
+                },
+                "profile": profile,
+            }
+        )
+    return {
+        "id": group_uid,
+        "name": f"Group {group_uid[:4]}",
+        "contactPerson": _profile_data(rng),
+        "members": members_data,
+        "roles": [{"id": uid, "name": f"Role {i}"} for i, uid in enumerate(role_uids)],
+        "subGroups": [
+            {"id": uid, "name": f"Subgroup {i}"} for i, uid in enumerate(subgroup_uids)
+        ],
+        "fieldDefs": [
+            {"id": field_def_uids[0], "name": "Shirt number"},
+            {"id": field_def_uids[1], "name": "Shirt size"},
+        ],
+    }
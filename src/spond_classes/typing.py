@@ -2,11 +2,20 @@
 
 from __future__ import annotations
 
-from typing import Any, TypeAlias
+from typing import Any, Literal, TypeAlias
 
 DictFromJSON: TypeAlias = dict[str, Any]
 """Simple type alias to annotate dicts returned from Spond API calls."""
 
+EventType: TypeAlias = Literal["AVAILABILITY", "EVENT", "RECURRING"]
+"""Type of an `Event`."""
+
+ResponseStatus: TypeAlias = Literal[
+    "accepted", "declined", "unanswered", "waiting_list", "unconfirmed"
+]
+"""Status of a member's response to an `Event`, corresponding to the
+`Responses` list which includes their uid."""
+
 
 def _ensure_dict(value: Any) -> None:
     """Ensure that `value` is a `dict`.
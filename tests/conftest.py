@@ -0,0 +1,53 @@
+"""Fixtures shared by tests of several modules."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from spond_classes import Event, Group
+from spond_classes.synthetic import group_data, iter_events_data, iter_groups_data
+
+if TYPE_CHECKING:
+    from spond_classes.typing import DictFromJSON
+
+
+@pytest.fixture
+def synthetic_group_data() -> DictFromJSON:
+    """Synthetic group data with 10 members.
+
+    Mocks dict returned by `Spond.get_group()`.
+    """
+    return group_data(members=10)
+
+
+@pytest.fixture
+def synthetic_events_data(synthetic_group_data: DictFromJSON) -> list[DictFromJSON]:
+    """Synthetic data of 20 events, with responses from members of
+    `synthetic_group_data`.
+
+    Mocks list returned by `Spond.get_events()`.
+    """
+    return list(iter_events_data(synthetic_group_data, events=20))
+
+
+@pytest.fixture
+def synthetic_events(synthetic_events_data: list[DictFromJSON]) -> list[Event]:
+    """Synthetic `Event`s, from `synthetic_events_data`."""
+    return Event.list_from_data(synthetic_events_data)
+
+
+@pytest.fixture
+def synthetic_groups_data() -> list[DictFromJSON]:
+    """Synthetic data of 3 groups with 5 members each.
+
+    Mocks list returned by `Spond.get_groups()`.
+    """
+    return list(iter_groups_data(groups=3, members=5))
+
+
+@pytest.fixture
+def synthetic_groups(synthetic_groups_data: list[DictFromJSON]) -> list[Group]:
+    """Synthetic `Group`s, from `synthetic_groups_data`."""
+    return Group.list_from_data(synthetic_groups_data)
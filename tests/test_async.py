@@ -0,0 +1,164 @@
+"""Tests for async constructors `alist_from_data()`, `aiter_from_data()`."""
+
+from __future__ import annotations
+
+import asyncio
+import copy
+import threading
+from typing import TYPE_CHECKING, Any
+
+import pytest
+from pydantic import ValidationError
+
+from spond_classes import Event, Group
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Iterable
+
+    from spond_classes.typing import DictFromJSON
+
+
+async def _stream(items: Iterable[Any]) -> AsyncIterator[Any]:
+    """Yield `items`, letting other tasks run between them, like a fetch."""
+    for item in items:
+        await asyncio.sleep(0)
+        yield item
+
+
+async def _collect(iterator: AsyncIterator[Any]) -> list[Any]:
+    """Return all items of `iterator`."""
+    return [item async for item in iterator]
+
+
+def test_event_alist_from_data(synthetic_events_data: list[DictFromJSON]) -> None:
+    """Test that `Event`s are the same as from `list_from_data()`."""
+    # arrange
+    # act
+    my_events = asyncio.run(Event.alist_from_data(synthetic_events_data))
+    # assert
+    assert my_events == Event.list_from_data(synthetic_events_data)
+
+
+def test_group_alist_from_data__lazy_members(
+    synthetic_groups_data: list[DictFromJSON],
+) -> None:
+    """Test that options are passed on to `list_from_data()`."""
+    # arrange
+    # act
+    my_groups = asyncio.run(
+        Group.alist_from_data(synthetic_groups_data, lazy_members=True)
+    )
+    # assert
+    assert my_groups == Group.list_from_data(synthetic_groups_data)
+    assert not isinstance(my_groups[0].members, list)
+
+
+def test_event_alist_from_data__runs_in_worker_thread(
+    synthetic_events_data: list[DictFromJSON],
+) -> None:
+    """Test that data is validated in another thread, not the event loop's."""
+    # arrange
+    threads = set()
+
+    def data() -> Iterable[DictFromJSON]:
+        threads.add(threading.get_ident())
+        yield from synthetic_events_data
+
+    # act
+    asyncio.run(Event.alist_from_data(data()))
+    # assert
+    assert threads
+    assert threading.get_ident() not in threads
+
+
+def test_event_aiter_from_data__pages(
+    synthetic_events_data: list[DictFromJSON],
+) -> None:
+    """Test that `Event`s from pages are yielded in order, same as from
+    `list_from_data()`.
+    """
+    # arrange
+    data = synthetic_events_data
+    pages = [data[:5], data[5:15], data[15:]]
+    # act
+    my_events = asyncio.run(_collect(Event.aiter_from_data(_stream(pages))))
+    # assert
+    assert my_events == Event.list_from_data(data)
+
+
+def test_event_aiter_from_data__dicts_in_batches(
+    synthetic_events_data: list[DictFromJSON],
+) -> None:
+    """Test that `Event`s from a stream of `dict`s are yielded in order, with a
+    final partial batch.
+    """
+    # arrange
+    stream = _stream(synthetic_events_data)
+    # act
+    my_events = asyncio.run(_collect(Event.aiter_from_data(stream, batch_size=8)))
+    # assert
+    assert my_events == Event.list_from_data(synthetic_events_data)
+
+
+def test_group_aiter_from_data__dicts_and_pages_trusted(
+    synthetic_groups: list[Group],
+) -> None:
+    """Test that `Group`s are yielded from a mix of `dict`s and pages, with
+    `trusted`.
+    """
+    # arrange
+    data = [group.model_dump(by_alias=True) for group in synthetic_groups]
+    stream = _stream([data[0], data[1:]])
+    # act
+    my_groups = asyncio.run(_collect(Group.aiter_from_data(stream, trusted=True)))
+    # assert
+    assert my_groups == Group.list_from_data(data, trusted=True)
+
+
+def test_event_aiter_from_data__overlaps_fetching(
+    synthetic_events_data: list[DictFromJSON],
+) -> None:
+    """Test that the next page is requested before the previous one's `Event`s are
+    yielded.
+    """
+    # arrange
+    data = synthetic_events_data[:4]
+    log = []
+
+    async def pages() -> AsyncIterator[list[DictFromJSON]]:
+        for i in range(2):
+            log.append(f"fetch {i}")
+            yield data[i * 2 : i * 2 + 2]
+
+    async def consume() -> None:
+        async for event in Event.aiter_from_data(pages()):
+            log.append(event.uid)  # noqa: PERF401 - order relative to fetches
+
+    # act
+    asyncio.run(consume())
+    # assert
+    assert log == ["fetch 0", "fetch 1", *(item["id"] for item in data)]
+
+
+def test_event_aiter_from_data__invalid_raises_validation_error(
+    synthetic_events_data: list[DictFromJSON],
+) -> None:
+    """Test that ValidationError is raised for an invalid item."""
+    # arrange
+    data = copy.deepcopy(synthetic_events_data)
+    del data[15]["heading"]
+    stream = _stream([data[:10], data[10:]])
+    # assert
+    with pytest.raises(ValidationError):
+        asyncio.run(_collect(Event.aiter_from_data(stream)))  # act
+
+
+def test_event_aiter_from_data__not_dict_raises_type_error() -> None:
+    """Test that TypeError is raised for an item which is neither a `dict` nor a
+    page.
+    """
+    # arrange
+    stream = _stream([["not a dict"]])
+    # assert
+    with pytest.raises(TypeError):
+        asyncio.run(_collect(Event.aiter_from_data(stream)))  # act
@@ -0,0 +1,150 @@
+"""Tests for AttendanceMatrix class."""
+
+from __future__ import annotations
+
+import pytest
+
+from spond_classes import AttendanceMatrix, Event, Group, Responses
+from spond_classes.attendance import NO_RESPONSE, STATUS_CODES
+
+
+def _responses(
+    *, accepted: list[str] | None = None, declined: list[str] | None = None
+) -> Responses:
+    """Return `Responses` with uids in accepted and declined lists only."""
+    return Responses(
+        acceptedIds=accepted or [],
+        declinedIds=declined or [],
+        unansweredIds=[],
+        waitinglistIds=[],
+        unconfirmedIds=[],
+    )
+
+
+def _event(uid: str, responses: Responses) -> Event:
+    """Return simplest possible `Event` with `responses`."""
+    return Event(
+        id=uid,
+        heading=f"Event {uid}",
+        responses=responses,
+        type="EVENT",
+        createdTime="2020-12-31T19:00:00Z",
+        endTimestamp="2024-08-15T11:00:00Z",
+        startTimestamp="2021-07-06T06:00:00Z",
+    )
+
+
+@pytest.fixture
+def group() -> Group:
+    """`Group` with 3 `Member`s."""
+    return Group.from_dict(
+        {
+            "id": "G1",
+            "name": "Group One",
+            "members": [
+                {
+                    "id": uid,
+                    "createdTime": "2022-03-24T16:36:29Z",
+                    "firstName": "First",
+                    "lastName": uid,
+                    "respondent": True,
+                    "subGroups": [],
+                    "fields": {},
+                }
+                for uid in ("M1", "M2", "M3")
+            ],
+            "roles": [],
+            "subGroups": [],
+            "fieldDefs": [],
+        }
+    )
+
+
+@pytest.fixture
+def matrix(group: Group) -> AttendanceMatrix:
+    """`AttendanceMatrix` of 3 `Member`s and 2 `Event`s.
+
+    M1 accepted both, M2 declined E1 and accepted E2, M3 has no responses.
+    A non-member accepted E1.
+    """
+    events = [
+        _event("E1", _responses(accepted=["M1", "NON_MEMBER"], declined=["M2"])),
+        _event("E2", _responses(accepted=["M1", "M2"])),
+    ]
+    return AttendanceMatrix(group, events)
+
+
+def test_init(matrix: AttendanceMatrix) -> None:
+    """Test that matrix of codes is created in row-major order."""
+    # arrange
+    accepted = STATUS_CODES["accepted"]
+    declined = STATUS_CODES["declined"]
+    # act
+    # assert
+    assert matrix.shape == (3, 2)
+    assert matrix.member_uids == ("M1", "M2", "M3")
+    assert matrix.event_uids == ("E1", "E2")
+    assert matrix.codes.tolist() == [
+        accepted, accepted,
+        declined, accepted,
+        NO_RESPONSE, NO_RESPONSE,
+    ]  # fmt: skip
+    assert matrix.codes.readonly
+    assert str(matrix) == "AttendanceMatrix(3 members x 2 events)"
+
+
+def test_status(matrix: AttendanceMatrix) -> None:
+    """Test that status is returned for a Member and an Event."""
+    # assert
+    assert matrix.status("M2", "E1") == "declined"
+    assert matrix.status("M3", "E1") is None
+
+
+def test_status__unmatched_uid_raises_lookup_error(matrix: AttendanceMatrix) -> None:
+    """Test that LookupError is raised when there is no matching Member."""
+    # assert
+    with pytest.raises(LookupError):
+        matrix.status("NON_MEMBER", "E1")  # act
+
+
+def test_counts(matrix: AttendanceMatrix) -> None:
+    """Test that responses with a status are counted per Member and per Event."""
+    # assert
+    assert matrix.member_counts("accepted") == {"M1": 2, "M2": 1, "M3": 0}
+    assert matrix.event_counts("declined") == {"E1": 1, "E2": 0}
+
+
+def test_attendance_rates(matrix: AttendanceMatrix) -> None:
+    """Test that attendance rates are calculated per Member and per Event."""
+    # assert
+    assert matrix.member_attendance_rates() == {"M1": 1.0, "M2": 0.5, "M3": 0.0}
+    assert matrix.event_attendance_rates() == {"E1": 0.5, "E2": 1.0}
+
+
+def test_init__duplicate_event_uid(group: Group) -> None:
+    """Test that only the first `Event` with a uid is included, so columns match
+    results keyed by uid.
+    """
+    # arrange
+    events = [
+        _event("E1", _responses(accepted=["M1"])),
+        _event("E2", _responses(declined=["M1"])),
+        _event("E1", _responses(declined=["M1", "M2"])),
+    ]
+    # act
+    matrix = AttendanceMatrix(group, events)
+    # assert
+    assert matrix.shape == (3, 2)
+    assert matrix.event_uids == ("E1", "E2")
+    assert matrix.status("M1", "E1") == "accepted"
+    assert matrix.event_counts("declined") == {"E1": 0, "E2": 1}
+    assert matrix.event_attendance_rates() == {"E1": 1.0, "E2": 0.0}
+
+
+def test_init__no_events(group: Group) -> None:
+    """Test that matrix is created with no Events."""
+    # act
+    matrix = AttendanceMatrix(group, [])
+    # assert
+    assert matrix.shape == (3, 0)
+    assert matrix.member_attendance_rates() == {"M1": 0.0, "M2": 0.0, "M3": 0.0}
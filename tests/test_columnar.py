@@ -0,0 +1,101 @@
+"""Tests for export to columns."""
+
+from __future__ import annotations
+
+import sys
+from typing import get_args
+
+import pytest
+
+from spond_classes import Event, Group
+from spond_classes.columnar import to_record_batch
+from spond_classes.typing import ResponseStatus
+
+
+def test_event_list_to_columns(synthetic_events: list[Event]) -> None:
+    """Test that there's a column per field other than `responses`, with a value
+    per `Event`.
+    """
+    # arrange
+    # act
+    columns = Event.list_to_columns(synthetic_events)
+    # assert
+    assert set(columns) == set(Event.model_fields) - {"responses"}
+    rows = [
+        dict(zip(columns, row, strict=True))
+        for row in zip(*columns.values(), strict=True)
+    ]
+    assert rows == [
+        event.model_dump(exclude={"responses"}) for event in synthetic_events
+    ]
+
+
+def test_event_list_responses_to_columns(synthetic_events: list[Event]) -> None:
+    """Test that there's a row per response."""
+    # arrange
+    # act
+    columns = Event.list_responses_to_columns(synthetic_events)
+    # assert
+    rows = set(
+        zip(columns["event_uid"], columns["member_uid"], columns["status"], strict=True)
+    )
+    assert len(rows) == len(columns["status"])
+    assert rows == {
+        (event.uid, uid, status)
+        for event in synthetic_events
+        for status in get_args(ResponseStatus)
+        for uid in getattr(event.responses, f"{status}_uids")
+    }
+
+
+def test_group_list_members_to_columns(synthetic_groups: list[Group]) -> None:
+    """Test that there's a row per `Member` of each `Group`, with `Group` and
+    `Profile` uids.
+    """
+    # arrange
+    # act
+    columns = Group.list_members_to_columns(synthetic_groups)
+    # assert
+    assert columns["group_uid"] == [
+        group.uid for group in synthetic_groups for _ in group.members
+    ]
+    members = [member for group in synthetic_groups for member in group.members]
+    assert columns["uid"] == [member.uid for member in members]
+    assert columns["subgroup_uids"] == [member.subgroup_uids for member in members]
+    assert columns["profile_uid"] == [
+        member.profile.uid if member.profile else None for member in members
+    ]
+
+
+def test_group_members_to_columns(synthetic_groups: list[Group]) -> None:
+    """Test that columns are the same as for a list of the `Group`."""
+    # arrange
+    my_group = synthetic_groups[0]
+    # act
+    columns = my_group.members_to_columns()
+    # assert
+    assert columns == Group.list_members_to_columns([my_group])
+
+
+def test_to_record_batch(synthetic_events: list[Event]) -> None:
+    """Test that columns are converted to Arrow with explicit types."""
+    # arrange
+    pa = pytest.importorskip("pyarrow")
+    columns = Event.list_to_columns(synthetic_events)
+    # act
+    batch = to_record_batch(columns)
+    # assert
+    assert batch.num_rows == len(synthetic_events)
+    assert batch.schema.field("start_time").type == pa.timestamp("us", tz="UTC")
+    assert batch.column("uid").to_pylist() == columns["uid"]
+
+
+def test_to_record_batch__no_pyarrow_raises_import_error(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that ImportError is raised if pyarrow isn't installed."""
+    # arrange
+    monkeypatch.setitem(sys.modules, "pyarrow", None)
+    # assert
+    with pytest.raises(ImportError, match="pyarrow"):
+        to_record_batch({"uid": []})  # act
@@ -2,12 +2,16 @@
 
 from __future__ import annotations
 
+import copy
+import io
+import json
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING
 
 import pytest
+from pydantic import ValidationError
 
-from spond_classes import Event
+from spond_classes import Event, EventChanges, ResponseChange
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
@@ -84,6 +88,8 @@ def test_from_dict_simple(simple_event_data: DictFromJSON) -> None:
         "Event(uid='E1', heading='Event One', start_time: 2021-07-06 06:00:00+00:00, …)"
     )
     assert my_event.url == "https://spond.com/client/sponds/E1/"
+    assert my_event.is_cancelled is False
+    assert my_event.is_hidden is False
 
 
 def test_from_dict__not_dict_raises_type_error() -> None:
@@ -150,3 +156,337 @@ def test_from_dict_additional_fields(complex_event_data: DictFromJSON) -> None:
     # - properties:
     assert my_event.is_cancelled is True
     assert my_event.is_hidden is True
+
+
+def test_list_from_data__not_dict_item_raises_type_error(
+    simple_event_data: DictFromJSON,
+) -> None:
+    """Test that TypeError is raised if an item is not a `dict`."""
+    # arrange
+    my_event = Event.from_dict(simple_event_data)
+    # assert
+    with pytest.raises(TypeError):
+        # Ignore Mypy error - test purposely passes incompatible type
+        Event.list_from_data([simple_event_data, my_event])  # type: ignore[list-item]
+
+
+def test_list_from_data_complex(complex_events_data: list[DictFromJSON]) -> None:
+    """Test that `Event`s created in bulk match those created individually."""
+    # arrange
+    # act
+    my_events = Event.list_from_data(complex_events_data)
+    # assert
+    assert my_events == [Event.from_dict(item) for item in complex_events_data]
+
+
+def test_from_json(complex_event_data: DictFromJSON) -> None:
+    """Test that Event created from JSON matches that created from dict."""
+    # arrange
+    json_data = json.dumps(complex_event_data)
+    # act
+    my_event = Event.from_json(json_data)
+    # assert
+    assert my_event == Event.from_dict(complex_event_data)
+
+
+def test_list_from_json(complex_events_data: list[DictFromJSON]) -> None:
+    """Test that `Event`s created from JSON match those created from data."""
+    # arrange
+    json_data = json.dumps(complex_events_data).encode()
+    # act
+    my_events = Event.list_from_json(json_data)
+    # assert
+    assert my_events == Event.list_from_data(complex_events_data)
+
+
+def test_list_from_json__not_object_item_raises_validation_error() -> None:
+    """Test that ValidationError is raised if an item is not a JSON object."""
+    # assert
+    with pytest.raises(ValidationError):
+        Event.list_from_json('["Event One"]')  # act
+
+
+def test_list_to_json__round_trip(
+    complex_events_data: list[DictFromJSON], simple_events_data: list[DictFromJSON]
+) -> None:
+    """Test that `Event`s serialised to JSON match those constructed from it, with
+    Spond API keys.
+    """
+    # arrange
+    my_events = Event.list_from_data(complex_events_data + simple_events_data)
+    # act
+    json_data = Event.list_to_json(my_events)
+    # assert
+    assert Event.list_from_json(json_data) == my_events
+    items = json.loads(json_data)
+    assert [Event.from_dict(item) for item in items] == my_events
+    assert set(items[0]) <= {
+        field.alias or name for name, field in Event.model_fields.items()
+    }
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 1000])
+def test_list_to_json_file(
+    complex_events_data: list[DictFromJSON],
+    simple_events_data: list[DictFromJSON],
+    monkeypatch: pytest.MonkeyPatch,
+    chunk_size: int,
+) -> None:
+    """Test that JSON written in chunks from a generator matches `list_to_json()`."""
+    # arrange
+    monkeypatch.setattr("spond_classes._parsing._WRITE_CHUNK_SIZE", chunk_size)
+    my_events = Event.list_from_data(complex_events_data + simple_events_data)
+    file = io.BytesIO()
+    # act
+    Event.list_to_json_file(iter(my_events), file)
+    # assert
+    assert file.getvalue() == Event.list_to_json(my_events)
+    file.seek(0)
+    assert list(Event.iter_from_json_file(file)) == my_events
+
+
+def test_list_to_json_file__empty() -> None:
+    """Test that an empty JSON array is written for no `Event`s."""
+    # arrange
+    file = io.BytesIO()
+    # act
+    Event.list_to_json_file([], file)
+    # assert
+    assert file.getvalue() == b"[]"
+
+
+def test_iter_from_data(complex_events_data: list[DictFromJSON]) -> None:
+    """Test that `Event`s are yielded from data."""
+    # arrange
+    # act
+    my_events = Event.iter_from_data(iter(complex_events_data))
+    # assert
+    assert list(my_events) == Event.list_from_data(complex_events_data)
+
+
+@pytest.mark.parametrize("read_size", [1, 7, 64 * 1024])
+def test_iter_from_json_file__binary(
+    complex_events_data: list[DictFromJSON],
+    simple_events_data: list[DictFromJSON],
+    monkeypatch: pytest.MonkeyPatch,
+    read_size: int,
+) -> None:
+    """Test that `Event`s are yielded from a binary file read in chunks."""
+    # arrange
+    monkeypatch.setattr("spond_classes._parsing._READ_SIZE", read_size)
+    events_data = complex_events_data + simple_events_data
+    file = io.BytesIO(json.dumps(events_data, indent=2).encode())
+    # act
+    my_events = Event.iter_from_json_file(file)
+    # assert
+    assert list(my_events) == Event.list_from_data(events_data)
+
+
+def test_iter_from_json_file__text_empty_array() -> None:
+    """Test that nothing is yielded from a text file containing an empty array."""
+    # arrange
+    file = io.StringIO(" [ ] \n")
+    # act
+    my_events = Event.iter_from_json_file(file)
+    # assert
+    assert list(my_events) == []
+
+
+@pytest.mark.parametrize("json_data", ["", "{}", "[{", '[{"id": "E1"', "[,]", "[] []"])
+def test_iter_from_json_file__malformed_raises_json_decode_error(
+    json_data: str,
+) -> None:
+    """Test that JSONDecodeError is raised if file content is not a JSON array."""
+    # arrange
+    file = io.StringIO(json_data)
+    # assert
+    with pytest.raises(json.JSONDecodeError):
+        list(Event.iter_from_json_file(file))  # act
+
+
+def test_iter_from_json_file__not_object_item_raises_type_error() -> None:
+    """Test that TypeError is raised if an item is not a JSON object."""
+    # arrange
+    file = io.StringIO('["Event One"]')
+    # assert
+    with pytest.raises(TypeError):
+        list(Event.iter_from_json_file(file))  # act
+
+
+@pytest.mark.parametrize(
+    ("uid", "expected_status"),
+    [
+        ("AC1", "accepted"),
+        ("DC1", "declined"),
+        ("UA1", "unanswered"),
+        ("WL1", "waiting_list"),
+        ("UC1", "unconfirmed"),
+        ("DUMMY_ID", None),
+    ],
+)
+def test_response_status(
+    complex_event_data: DictFromJSON, uid: str, expected_status: str | None
+) -> None:
+    """Test that the status of a member's response is returned from their uid."""
+    # arrange
+    my_event = Event.from_dict(complex_event_data)
+    # act
+    my_status = my_event.response_status(uid)
+    # assert
+    assert my_status == expected_status
+
+
+def test_response_status__reassigned_list_is_reindexed(
+    complex_event_data: DictFromJSON,
+) -> None:
+    """Test that status reflects a `Responses` list after reassignment."""
+    # arrange
+    my_event = Event.from_dict(complex_event_data)
+    assert my_event.response_status("UA1") == "unanswered"
+    # act
+    my_event.responses.unanswered_uids = []
+    my_event.responses.accepted_uids = ["AC1", "UA1"]
+    # assert
+    assert my_event.response_status("UA1") == "accepted"
+    assert my_event.responses.uid_sets["accepted"] == {"AC1", "UA1"}
+
+
+def test_responses_uid_sets(complex_event_data: DictFromJSON) -> None:
+    """Test that sets of uids are returned for each response status."""
+    # arrange
+    my_event = Event.from_dict(complex_event_data)
+    # act
+    my_uid_sets = my_event.responses.uid_sets
+    # assert
+    assert my_uid_sets == {
+        "accepted": frozenset({"AC1"}),
+        "declined": frozenset({"DC1"}),
+        "unanswered": frozenset({"UA1"}),
+        "waiting_list": frozenset({"WL1"}),
+        "unconfirmed": frozenset({"UC1"}),
+    }
+
+
+def test_update_responses(complex_event_data: DictFromJSON) -> None:
+    """Test that response changes are applied and reported, in order."""
+    # arrange
+    my_event = Event.from_dict(complex_event_data)
+    new_responses = {
+        "acceptedIds": ["AC1", "UA1"],
+        "declinedIds": ["DC1", "NEW"],
+        "unansweredIds": [],
+        "waitinglistIds": ["WL1"],
+        "unconfirmedIds": [],
+    }
+    # act
+    changes = my_event.update_responses(new_responses)
+    # assert
+    assert changes == [
+        ResponseChange(uid="UA1", before="unanswered", after="accepted"),
+        ResponseChange(uid="NEW", before=None, after="declined"),
+        ResponseChange(uid="UC1", before="unconfirmed", after=None),
+    ]
+    assert my_event.response_status("UA1") == "accepted"
+    assert my_event.response_status("UC1") is None
+
+
+def test_update_responses__unchanged_keeps_instance(
+    complex_event_data: DictFromJSON,
+) -> None:
+    """Test that updating from the same responses keeps the `Responses` instance."""
+    # arrange
+    my_event = Event.from_dict(complex_event_data)
+    responses = my_event.responses
+    # act
+    changes = my_event.update_responses(complex_event_data["responses"])
+    # assert
+    assert changes == []
+    assert my_event.responses is responses
+
+
+def test_update_from_dict__fields_and_responses(
+    complex_event_data: DictFromJSON,
+) -> None:
+    """Test that changes to other fields and responses are applied and reported."""
+    # arrange
+    my_event = Event.from_dict(complex_event_data)
+    new_data = copy.deepcopy(complex_event_data)
+    new_data["heading"] = "Renamed"
+    new_data["responses"]["acceptedIds"] = []
+    # act
+    changes = my_event.update_from_dict(new_data)
+    # assert
+    assert changes == EventChanges(
+        fields=["heading"],
+        responses=[ResponseChange(uid="AC1", before="accepted", after=None)],
+    )
+    assert my_event == Event.from_dict(new_data)
+
+
+def test_update_from_dict__unchanged_fields_validates_only_responses(
+    complex_event_data: DictFromJSON, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that after the first update, if only responses change, only
+    `Responses` is validated.
+    """
+    # arrange
+    my_event = Event.from_dict(complex_event_data)
+    my_event.update_from_dict(complex_event_data)
+    new_data = copy.deepcopy(complex_event_data)
+    new_data["responses"]["declinedIds"] = ["DC1", "AC1"]
+    new_data["responses"]["acceptedIds"] = []
+
+    def fail(*_args: object, **_kwargs: object) -> None:
+        raise AssertionError
+
+    monkeypatch.setattr(Event, "model_validate", fail)
+    # act
+    changes = my_event.update_from_dict(new_data)
+    # assert
+    assert changes == EventChanges(
+        responses=[ResponseChange(uid="AC1", before="accepted", after="declined")]
+    )
+
+
+def test_update_from_dict__after_reassignment(
+    complex_event_data: DictFromJSON,
+) -> None:
+    """Test that other fields are compared after a field is reassigned, discarding
+    the fingerprint.
+    """
+    # arrange
+    my_event = Event.from_dict(complex_event_data)
+    my_event.update_from_dict(complex_event_data)
+    my_event.heading = "Changed locally"
+    # act
+    changes = my_event.update_from_dict(complex_event_data)
+    # assert
+    assert changes.fields == ["heading"]
+    assert my_event.heading == "Event Two"
+
+
+def test_update_from_dict__different_uid_raises_value_error(
+    simple_event_data: DictFromJSON, complex_event_data: DictFromJSON
+) -> None:
+    """Test that ValueError is raised if data is for a different `Event`."""
+    # arrange
+    my_event = Event.from_dict(simple_event_data)
+    # assert
+    with pytest.raises(ValueError, match="Can't update"):
+        my_event.update_from_dict(complex_event_data)  # act
+
+
+def test_update_from_dict__invalid_leaves_event_unchanged(
+    complex_event_data: DictFromJSON,
+) -> None:
+    """Test that invalid data raises ValidationError without changing the `Event`."""
+    # arrange
+    my_event = Event.from_dict(complex_event_data)
+    new_data = copy.deepcopy(complex_event_data)
+    new_data["heading"] = "Renamed"
+    new_data["responses"]["acceptedIds"] = None
+    # act
+    with pytest.raises(ValidationError):
+        my_event.update_from_dict(new_data)
+    # assert
+    assert my_event == Event.from_dict(complex_event_data)
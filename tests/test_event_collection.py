@@ -0,0 +1,193 @@
+"""Tests for EventCollection class."""
+
+from __future__ import annotations
+
+import time
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING
+
+import pytest
+
+from spond_classes import Event, EventCollection
+from spond_classes.synthetic import iter_events_data
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from spond_classes.typing import DictFromJSON
+
+_T0 = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def _event(uid: str, start: int, end: int, **kwargs: object) -> Event:
+    """Return an `Event` starting and ending at hours after `_T0`."""
+    return Event.from_dict(
+        {
+            "id": uid,
+            "heading": uid,
+            "responses": {
+                "acceptedIds": [],
+                "declinedIds": [],
+                "unansweredIds": [],
+                "waitinglistIds": [],
+                "unconfirmedIds": [],
+            },
+            "type": "EVENT",
+            "createdTime": _T0.isoformat(),
+            "startTimestamp": (_T0 + timedelta(hours=start)).isoformat(),
+            "endTimestamp": (_T0 + timedelta(hours=end)).isoformat(),
+            **kwargs,
+        }
+    )
+
+
+def _hours(hours: int) -> datetime:
+    """Return the datetime `hours` after `_T0`."""
+    return _T0 + timedelta(hours=hours)
+
+
+@pytest.fixture
+def collection() -> EventCollection:
+    """Events, not in start time order, including a long one."""
+    return EventCollection(
+        [
+            _event("E3", 4, 5, type="RECURRING"),
+            _event("E1", 0, 1),
+            _event("LONG", 1, 100, cancelled=True),
+            _event("E2", 2, 3, hidden=True),
+            _event("E4", 6, 7, type="RECURRING", cancelled=False),
+        ]
+    )
+
+
+def _uids(events: EventCollection | list[Event]) -> list[str]:
+    """Return the uids of `events`, in order."""
+    return [event.uid for event in events]
+
+
+def test_init__sorted_by_start_time(collection: EventCollection) -> None:
+    """Test that `Event`s are in start time order."""
+    # arrange
+    # act
+    uids = _uids(collection)
+    # assert
+    assert uids == ["E1", "LONG", "E2", "E3", "E4"]
+    assert collection[0].uid == "E1"
+    assert _uids(collection[-2:]) == ["E3", "E4"]
+    assert len(collection) == 5  # noqa: PLR2004
+    assert str(collection) == "EventCollection(5 events)"
+
+
+@pytest.mark.parametrize(
+    ("start", "end", "expected"),
+    [
+        (0, 100, ["E1", "LONG", "E2", "E3", "E4"]),
+        (1, 4, ["LONG", "E2"]),  # start inclusive, end exclusive
+        (3, 4, []),
+        (7, 0, []),
+    ],
+)
+def test_starting_between(
+    collection: EventCollection, start: int, end: int, expected: list[str]
+) -> None:
+    """Test that `Event`s starting in a half-open range are found."""
+    # arrange
+    # act
+    found = collection.starting_between(_hours(start), _hours(end))
+    # assert
+    assert _uids(found) == expected
+
+
+@pytest.mark.parametrize(
+    ("start", "end", "expected"),
+    [
+        (3, 6, ["LONG", "E3"]),  # excludes events ending at `start`, starting at `end`
+        (50, 60, ["LONG"]),
+        (0, 1, ["E1"]),
+        (100, 200, []),
+    ],
+)
+def test_overlapping(
+    collection: EventCollection, start: int, end: int, expected: list[str]
+) -> None:
+    """Test that `Event`s in progress during a range are found."""
+    # arrange
+    # act
+    found = collection.overlapping(_hours(start), _hours(end))
+    # assert
+    assert _uids(found) == expected
+
+
+@pytest.fixture
+def non_utc_local_time(monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+    """Set local time to a timezone other than UTC, for the duration of a test."""
+    if not hasattr(time, "tzset"):
+        pytest.skip("Local timezone can't be set on this platform.")
+    monkeypatch.setenv("TZ", "EST+05EDT,M3.2.0,M11.1.0")
+    time.tzset()
+    yield
+    monkeypatch.undo()
+    time.tzset()
+
+
+@pytest.mark.usefixtures("non_utc_local_time")
+def test_starting_between__naive_as_utc(collection: EventCollection) -> None:
+    """Test that naive datetimes are treated as UTC, not local time, as by
+    `EventStore`.
+    """
+    # arrange
+    start, end = _hours(1).replace(tzinfo=None), _hours(4).replace(tzinfo=None)
+    # act
+    found = collection.starting_between(start, end)
+    overlapping = collection.overlapping(start, end)
+    # assert
+    assert _uids(found) == ["LONG", "E2"]
+    assert _uids(overlapping) == ["LONG", "E2"]
+
+
+def test_overlapping__matches_scan(synthetic_group_data: DictFromJSON) -> None:
+    """Test that results match a full scan, for many events."""
+    # arrange
+    my_events = Event.list_from_data(iter_events_data(synthetic_group_data, events=200))
+    collection = EventCollection(my_events)
+    start, end = my_events[50].start_time, my_events[60].end_time
+    # act
+    found = collection.overlapping(start, end)
+    # assert
+    assert found == [
+        event
+        for event in my_events
+        if event.start_time < end and event.end_time > start
+    ]
+
+
+@pytest.mark.parametrize(
+    ("criteria", "expected"),
+    [
+        ({}, ["E1", "LONG", "E2", "E3", "E4"]),
+        ({"type": "RECURRING"}, ["E3", "E4"]),
+        ({"type": "AVAILABILITY"}, []),
+        ({"cancelled": True}, ["LONG"]),
+        ({"cancelled": False}, ["E1", "E2", "E3", "E4"]),
+        ({"hidden": True}, ["E2"]),
+        ({"type": "EVENT", "cancelled": False, "hidden": False}, ["E1"]),
+    ],
+)
+def test_where(
+    collection: EventCollection, criteria: dict[str, object], expected: list[str]
+) -> None:
+    """Test that `Event`s are filtered by each criterion, and combinations."""
+    # arrange
+    # act
+    found = collection.where(**criteria)  # type: ignore[arg-type]
+    # assert
+    assert _uids(found) == expected
+
+
+def test_where__result_supports_queries(collection: EventCollection) -> None:
+    """Test that a filtered collection supports further queries."""
+    # arrange
+    # act
+    found = collection.where(cancelled=False).overlapping(_hours(0), _hours(3))
+    # assert
+    assert _uids(found) == ["E1", "E2"]
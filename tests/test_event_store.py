@@ -0,0 +1,143 @@
+"""Tests for EventStore class."""
+
+from __future__ import annotations
+
+import stat
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING
+
+import pytest
+
+from spond_classes import Event, EventStore
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+_MIN = datetime.min.replace(tzinfo=timezone.utc)
+_MAX = datetime.max.replace(tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def store(tmp_path: Path, synthetic_events: list[Event]) -> EventStore:
+    """Store of `synthetic_events`, written in reverse start time order."""
+    path = tmp_path / "events.store"
+    EventStore.write(path, synthetic_events[::-1])
+    return EventStore(path)
+
+
+def _by_start_time(events: list[Event]) -> list[Event]:
+    """Return `events` sorted by start time."""
+    return sorted(events, key=lambda event: event.start_time)
+
+
+def test_len_iter__in_start_time_order(
+    store: EventStore, synthetic_events: list[Event]
+) -> None:
+    """Test that all `Event`s are stored, and iterated in start time order."""
+    # arrange
+    # act
+    stored = list(store)
+    # assert
+    assert len(store) == len(synthetic_events)
+    assert stored == _by_start_time(synthetic_events)
+
+
+def test_event_by_uid(store: EventStore, synthetic_events: list[Event]) -> None:
+    """Test that each `Event` is found by uid."""
+    # arrange
+    # act
+    found = [store.event_by_uid(event.uid) for event in synthetic_events]
+    # assert
+    assert found == synthetic_events
+    assert all(event.uid in store for event in synthetic_events)
+
+
+def test_event_by_uid__not_found_raises_lookup_error(store: EventStore) -> None:
+    """Test that LookupError is raised if the uid is not found."""
+    # arrange
+    # assert
+    assert "DUMMY_ID" not in store
+    with pytest.raises(LookupError):
+        store.event_by_uid("DUMMY_ID")  # act
+
+
+def test_starting_between(store: EventStore, synthetic_events: list[Event]) -> None:
+    """Test that `Event`s starting in a half-open range are found, in order."""
+    # arrange
+    ordered = _by_start_time(synthetic_events)
+    start, end = ordered[5].start_time, ordered[10].start_time
+    # act
+    found = list(store.starting_between(start, end))
+    # assert
+    assert found == ordered[5:10]
+
+
+def test_starting_between__naive_as_utc(
+    store: EventStore, synthetic_events: list[Event]
+) -> None:
+    """Test that naive datetimes are treated as UTC."""
+    # arrange
+    first = min(event.start_time for event in synthetic_events)
+    naive = first.astimezone(timezone.utc).replace(tzinfo=None)
+    # act
+    found = list(store.starting_between(naive, _MAX))
+    # assert
+    assert len(found) == len(synthetic_events)
+
+
+@pytest.mark.parametrize("reverse", [False, True])
+def test_starting_between__empty_range(store: EventStore, *, reverse: bool) -> None:
+    """Test that an empty or reversed range finds nothing."""
+    # arrange
+    now = datetime.now(tz=timezone.utc)
+    start, end = (_MAX, _MIN) if reverse else (now, now)
+    # act
+    found = list(store.starting_between(start, end))
+    # assert
+    assert found == []
+
+
+def test_empty_store(tmp_path: Path) -> None:
+    """Test that a store of no `Event`s can be written and opened."""
+    # arrange
+    path = tmp_path / "empty.store"
+    EventStore.write(path, [])
+    # act
+    with EventStore(path) as store:
+        # assert
+        assert len(store) == 0
+        assert "DUMMY_ID" not in store
+        assert list(store.starting_between(_MIN, _MAX)) == []
+
+
+def test_write__mode_as_new_file(tmp_path: Path) -> None:
+    """Test that the file has the same permissions as a file created by `open()`."""
+    # arrange
+    path = tmp_path / "events.store"
+    new_path = tmp_path / "new"
+    new_path.touch()
+    # act
+    EventStore.write(path, [])
+    # assert
+    assert stat.S_IMODE(path.stat().st_mode) == stat.S_IMODE(new_path.stat().st_mode)
+
+
+def test_close__constructed_events_remain_usable(store: EventStore) -> None:
+    """Test that `Event`s constructed before closing remain usable."""
+    # arrange
+    my_event = next(iter(store))
+    # act
+    store.close()
+    # assert
+    assert my_event.uid
+
+
+@pytest.mark.parametrize("content", [b"", b"not an event store"])
+def test_open__invalid_raises_value_error(tmp_path: Path, content: bytes) -> None:
+    """Test that ValueError is raised if the file isn't a store."""
+    # arrange
+    path = tmp_path / "invalid.store"
+    path.write_bytes(content)
+    # assert
+    with pytest.raises(ValueError, match="not an event store"):
+        EventStore(path)  # act
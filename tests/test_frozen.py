@@ -0,0 +1,225 @@
+"""Tests for frozen model variants."""
+
+from __future__ import annotations
+
+import copy
+import io
+import json
+from types import MappingProxyType
+from typing import TYPE_CHECKING
+
+import pytest
+from pydantic import ValidationError
+
+from spond_classes import (
+    Event,
+    FieldDef,
+    FrozenEvent,
+    FrozenGroup,
+    FrozenProfile,
+    Group,
+    Member,
+    Profile,
+    Responses,
+    Role,
+    Subgroup,
+)
+from spond_classes.frozen import (
+    FrozenFieldDef,
+    FrozenMember,
+    FrozenResponses,
+    FrozenRole,
+    FrozenSubgroup,
+)
+
+if TYPE_CHECKING:
+    from pydantic import BaseModel
+
+    from spond_classes.typing import DictFromJSON
+
+_PAIRS = [
+    (Event, FrozenEvent),
+    (Responses, FrozenResponses),
+    (Group, FrozenGroup),
+    (Member, FrozenMember),
+    (Profile, FrozenProfile),
+    (Role, FrozenRole),
+    (Subgroup, FrozenSubgroup),
+    (FieldDef, FrozenFieldDef),
+]
+
+
+def test_list_from_data__tuples(synthetic_groups_data: list[DictFromJSON]) -> None:
+    """Test that collections are tuples, and custom fields a read-only mapping."""
+    # arrange
+    # act
+    my_group = FrozenGroup.list_from_data(synthetic_groups_data)[0]
+    # assert
+    assert isinstance(my_group.members, tuple)
+    assert isinstance(my_group.roles, tuple)
+    assert isinstance(my_group.members[0].subgroup_uids, tuple)
+    assert isinstance(my_group.members[0].fields, MappingProxyType)
+
+
+@pytest.mark.parametrize("trusted", [False, True])
+def test_list_from_data__same_as_from_model(
+    synthetic_groups_data: list[DictFromJSON], *, trusted: bool
+) -> None:
+    """Test that construction from data, with and without validation, is the same
+    as from the mutable model.
+    """
+    # arrange
+    data = json.loads(json.dumps(synthetic_groups_data, default=str))
+    # act
+    my_groups = FrozenGroup.list_from_data(data, trusted=trusted)
+    # assert
+    expected = [FrozenGroup.from_model(group) for group in Group.list_from_data(data)]
+    assert my_groups == expected
+    assert isinstance(my_groups[0].members[0].fields, MappingProxyType)
+    assert isinstance(my_groups[0].members[0].subgroup_uids, tuple)
+
+
+def test_assignment_raises_validation_error(
+    synthetic_events_data: list[DictFromJSON],
+) -> None:
+    """Test that ValidationError is raised if a field is assigned."""
+    # arrange
+    my_event = FrozenEvent.from_dict(synthetic_events_data[0])
+    # assert
+    with pytest.raises(ValidationError, match="frozen"):
+        my_event.heading = "Renamed"  # type: ignore[misc]  # act
+
+
+def test_hash__by_uid(synthetic_events_data: list[DictFromJSON]) -> None:
+    """Test that hash is by `uid`, and instances are usable as `dict` keys."""
+    # arrange
+    my_event = FrozenEvent.from_dict(synthetic_events_data[0])
+    equal = FrozenEvent.from_model(Event.from_dict(synthetic_events_data[0]))
+    modified = FrozenEvent.from_dict({**synthetic_events_data[0], "heading": "Renamed"})
+    # act
+    counts = {my_event: 1}
+    # assert
+    assert hash(my_event) == hash(my_event.uid) == hash(modified)
+    assert equal in counts
+    assert modified not in counts
+    assert hash(my_event.responses) == hash(equal.responses)
+
+
+def test_round_trip_to_mutable(synthetic_events_data: list[DictFromJSON]) -> None:
+    """Test that serialised data of a frozen model constructs an equal mutable
+    model.
+    """
+    # arrange
+    my_event = Event.from_dict(synthetic_events_data[0])
+    # act
+    frozen = FrozenEvent.from_model(my_event)
+    # assert
+    assert Event.from_dict(frozen.model_dump(by_alias=True)) == my_event
+    assert frozen.model_dump_json(by_alias=True) == my_event.model_dump_json(
+        by_alias=True
+    )
+    assert frozen.response_status(my_event.responses.accepted_uids[0]) == "accepted"
+
+
+def test_update_responses__unchanged(
+    synthetic_events_data: list[DictFromJSON],
+) -> None:
+    """Test that updating from the same data, including only responses changed
+    since the last update, doesn't raise ValidationError.
+    """
+    # arrange
+    my_event = FrozenEvent.from_dict(synthetic_events_data[0])
+    responses = synthetic_events_data[0]["responses"]
+    my_event.update_from_dict(synthetic_events_data[0])
+    responses_only = {**synthetic_events_data[0], "responses": copy.deepcopy(responses)}
+    # act
+    response_changes = my_event.update_responses(responses)
+    changes = my_event.update_from_dict(responses_only)
+    # assert
+    assert response_changes == []
+    assert not changes
+    assert isinstance(my_event.responses, FrozenResponses)
+
+
+def test_update_responses__changed_raises_validation_error(
+    synthetic_events_data: list[DictFromJSON],
+) -> None:
+    """Test that ValidationError is raised if responses changed."""
+    # arrange
+    my_event = FrozenEvent.from_dict(synthetic_events_data[0])
+    responses = {**synthetic_events_data[0]["responses"], "acceptedIds": []}
+    # assert
+    with pytest.raises(ValidationError, match="frozen"):
+        my_event.update_responses(responses)  # act
+
+
+@pytest.mark.filterwarnings("error")
+def test_list_to_json__by_mutable_class(
+    synthetic_events_data: list[DictFromJSON],
+    synthetic_groups_data: list[DictFromJSON],
+) -> None:
+    """Test that frozen instances, alone or mixed with mutable ones, are serialised
+    by the mutable class without warnings, as by the frozen class.
+    """
+    # arrange
+    events = Event.list_from_data(synthetic_events_data)
+    frozen_events = [FrozenEvent.from_model(event) for event in events]
+    groups = Group.list_from_data(synthetic_groups_data)
+    frozen_groups = [
+        FrozenGroup.from_dict(item, lazy_members=lazy)
+        for item, lazy in zip(synthetic_groups_data, [False, True, False], strict=True)
+    ]
+    file = io.BytesIO()
+    # act
+    events_json = Event.list_to_json([*frozen_events[:10], *events[10:]])
+    groups_json = Group.list_to_json(frozen_groups)
+    Group.list_to_json_file(frozen_groups, file)
+    # assert
+    assert events_json == FrozenEvent.list_to_json(frozen_events)
+    assert events_json == Event.list_to_json(events)
+    assert groups_json == FrozenGroup.list_to_json(frozen_groups)
+    assert groups_json == Group.list_to_json(groups)
+    assert file.getvalue() == groups_json
+
+
+def test_member_by_uid(synthetic_groups_data: list[DictFromJSON]) -> None:
+    """Test that a `FrozenMember` is found by uid."""
+    # arrange
+    my_group = FrozenGroup.from_dict(synthetic_groups_data[0])
+    my_member = my_group.members[-1]
+    # act
+    found = my_group.member_by_uid(my_member.uid)
+    # assert
+    assert found is my_member
+
+
+def test_member_by_uid__not_found_raises_lookup_error(
+    synthetic_groups_data: list[DictFromJSON],
+) -> None:
+    """Test that LookupError is raised if the uid is not found."""
+    # arrange
+    my_group = FrozenGroup.from_dict(synthetic_groups_data[0])
+    # assert
+    with pytest.raises(LookupError, match="No Member found with id='DUMMY_ID'"):
+        my_group.member_by_uid("DUMMY_ID")  # act
+
+
+@pytest.mark.parametrize(("mutable", "frozen"), _PAIRS)
+def test_parity(mutable: type[BaseModel], frozen: type[BaseModel]) -> None:
+    """Test that each frozen variant has the same fields, aliases and public
+    attributes as its mutable model, except `from_model()`.
+    """
+
+    # arrange
+    def public(model: type[BaseModel]) -> set[str]:
+        return {name for name in dir(model) if not name.startswith("_")}
+
+    # act
+    aliases = {name: field.alias for name, field in frozen.model_fields.items()}
+    attributes = public(frozen) - {"from_model"}
+    # assert
+    assert issubclass(frozen, mutable)
+    assert aliases == {
+        name: field.alias for name, field in mutable.model_fields.items()
+    }
+    assert attributes == public(mutable)
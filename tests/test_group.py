@@ -2,11 +2,19 @@
 
 from __future__ import annotations
 
+import copy
+import io
+import json
+import math
 from typing import TYPE_CHECKING
 
 import pytest
+from pydantic import ValidationError
 
-from spond_classes import Group
+from spond_classes import Group, GroupChanges, Profile, Subgroup
+from spond_classes import group as group_module
+from spond_classes._parsing import _list_adapter
+from spond_classes.synthetic import group_data, iter_groups_data
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
@@ -296,3 +304,391 @@ def test_members_by_role__not_role_raises_type_error(complex_group: Group) -> No
         my_group.members_by_role(
             subgroup_not_role  # type: ignore[arg-type]
         )
+
+
+def test_member_by_uid__reassigned_members_are_reindexed(complex_group: Group) -> None:
+    """Test that lookup reflects `members` after reassignment."""
+    # arrange
+    my_group = complex_group
+    my_member = my_group.member_by_uid("G2M1")
+    # act
+    my_group.members = []
+    # assert
+    with pytest.raises(LookupError):
+        my_group.member_by_uid("G2M1")
+    my_group.members = [my_member]
+    assert my_group.member_by_uid("G2M1") is my_member
+
+
+def test_member_by_uid__duplicate_uid_returns_first(
+    complex_group_data: DictFromJSON,
+) -> None:
+    """Test that the first Member is returned if `uid`s aren't unique."""
+    # arrange
+    member_data = complex_group_data["members"][0]
+    complex_group_data["members"].append({**member_data, "firstName": "Other"})
+    my_group = Group.from_dict(complex_group_data)
+    # act
+    my_member = my_group.member_by_uid("G2M1")
+    # assert
+    assert my_member.first_name == "Brendan"
+
+
+def test_lookup_index_does_not_affect_equality(
+    complex_group_data: DictFromJSON,
+) -> None:
+    """Test that building lookup indexes doesn't change `Group` equality."""
+    # arrange
+    my_group = Group.from_dict(complex_group_data)
+    other_group = Group.from_dict(complex_group_data)
+    # act
+    my_group.member_by_uid("G2M1")
+    # assert
+    assert my_group == other_group
+    assert my_group.model_dump() == other_group.model_dump()
+
+
+def test_member_by_uid__model_copy_update_is_reindexed(complex_group: Group) -> None:
+    """Test that lookup reflects `members` updated by `model_copy()`."""
+    # arrange
+    my_group = complex_group
+    my_group.member_by_uid("G2M1")
+    # act
+    my_copy = my_group.model_copy(update={"members": []})
+    # assert
+    with pytest.raises(LookupError):
+        my_copy.member_by_uid("G2M1")
+
+
+def test_members_by_subgroup_uid(complex_group: Group) -> None:
+    """Test that Members are indexed by the uid of each Subgroup they're in."""
+    # arrange
+    my_group = complex_group
+    my_group.subgroups.append(Subgroup(id="G2S2", name="Empty Subgroup"))
+    # act
+    my_index = my_group.members_by_subgroup_uid
+    # assert
+    assert [member.uid for member in my_index["G2S1"]] == ["G2M1"]
+    assert my_index["G2S2"] == ()
+
+
+def test_members_by_role_uid(complex_group: Group) -> None:
+    """Test that Members are indexed by the uid of each Role they have."""
+    # arrange
+    my_group = complex_group
+    # act
+    my_index = my_group.members_by_role_uid
+    # assert
+    assert [member.uid for member in my_index["G2R1"]] == ["G2M1"]
+
+
+def test_members_by_subgroup__result_is_independent_of_index(
+    complex_group: Group,
+) -> None:
+    """Test that mutating the returned list doesn't affect later calls."""
+    # arrange
+    my_group = complex_group
+    my_subgroup = my_group.subgroup_by_uid("G2S1")
+    # act
+    my_group.members_by_subgroup(my_subgroup).clear()
+    # assert
+    assert len(my_group.members_by_subgroup(my_subgroup)) == 1
+
+
+def test_list_from_data__not_dict_item_raises_type_error(
+    simple_group_data: DictFromJSON,
+) -> None:
+    """Test that TypeError is raised if an item is not a `dict`."""
+    # arrange
+    not_dict = "Group Two"
+    # assert
+    with pytest.raises(TypeError):
+        # Ignore Mypy error - test purposely passes incompatible type
+        Group.list_from_data([simple_group_data, not_dict])  # type: ignore[list-item]
+
+
+def test_from_json(complex_group_data: DictFromJSON) -> None:
+    """Test that Group created from JSON matches that created from dict."""
+    # arrange
+    json_data = json.dumps(complex_group_data)
+    # act
+    my_group = Group.from_json(json_data)
+    # assert
+    assert my_group == Group.from_dict(complex_group_data)
+
+
+def test_list_from_json(simple_groups_data: list[DictFromJSON]) -> None:
+    """Test that `Group`s created from JSON match those created from data."""
+    # arrange
+    json_data = json.dumps(simple_groups_data).encode()
+    # act
+    my_groups = Group.list_from_json(json_data)
+    # assert
+    assert my_groups == Group.list_from_data(simple_groups_data)
+
+
+def test_list_to_json__round_trip(
+    simple_group_data: DictFromJSON, complex_group_data: DictFromJSON
+) -> None:
+    """Test that `Group`s, including lazy `members`, serialised to JSON match those
+    constructed from it.
+    """
+    # arrange
+    my_groups = [
+        Group.from_dict(simple_group_data),
+        Group.from_dict(complex_group_data, lazy_members=True),
+    ]
+    # act
+    json_data = Group.list_to_json(my_groups)
+    # assert
+    assert Group.list_from_json(json_data) == [
+        Group.from_dict(simple_group_data),
+        Group.from_dict(complex_group_data),
+    ]
+
+
+def test_list_to_json_file(
+    simple_group_data: DictFromJSON, complex_group_data: DictFromJSON
+) -> None:
+    """Test that `Group`s written to a file match `list_to_json()`."""
+    # arrange
+    my_groups = Group.list_from_data([simple_group_data, complex_group_data])
+    file = io.BytesIO()
+    # act
+    Group.list_to_json_file(my_groups, file)
+    # assert
+    assert file.getvalue() == Group.list_to_json(my_groups)
+
+
+def test_iter_from_json_file(simple_groups_data: list[DictFromJSON]) -> None:
+    """Test that `Group`s are yielded from a JSON file."""
+    # arrange
+    file = io.StringIO(json.dumps(simple_groups_data))
+    # act
+    my_groups = Group.iter_from_json_file(file)
+    # assert
+    assert list(my_groups) == Group.list_from_data(simple_groups_data)
+
+
+def test_iter_from_json_file__item_larger_than_read_size(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that a `Group` many times the read size is yielded, reading the file in
+    a number of chunks logarithmic in its size.
+    """
+    # arrange
+    read_size = 64
+    monkeypatch.setattr("spond_classes._parsing._READ_SIZE", read_size)
+    groups_data = [group_data(members=50), group_data(members=1)]
+    json_data = json.dumps(groups_data).encode()
+    file = io.BytesIO(json_data)
+    read_sizes: list[int] = []
+    read = file.read
+
+    def counting_read(size: int = -1) -> bytes:
+        read_sizes.append(size)
+        return read(size)
+
+    monkeypatch.setattr(file, "read", counting_read)
+    # act
+    my_groups = list(Group.iter_from_json_file(file))
+    # assert
+    assert my_groups == Group.list_from_data(groups_data)
+    assert len(json_data) > 100 * read_size
+    # Logarithmic in size of the first item, then a few for the second, end of file
+    assert len(read_sizes) < math.log2(len(json_data) / read_size) + 5
+    assert max(read_sizes) > read_size
+
+
+def test_iter_from_json_file__malformed_item_raises_before_end_of_file(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that JSONDecodeError is raised for a malformed `Group` without reading
+    the rest of the file.
+    """
+    # arrange
+    groups_data = list(iter_groups_data(groups=4, members=100))
+    json_data = json.dumps(groups_data).replace('"name": ', '"name" ', 1).encode()
+    file = io.BytesIO(json_data)
+    read_sizes: list[int] = []
+    read = file.read
+
+    def counting_read(size: int = -1) -> bytes:
+        read_sizes.append(size)
+        return read(size)
+
+    monkeypatch.setattr(file, "read", counting_read)
+    # assert
+    with pytest.raises(json.JSONDecodeError, match="Expecting ':' delimiter"):
+        list(Group.iter_from_json_file(file))  # act
+    assert sum(read_sizes) < len(json_data) / 2
+
+
+def test_from_dict__trusted(complex_group_data: DictFromJSON) -> None:
+    """Test that trusted Group, with nested models, matches validated Group."""
+    # arrange
+    # act
+    my_group = Group.from_dict(complex_group_data, trusted=True)
+    # assert
+    assert my_group == Group.from_dict(complex_group_data)
+    assert isinstance(my_group.members[0].profile, Profile)
+    assert my_group.member_by_uid("G2M1").full_name == "Brendan Gleason"
+
+
+def test_from_dict__lazy_members(complex_group_data: DictFromJSON) -> None:
+    """Test that lazy Members are only constructed on access, then cached."""
+    # arrange
+    complex_group_data["members"].append({"id": "INVALID"})
+    # act
+    my_group = Group.from_dict(complex_group_data, lazy_members=True)
+    # assert
+    assert len(my_group.members) == 2  # noqa: PLR2004
+    my_member = my_group.members[0]
+    assert my_member.full_name == "Brendan Gleason"
+    assert my_group.members[0] is my_member
+    with pytest.raises(ValidationError):
+        my_group.members[1]
+
+
+def test_from_dict__lazy_members_match_eager(complex_group_data: DictFromJSON) -> None:
+    """Test that Group with lazy Members matches Group with eager Members."""
+    # arrange
+    # act
+    my_group = Group.from_dict(complex_group_data, lazy_members=True)
+    # assert
+    my_eager_group = Group.from_dict(complex_group_data)
+    assert my_group.model_dump() == my_eager_group.model_dump()
+    assert my_group == my_eager_group
+    assert my_group.member_by_uid("G2M1") == my_eager_group.members[0]
+    assert my_group.members[:] == my_eager_group.members
+
+
+def test_list_from_data__lazy_members_trusted(
+    complex_group_data: DictFromJSON,
+) -> None:
+    """Test that Groups with lazy, trusted Members match eager Groups."""
+    # arrange
+    # act
+    my_groups = Group.list_from_data(
+        [complex_group_data], trusted=True, lazy_members=True
+    )
+    # assert
+    assert my_groups == [Group.from_dict(complex_group_data)]
+
+
+def test_update_from_dict__unchanged(complex_group_data: DictFromJSON) -> None:
+    """Test that updating from the same data changes nothing, keeping instances."""
+    # arrange
+    my_group = Group.from_dict(complex_group_data)
+    member = my_group.members[0]
+    # act
+    changes = my_group.update_from_dict(copy.deepcopy(complex_group_data))
+    # assert
+    assert not changes
+    assert changes == GroupChanges()
+    assert my_group.members[0] is member
+
+
+def test_update_from_dict__changes() -> None:
+    """Test that added, removed and modified items are reported and applied, and
+    unchanged ones kept.
+    """
+    # arrange
+    data = group_data(members=5, roles=2)
+    my_group = Group.from_dict(data)
+    modified = my_group.members[1]
+    unchanged = my_group.members[2]
+    new_data = copy.deepcopy(data)
+    new_data["name"] = "Renamed"
+    removed = new_data["members"].pop(0)
+    new_data["members"][0]["firstName"] = "Changed"
+    added = {**new_data["members"][1], "id": "NEW"}
+    new_data["members"].append(added)
+    new_data["roles"][0]["name"] = "Changed"
+    # act
+    changes = my_group.update_from_dict(new_data)
+    # assert
+    assert changes.fields == ["name"]
+    assert changes.members.added == ["NEW"]
+    assert changes.members.removed == [removed["id"]]
+    assert changes.members.modified == [modified.uid]
+    assert changes.roles.modified == [data["roles"][0]["id"]]
+    assert not changes.subgroups
+    assert my_group.name == "Renamed"
+    assert my_group.member_by_uid(unchanged.uid) is unchanged
+    assert my_group.member_by_uid(modified.uid).first_name == "Changed"
+    assert my_group.member_by_uid("NEW").last_name == added["lastName"]
+    with pytest.raises(LookupError):
+        my_group.member_by_uid(removed["id"])
+    assert my_group == Group.from_dict(new_data)
+
+
+def test_update_from_dict__validates_only_changed_items(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that after the first update, only changed items are validated."""
+    # arrange
+    data = group_data(members=20)
+    my_group = Group.from_dict(data)
+    my_group.update_from_dict(data)
+    new_data = copy.deepcopy(data)
+    new_data["members"][3]["lastName"] = "Changed"
+    validated_counts = []
+
+    def spy(model: type) -> object:
+        adapter = _list_adapter(model)
+
+        class Spy:
+            def validate_python(self, items: list[DictFromJSON]) -> object:
+                validated_counts.append(len(items))
+                return adapter.validate_python(items)
+
+        return Spy()
+
+    monkeypatch.setattr(group_module, "_list_adapter", spy)
+    # act
+    changes = my_group.update_from_dict(new_data)
+    # assert
+    assert changes.members.modified == [data["members"][3]["id"]]
+    assert validated_counts == [1, 0, 0, 0]
+
+
+def test_update_from_dict__after_reassignment(complex_group_data: DictFromJSON) -> None:
+    """Test that changes are found after a field is reassigned, discarding
+    fingerprints.
+    """
+    # arrange
+    my_group = Group.from_dict(complex_group_data)
+    my_group.update_from_dict(complex_group_data)
+    my_group.members = []
+    # act
+    changes = my_group.update_from_dict(complex_group_data)
+    # assert
+    assert changes.members.added == ["G2M1"]
+    assert my_group.member_by_uid("G2M1").first_name == "Brendan"
+
+
+def test_update_from_dict__different_uid_raises_value_error(
+    simple_group: Group, complex_group_data: DictFromJSON
+) -> None:
+    """Test that ValueError is raised if data is for a different `Group`."""
+    # arrange
+    # assert
+    with pytest.raises(ValueError, match="Can't update"):
+        simple_group.update_from_dict(complex_group_data)  # act
+
+
+def test_update_from_dict__invalid_leaves_group_unchanged(
+    complex_group_data: DictFromJSON,
+) -> None:
+    """Test that invalid data raises ValidationError without changing the `Group`."""
+    # arrange
+    my_group = Group.from_dict(complex_group_data)
+    new_data = copy.deepcopy(complex_group_data)
+    new_data["name"] = "Renamed"
+    del new_data["members"][0]["firstName"]
+    # act
+    with pytest.raises(ValidationError):
+        my_group.update_from_dict(new_data)
+    # assert
+    assert my_group == Group.from_dict(complex_group_data)
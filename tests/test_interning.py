@@ -0,0 +1,117 @@
+"""Tests for UidTable class."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from spond_classes import Event, Group, UidTable
+
+if TYPE_CHECKING:
+    from spond_classes.typing import DictFromJSON
+
+
+def _copy(uid: str) -> str:
+    """Return a `str` equal to `uid`, but not the same object."""
+    return "".join(list(uid))
+
+
+@pytest.fixture
+def event_data() -> DictFromJSON:
+    """Event data with a member uid in responses."""
+    return {
+        "id": _copy("E1"),
+        "heading": "Event One",
+        "responses": {
+            "acceptedIds": [_copy("M1")],
+            "declinedIds": [],
+            "unansweredIds": [],
+            "waitinglistIds": [],
+            "unconfirmedIds": [],
+        },
+        "type": "EVENT",
+        "createdTime": "2020-12-31T19:00:00Z",
+        "endTimestamp": "2024-08-15T11:00:00Z",
+        "startTimestamp": "2021-07-06T06:00:00Z",
+    }
+
+
+@pytest.fixture
+def group_data() -> DictFromJSON:
+    """Group data with a member in a subgroup, with a role."""
+    return {
+        "id": "G1",
+        "name": "Group One",
+        "members": [
+            {
+                "id": _copy("M1"),
+                "createdTime": "2022-03-24T16:36:29Z",
+                "firstName": "Brendan",
+                "lastName": "Gleason",
+                "respondent": True,
+                "subGroups": [_copy("S1")],
+                "roles": [_copy("R1")],
+                "fields": {},
+            }
+        ],
+        "roles": [{"id": _copy("R1"), "name": "Role One"}],
+        "subGroups": [{"id": _copy("S1"), "name": "Subgroup One"}],
+        "fieldDefs": [],
+    }
+
+
+def test_intern() -> None:
+    """Test that equal uids are replaced by the first one added."""
+    # arrange
+    table = UidTable()
+    uid = _copy("M1")
+    # act
+    table.intern(uid)
+    interned_uid = table.intern(_copy("M1"))
+    # assert
+    assert interned_uid is uid
+    assert len(table) == 1
+    assert "M1" in table
+
+
+def test_intern_event_and_group(
+    event_data: DictFromJSON, group_data: DictFromJSON
+) -> None:
+    """Test that uids are shared between an Event and a Group."""
+    # arrange
+    table = UidTable()
+    event = Event.from_dict(event_data)
+    group = Group.from_dict(group_data)
+    assert event.responses.accepted_uids[0] is not group.members[0].uid
+    # act
+    table.intern_event(event)
+    table.intern_group(group)
+    # assert
+    member = group.members[0]
+    assert event.responses.accepted_uids[0] is member.uid
+    assert member.subgroup_uids[0] is group.subgroups[0].uid
+    assert member.role_uids
+    assert member.role_uids[0] is group.roles[0].uid
+    assert event.response_status("M1") == "accepted"
+    assert group.member_by_uid("M1") is member
+
+
+def test_encode_decode() -> None:
+    """Test that uids are encoded as compact `int` codes, and decoded."""
+    # arrange
+    table = UidTable()
+    # act
+    codes = table.encode(["M1", "M2", "M1"])
+    # assert
+    assert codes.tolist() == [0, 1, 0]
+    assert table.decode(codes) == ["M1", "M2", "M1"]
+
+
+def test_uid__unmatched_code_raises_lookup_error() -> None:
+    """Test that LookupError is raised when there is no matching uid."""
+    # arrange
+    table = UidTable()
+    # assert
+    with pytest.raises(LookupError):
+        table.uid(0)  # act
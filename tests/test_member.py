@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
+from operator import attrgetter
 from typing import TYPE_CHECKING
 
 import pytest
@@ -124,3 +125,37 @@ def test_from_dict_full(complex_member_data: DictFromJSON) -> None:
     # - properties:
     assert str(my_member) == "Member(uid='M2', full_name='Ciarán Hinds', …)"
     assert my_member.full_name == "Ciarán Hinds"
+
+
+def test_sort_key__reassignment_discards_cached(
+    simple_member_data: DictFromJSON,
+) -> None:
+    """Test that `sort_key` is computed again after a name is reassigned."""
+    # arrange
+    my_member = Member(**simple_member_data)
+    assert my_member.sort_key == ("gleason", "brendan")
+    # act
+    my_member.first_name = "Domhnall"
+    # assert
+    assert my_member.sort_key == ("gleason", "domhnall")
+
+
+def test_sort_key(simple_member_data: DictFromJSON) -> None:
+    """Test that `sort_key` sorts by last name, then first name, ignoring case and
+    accents.
+    """
+    # arrange
+    names = [("Ciarán", "hinds"), ("Ciara", "Hinds"), ("Brendan", "Gleason")]
+    members = [
+        Member(**{**simple_member_data, "firstName": first, "lastName": last})
+        for first, last in names
+    ]
+    # act
+    sorted_members = sorted(members, key=attrgetter("sort_key"))
+    # assert
+    assert [member.full_name for member in sorted_members] == [
+        "Brendan Gleason",
+        "Ciara Hinds",
+        "Ciarán hinds",
+    ]
+    assert members[0].sort_key == ("hinds", "ciaran")
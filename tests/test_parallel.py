@@ -0,0 +1,108 @@
+"""Tests for parsing in parallel, with the `executor` parameter."""
+
+from __future__ import annotations
+
+import copy
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import TYPE_CHECKING
+
+import pytest
+from pydantic import ValidationError
+
+from spond_classes import Event, Group
+from spond_classes.parallel import _is_gil_enabled, default_executor
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from spond_classes.typing import DictFromJSON
+
+
+@pytest.fixture(scope="module", params=[ThreadPoolExecutor, ProcessPoolExecutor])
+def executor(request: pytest.FixtureRequest) -> Iterator[Executor]:
+    """Executor with 2 workers, of each kind.
+
+    Module scoped, as starting a process pool is slow.
+    """
+    with request.param(max_workers=2) as executor:
+        yield executor
+
+
+def test_event_list_from_data__executor(
+    executor: Executor, synthetic_events_data: list[DictFromJSON]
+) -> None:
+    """Test that `Event`s are the same, in the same order, as without `executor`."""
+    # arrange
+    # act
+    my_events = Event.list_from_data(synthetic_events_data, executor=executor)
+    # assert
+    assert my_events == Event.list_from_data(synthetic_events_data)
+
+
+def test_group_list_from_data__executor_trusted(
+    executor: Executor, synthetic_groups: list[Group]
+) -> None:
+    """Test that trusted `Group`s are the same as without `executor`."""
+    # arrange
+    data = [group.model_dump(by_alias=True) for group in synthetic_groups]
+    # act
+    my_groups = Group.list_from_data(data, trusted=True, executor=executor)
+    # assert
+    assert my_groups == Group.list_from_data(data, trusted=True)
+
+
+def test_list_from_data__executor_same_error(
+    executor: Executor, synthetic_events_data: list[DictFromJSON]
+) -> None:
+    """Test that the error is the same as without `executor`, with indexes in
+    `data`.
+    """
+    # arrange
+    data = copy.deepcopy(synthetic_events_data)
+    del data[12]["heading"]
+    del data[17]["type"]
+    with pytest.raises(ValidationError) as expected:
+        Event.list_from_data(data)
+    # act
+    with pytest.raises(ValidationError) as raised:
+        Event.list_from_data(data, executor=executor)
+    # assert
+    assert raised.value.errors() == expected.value.errors()
+
+
+def test_list_from_data__executor_not_dict_raises_type_error(
+    executor: Executor,
+) -> None:
+    """Test that TypeError is raised before anything is submitted to `executor`."""
+    # arrange
+    list_not_dicts = ["not a dict"]
+    # assert
+    with pytest.raises(TypeError):
+        # Ignore Mypy error - test purposely passes incompatible type
+        Event.list_from_data(list_not_dicts, executor=executor)  # type: ignore[arg-type]
+
+
+def test_default_executor() -> None:
+    """Test that a process pool is returned on Python with the GIL, otherwise a
+    thread pool.
+    """
+    # arrange
+    expected = ProcessPoolExecutor if _is_gil_enabled() else ThreadPoolExecutor
+    # act
+    with default_executor(max_workers=1) as executor:
+        # assert
+        assert isinstance(executor, expected)
+
+
+def test_default_executor__threads_default_to_cpu_count(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that a thread pool defaults to a thread per CPU."""
+    # arrange
+    monkeypatch.setattr("spond_classes.parallel._is_gil_enabled", lambda: False)
+    # act
+    with default_executor() as executor:
+        # assert
+        assert isinstance(executor, ThreadPoolExecutor)
+        assert executor._max_workers == os.cpu_count()  # noqa: SLF001
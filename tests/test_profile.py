@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+import json
 from typing import TYPE_CHECKING
 
 import pytest
+from pydantic import ValidationError
 
 from spond_classes import Profile
 
@@ -48,6 +50,7 @@ def test_from_dict_simple(simple_profile_data: DictFromJSON) -> None:
     # assert
     assert my_profile.uid == "P1"
     assert str(my_profile) == "Profile(uid='P1', full_name='Morgan Freeman', …)"
+    assert my_profile.sort_key == ("freeman", "morgan")
 
 
 def test_from_dict_additional_fields(complex_profile_data: DictFromJSON) -> None:
@@ -59,3 +62,29 @@ def test_from_dict_additional_fields(complex_profile_data: DictFromJSON) -> None
     # - optional:
     assert my_profile.email == "s_hayek@example.com"
     assert my_profile.phone_number == "+123456790"
+
+
+def test_from_json(complex_profile_data: DictFromJSON) -> None:
+    """Test that Profile created from JSON matches that created from dict."""
+    # arrange
+    json_data = json.dumps(complex_profile_data)
+    # act
+    my_profile = Profile.from_json(json_data)
+    # assert
+    assert my_profile == Profile.from_dict(complex_profile_data)
+
+
+def test_list_from_json__invalid_json_raises_validation_error() -> None:
+    """Test that ValidationError is raised if JSON is malformed."""
+    # assert
+    with pytest.raises(ValidationError):
+        Profile.list_from_json(b'[{"id": "P1",')  # act
+
+
+def test_from_dict__trusted(complex_profile_data: DictFromJSON) -> None:
+    """Test that trusted Profile matches validated Profile from valid data."""
+    # arrange
+    # act
+    my_profile = Profile.from_dict(complex_profile_data, trusted=True)
+    # assert
+    assert my_profile == Profile.from_dict(complex_profile_data)
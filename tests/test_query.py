@@ -0,0 +1,257 @@
+"""Tests for `QueryEngine` class and `Predicate`s."""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING
+
+import pytest
+
+from spond_classes import Event, Group, QueryEngine
+from spond_classes.query import has_role, in_group, in_subgroup, responded, where
+from spond_classes.synthetic import iter_events_data, iter_groups_data
+
+if TYPE_CHECKING:
+    from spond_classes import Member
+    from spond_classes.typing import ResponseStatus
+
+START = datetime(2024, 1, 10, tzinfo=timezone.utc)
+END = datetime(2024, 2, 10, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def groups() -> list[Group]:
+    """Synthetic `Group`s, 3 of 20 members each, in 4 subgroups."""
+    return Group.list_from_data(iter_groups_data(groups=3, members=20, subgroups=4))
+
+
+@pytest.fixture
+def events(groups: list[Group]) -> list[Event]:
+    """Synthetic `Event`s, 60 of the first of `groups`, each with responses from 15
+    members.
+    """
+    data = groups[0].model_dump(by_alias=True, mode="json")
+    return Event.list_from_data(iter_events_data(data, events=60, responses=15))
+
+
+@pytest.fixture
+def engine(groups: list[Group], events: list[Event]) -> QueryEngine:
+    """Engine of `groups` and `events`."""
+    return QueryEngine(groups, events)
+
+
+def _all_members(groups: list[Group]) -> list[Member]:
+    """Return the `Member`s of all `groups`, in order."""
+    return [member for group in groups for member in group.members]
+
+
+def _count(
+    events: list[Event],
+    member: Member,
+    status: ResponseStatus,
+    start: datetime | None = None,
+    end: datetime | None = None,
+) -> int:
+    """Return number of `events` in range to which `member` responded with
+    `status`, by scanning.
+    """
+    return sum(
+        member.uid in getattr(event.responses, f"{status}_uids")
+        and (start is None or event.start_time >= start)
+        and (end is None or event.start_time < end)
+        for event in events
+    )
+
+
+def test_members__no_predicate(engine: QueryEngine, groups: list[Group]) -> None:
+    """Test that all `Member`s are returned, in order."""
+    # arrange
+    # act
+    members = engine.members()
+    # assert
+    assert members == _all_members(groups)
+
+
+def test_members__indexed(engine: QueryEngine, groups: list[Group]) -> None:
+    """Test that `in_group()`, `in_subgroup()`, `has_role()` match the same
+    `Member`s as scanning.
+    """
+    # arrange
+    group = groups[1]
+    subgroup, role = group.subgroups[0], group.roles[0]
+    # act
+    in_group_members = engine.members(in_group(group.uid))
+    in_subgroup_members = engine.members(in_subgroup(subgroup.uid))
+    has_role_members = engine.members(has_role(role.uid))
+    # assert
+    assert in_group_members == group.members
+    assert in_subgroup_members == [
+        member for member in group.members if subgroup.uid in member.subgroup_uids
+    ]
+    assert has_role_members == [
+        member for member in group.members if role.uid in (member.role_uids or [])
+    ]
+
+
+def test_members__unknown_uid__empty(engine: QueryEngine) -> None:
+    """Test that no `Member`s match an unknown uid."""
+    # arrange
+    # act
+    members = engine.members(in_group("DUMMY_ID"))
+    # assert
+    assert members == []
+
+
+def test_members__responded_in_range(
+    engine: QueryEngine, groups: list[Group], events: list[Event]
+) -> None:
+    """Test that `responded()` with a time range and count matches scanning."""
+    # arrange
+    group = groups[0]
+    subgroup = group.subgroups[0]
+    predicate = in_subgroup(subgroup.uid) & responded(
+        "accepted", at_least=3, start=START, end=END
+    )
+    # act
+    members = engine.members(predicate)
+    # assert
+    expected = [
+        member
+        for member in group.members
+        if subgroup.uid in member.subgroup_uids
+        and _count(events, member, "accepted", START, END) >= 3  # noqa: PLR2004
+    ]
+    assert members
+    assert members == expected
+
+
+def test_members__or_not_where(engine: QueryEngine, groups: list[Group]) -> None:
+    """Test that `|`, `~` and `where()` match the same `Member`s as scanning."""
+    # arrange
+    group = groups[2]
+    subgroup_0, subgroup_1 = group.subgroups[0].uid, group.subgroups[1].uid
+    predicate = (in_subgroup(subgroup_0) | in_subgroup(subgroup_1)) & ~where(
+        lambda member: member.respondent
+    )
+    # act
+    members = engine.members(predicate)
+    # assert
+    assert members == [
+        member
+        for member in _all_members(groups)
+        if {subgroup_0, subgroup_1} & set(member.subgroup_uids)
+        and not member.respondent
+    ]
+
+
+def test_members__not_responded(
+    engine: QueryEngine, groups: list[Group], events: list[Event]
+) -> None:
+    """Test that `~responded()` includes `Member`s with no responses."""
+    # arrange
+    # act
+    members = engine.members(~responded("declined"))
+    # assert
+    assert members == [
+        member
+        for member in _all_members(groups)
+        if not _count(events, member, "declined")
+    ]
+
+
+@pytest.mark.parametrize("status", ["accepted", "waiting_list"])
+def test_members__and_same_in_either_order(
+    engine: QueryEngine, groups: list[Group], status: ResponseStatus
+) -> None:
+    """Test that `&` matches the same `Member`s whichever `Predicate` is more
+    selective, i.e. whichever the plan starts from.
+    """
+    # arrange
+    indexed = in_group(groups[0].uid)
+    counted = responded(status, start=START, end=END)
+    # act
+    members = engine.members(indexed & counted)
+    # assert
+    assert members == engine.members(counted & indexed)
+    assert members == [
+        member
+        for member in engine.members(indexed)
+        if member in engine.members(counted)
+    ]
+
+
+@pytest.mark.parametrize("at_least", [0, -1])
+def test_responded__at_least_less_than_1_raises_value_error(at_least: int) -> None:
+    """Test that ValueError is raised if `at_least` is less than 1, as every
+    `Member` would match.
+    """
+    # arrange
+    # assert
+    with pytest.raises(ValueError, match="at_least"):
+        responded("accepted", at_least=at_least)  # act
+
+
+def test_members__and_starts_from_most_selective(
+    engine: QueryEngine, groups: list[Group]
+) -> None:
+    """Test that a `where()` combined with an indexed `Predicate` is only called
+    for the indexed candidates.
+    """
+    # arrange
+    group = groups[1]
+    checked = []
+
+    def func(member: Member) -> bool:
+        checked.append(member)
+        return True
+
+    # act
+    engine.members(where(func) & in_group(group.uid))
+    # assert
+    assert sorted(checked, key=id) == sorted(group.members, key=id)
+
+
+def test_events_of(
+    engine: QueryEngine, groups: list[Group], events: list[Event]
+) -> None:
+    """Test that `Event`s a `Member` responded to are joined in start time order."""
+    # arrange
+    member = groups[0].members[0]
+    # act
+    result = engine.events_of(member.uid, "accepted", start=START, end=END)
+    # assert
+    assert result == [
+        event
+        for event in sorted(events, key=lambda event: event.start_time)
+        if member.uid in event.responses.accepted_uids
+        and START <= event.start_time < END
+    ]
+
+
+def test_members_of(
+    engine: QueryEngine, groups: list[Group], events: list[Event]
+) -> None:
+    """Test that `Member`s who responded to an `Event` are joined."""
+    # arrange
+    event = events[0]
+    # act
+    members = engine.members_of(event.uid, "accepted")
+    # assert
+    assert [member.uid for member in members] == event.responses.accepted_uids
+    assert all(engine.group_of(member.uid) is groups[0] for member in members)
+
+
+def test_group_of__unknown_uid_raises_lookup_error(engine: QueryEngine) -> None:
+    """Test that LookupError is raised for an unknown `Member` uid."""
+    # arrange
+    # assert
+    with pytest.raises(LookupError):
+        engine.group_of("DUMMY_ID")  # act
+
+
+def test_members_of__unknown_uid_raises_lookup_error(engine: QueryEngine) -> None:
+    """Test that LookupError is raised for an unknown `Event` uid."""
+    # arrange
+    # assert
+    with pytest.raises(LookupError):
+        engine.members_of("DUMMY_ID", "accepted")  # act
@@ -0,0 +1,174 @@
+"""Tests for `ProfileRegistry` class."""
+
+from __future__ import annotations
+
+import pytest
+
+from spond_classes import Group, Membership, ProfileRegistry
+from spond_classes.synthetic import iter_groups_data
+
+
+@pytest.fixture
+def groups() -> list[Group]:
+    """Synthetic `Group`s, 3 of 10 members each, with `Profile`s of 15 people, so
+    some are shared between `Group`s.
+    """
+    return Group.list_from_data(iter_groups_data(groups=3, members=10, people=15))
+
+
+def test_add_group__shares_profiles(groups: list[Group]) -> None:
+    """Test that each person's `Profile` is a single instance across `Group`s."""
+    # arrange
+    registry = ProfileRegistry()
+    # act
+    for group in groups:
+        registry.add_group(group)
+    # assert
+    profiles = [
+        member.profile
+        for group in groups
+        for member in group.members
+        if member.profile is not None
+    ]
+    uids = {profile.uid for profile in profiles}
+    assert len({id(profile) for profile in profiles}) == len(uids)
+    assert len(registry) == len(uids) + len(groups)  # + contact persons
+    for profile in profiles:
+        assert registry.profile_by_uid(profile.uid) is profile
+
+
+def test_add_group__returns_group(groups: list[Group]) -> None:
+    """Test that the `Group` is returned, so it can be used inline."""
+    # arrange
+    registry = ProfileRegistry()
+    # act
+    my_group = registry.add_group(groups[0])
+    # assert
+    assert my_group is groups[0]
+
+
+def test_memberships(groups: list[Group]) -> None:
+    """Test that all `Membership`s of a `Profile` are returned, in the order
+    `Group`s were added.
+    """
+    # arrange
+    registry = ProfileRegistry()
+    for group in groups:
+        registry.add_group(group)
+    # act
+    memberships = {
+        profile.uid: registry.memberships(profile.uid) for profile in registry
+    }
+    # assert
+    for profile in registry:
+        expected = [
+            Membership(group, member)
+            for group in groups
+            for member in group.members
+            if member.profile is profile
+        ]
+        assert list(memberships[profile.uid]) == expected
+        assert registry.groups(profile.uid) == [group for group, _ in expected]
+
+
+def test_memberships__unknown_uid__empty() -> None:
+    """Test that no `Membership`s are returned for an unknown uid."""
+    # arrange
+    registry = ProfileRegistry()
+    # act
+    memberships = registry.memberships("DUMMY_ID")
+    # assert
+    assert memberships == ()
+
+
+def test_profile_by_uid__unknown_uid_raises_lookup_error() -> None:
+    """Test that LookupError is raised for an unknown uid."""
+    # arrange
+    registry = ProfileRegistry()
+    # assert
+    assert "DUMMY_ID" not in registry
+    with pytest.raises(LookupError):
+        registry.profile_by_uid("DUMMY_ID")  # act
+
+
+def test_add_group__different_profile_data_kept(groups: list[Group]) -> None:
+    """Test that a `Profile` with different data from the registered one isn't
+    replaced.
+    """
+    # arrange
+    registry = ProfileRegistry()
+    registry.add_group(groups[0])
+    member = groups[0].members[0]
+    assert member.profile is not None
+    other = Group.from_dict(groups[0].model_dump(by_alias=True) | {"id": "OTHER_ID"})
+    other_profile = other.members[0].profile
+    assert other_profile is not None
+    other_profile.first_name = "Changed"
+    # act
+    registry.add_group(other)
+    # assert
+    assert other.members[0].profile is other_profile
+    assert registry.profile_by_uid(other_profile.uid) is member.profile
+    assert [group for group, _ in registry.memberships(other_profile.uid)] == [
+        groups[0],
+        other,
+    ]
+
+
+def test_add_group__again_replaces_memberships(groups: list[Group]) -> None:
+    """Test that adding a `Group` with the same uid replaces its `Membership`s."""
+    # arrange
+    registry = ProfileRegistry()
+    registry.add_group(groups[0])
+    removed = groups[0].members[0]
+    assert removed.profile is not None
+    updated = groups[0].model_copy(update={"members": groups[0].members[1:]})
+    # act
+    registry.add_group(updated)
+    # assert
+    assert registry.memberships(removed.profile.uid) == ()
+    for member in updated.members:
+        assert member.profile is not None
+        assert registry.memberships(member.profile.uid) == (
+            Membership(updated, member),
+        )
+
+
+def test_remove_group(groups: list[Group]) -> None:
+    """Test that `Membership`s of only the removed `Group` are removed, and
+    `Profile`s are kept.
+    """
+    # arrange
+    registry = ProfileRegistry()
+    for group in groups:
+        registry.add_group(group)
+    count = len(registry)
+    # act
+    registry.remove_group(groups[0].uid)
+    # assert
+    assert len(registry) == count
+    for profile in registry:
+        assert groups[0] not in registry.groups(profile.uid)
+    assert sum(len(registry.memberships(profile.uid)) for profile in registry) == sum(
+        len(group.members) for group in groups[1:]
+    )
+
+
+def test_add_group__again_with_shared_profile(groups: list[Group]) -> None:
+    """Test that a `Group` in which two `Member`s share a `Profile` can be added
+    again.
+    """
+    # arrange
+    registry = ProfileRegistry()
+    group = groups[0]
+    first, second = group.members[:2]
+    second.profile = first.profile
+    registry.add_group(group)
+    # act
+    registry.add_group(group)
+    # assert
+    assert first.profile is not None
+    assert registry.memberships(first.profile.uid) == (
+        Membership(group, first),
+        Membership(group, second),
+    )
@@ -0,0 +1,175 @@
+"""Tests for snapshot module."""
+
+from __future__ import annotations
+
+import stat
+from typing import TYPE_CHECKING
+
+import pytest
+
+from spond_classes import Event, Group, Profile
+from spond_classes.snapshot import content_hash, load_snapshot, save_snapshot
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from spond_classes.typing import DictFromJSON
+
+
+def test_save_load__events_round_trip(
+    tmp_path: Path, synthetic_events: list[Event]
+) -> None:
+    """Test that loaded `Event`s equal those saved."""
+    # arrange
+    path = tmp_path / "events.snapshot"
+    save_snapshot(path, synthetic_events, key="k")
+    # act
+    loaded = load_snapshot(path, Event, key="k")
+    # assert
+    assert loaded == synthetic_events
+
+
+@pytest.mark.parametrize("lazy_members", [False, True])
+def test_save_load__groups_round_trip(
+    tmp_path: Path, synthetic_groups_data: list[DictFromJSON], *, lazy_members: bool
+) -> None:
+    """Test that loaded `Group`s equal those saved, and their indexes work."""
+    # arrange
+    path = tmp_path / "groups.snapshot"
+    my_groups = Group.list_from_data(synthetic_groups_data, lazy_members=lazy_members)
+    save_snapshot(path, my_groups, key="k")
+    # act
+    loaded = load_snapshot(path, Group, key="k")
+    # assert
+    assert loaded == my_groups
+    my_member = my_groups[0].members[0]
+    assert loaded[0].member_by_uid(my_member.uid) == my_member
+
+
+def test_save_load__empty(tmp_path: Path) -> None:
+    """Test that an empty list round trips."""
+    # arrange
+    path = tmp_path / "empty.snapshot"
+    save_snapshot(path, [], key="k")
+    # act
+    loaded = load_snapshot(path, Event, key="k")
+    # assert
+    assert loaded == []
+
+
+def test_save__replaces_existing(tmp_path: Path, synthetic_events: list[Event]) -> None:
+    """Test that saving replaces an existing snapshot, leaving no temporary files."""
+    # arrange
+    path = tmp_path / "events.snapshot"
+    save_snapshot(path, synthetic_events, key="old")
+    # act
+    save_snapshot(path, synthetic_events[:1], key="new")
+    # assert
+    assert load_snapshot(path, Event, key="new") == synthetic_events[:1]
+    assert list(tmp_path.iterdir()) == [path]
+
+
+def test_save__mode_as_new_file(tmp_path: Path) -> None:
+    """Test that the snapshot has the same permissions as a file created by
+    `open()`.
+    """
+    # arrange
+    path = tmp_path / "events.snapshot"
+    new_path = tmp_path / "new"
+    new_path.touch()
+    # act
+    save_snapshot(path, [], key="k")
+    # assert
+    assert stat.S_IMODE(path.stat().st_mode) == stat.S_IMODE(new_path.stat().st_mode)
+
+
+def test_save__mixed_classes_raises_type_error(
+    tmp_path: Path, synthetic_events: list[Event], synthetic_groups: list[Group]
+) -> None:
+    """Test that TypeError is raised if models are of different classes."""
+    # arrange
+    models = [synthetic_events[0], synthetic_groups[0]]
+    # assert
+    with pytest.raises(TypeError):
+        save_snapshot(tmp_path / "mixed.snapshot", models, key="k")  # act
+
+
+def test_load__missing_returns_none(tmp_path: Path) -> None:
+    """Test that a missing snapshot isn't loaded."""
+    # arrange
+    path = tmp_path / "missing.snapshot"
+    # act
+    loaded = load_snapshot(path, Event, key="k")
+    # assert
+    assert loaded is None
+
+
+def test_load__stale_key_returns_none(
+    tmp_path: Path, synthetic_events: list[Event]
+) -> None:
+    """Test that a snapshot with a different key isn't loaded."""
+    # arrange
+    path = tmp_path / "events.snapshot"
+    save_snapshot(path, synthetic_events, key="old")
+    # act
+    loaded = load_snapshot(path, Event, key="new")
+    # assert
+    assert loaded is None
+
+
+def test_load__other_model_returns_none(
+    tmp_path: Path, synthetic_events: list[Event]
+) -> None:
+    """Test that a snapshot of a different model class isn't loaded."""
+    # arrange
+    path = tmp_path / "events.snapshot"
+    save_snapshot(path, synthetic_events, key="k")
+    # act
+    loaded = load_snapshot(path, Profile, key="k")
+    # assert
+    assert loaded is None
+
+
+@pytest.mark.parametrize("content", [b"", b"not a snapshot", b"SPONDSNP\x01"])
+def test_load__invalid_returns_none(tmp_path: Path, content: bytes) -> None:
+    """Test that a file which isn't a snapshot isn't loaded."""
+    # arrange
+    path = tmp_path / "invalid.snapshot"
+    path.write_bytes(content)
+    # act
+    loaded = load_snapshot(path, Event, key="k")
+    # assert
+    assert loaded is None
+
+
+def test_load__truncated_returns_none(
+    tmp_path: Path, synthetic_events: list[Event]
+) -> None:
+    """Test that a truncated snapshot isn't loaded."""
+    # arrange
+    path = tmp_path / "events.snapshot"
+    save_snapshot(path, synthetic_events, key="k")
+    path.write_bytes(path.read_bytes()[:-10])
+    # act
+    loaded = load_snapshot(path, Event, key="k")
+    # assert
+    assert loaded is None
+
+
+def test_content_hash__ignores_key_order() -> None:
+    """Test that `dict`s with the same content in a different order hash the same."""
+    # arrange
+    # act
+    my_hash = content_hash([{"a": 1, "b": 2}])
+    # assert
+    assert my_hash == content_hash([{"b": 2, "a": 1}])
+    assert my_hash != content_hash([{"a": 2}])
+
+
+def test_content_hash__str_and_bytes() -> None:
+    """Test that serialised JSON hashes the same as `str` or `bytes`."""
+    # arrange
+    # act
+    my_hash = content_hash('[{"a": 1}]')
+    # assert
+    assert my_hash == content_hash(b'[{"a": 1}]')
@@ -0,0 +1,123 @@
+"""Tests for synthetic module."""
+
+from __future__ import annotations
+
+import itertools
+
+from spond_classes import Event, Group, Profile
+from spond_classes.synthetic import (
+    group_data,
+    iter_events_data,
+    iter_groups_data,
+    profile_data,
+)
+
+
+def test_profile_data__is_valid() -> None:
+    """Test that generated profile data constructs a `Profile`."""
+    # arrange
+    data = profile_data(seed=1)
+    # act
+    my_profile = Profile.from_dict(data)
+    # assert
+    assert my_profile.uid == data["id"]
+
+
+def test_group_data__is_valid_and_consistent() -> None:
+    """Test that generated group data constructs a `Group` whose members reference
+    its subgroups, roles and field defs.
+    """
+    # arrange
+    members, subgroups, roles = 50, 4, 3
+    data = group_data(members=members, subgroups=subgroups, roles=roles)
+    # act
+    my_group = Group.from_dict(data)
+    # assert
+    assert len(my_group.members) == members
+    assert len(my_group.subgroups) == subgroups
+    assert len(my_group.roles) == roles
+    subgroup_uids = {subgroup.uid for subgroup in my_group.subgroups}
+    role_uids = {role.uid for role in my_group.roles}
+    field_def_uids = {field_def.uid for field_def in my_group.field_defs}
+    for member in my_group.members:
+        assert set(member.subgroup_uids) <= subgroup_uids
+        assert set(member.role_uids or []) <= role_uids
+        assert set(member.fields) <= field_def_uids
+
+
+def test_group_data__is_deterministic() -> None:
+    """Test that the same `seed` generates the same data, and a different one
+    doesn't.
+    """
+    # arrange
+    # act
+    data = group_data(seed=1)
+    # assert
+    assert data == group_data(seed=1)
+    assert data != group_data(seed=2)
+
+
+def test_iter_groups_data__yields_distinct_groups() -> None:
+    """Test that `groups` distinct groups are generated."""
+    # arrange
+    count = 3
+    # act
+    my_groups = Group.list_from_data(iter_groups_data(groups=count, members=5))
+    # assert
+    assert len({group.uid for group in my_groups}) == count
+
+
+def test_iter_events_data__responses_from_group_members() -> None:
+    """Test that generated events are valid, in start order, with responses only
+    from members of the group.
+    """
+    # arrange
+    count, responses = 20, 10
+    data = group_data(members=30)
+    member_uids = {member["id"] for member in data["members"]}
+    # act
+    my_events = Event.list_from_data(
+        iter_events_data(data, events=count, responses=responses)
+    )
+    # assert
+    assert len(my_events) == count
+    assert [event.start_time for event in my_events] == sorted(
+        event.start_time for event in my_events
+    )
+    for event in my_events:
+        uids = set().union(*event.responses.uid_sets.values())
+        assert len(uids) == responses
+        assert uids <= member_uids
+
+
+def test_iter_events_data__is_lazy() -> None:
+    """Test that events are generated on demand, so a huge count can be streamed."""
+    # arrange
+    count = 3
+    # act
+    events_data = list(
+        itertools.islice(iter_events_data(group_data(), events=10**12), count)
+    )
+    # assert
+    assert len(events_data) == count
+
+
+def test_iter_groups_data__people__shared_profiles() -> None:
+    """Test that members' profiles are drawn from `people` profiles, shared by
+    groups.
+    """
+    # arrange
+    people, members = 15, 10
+    # act
+    my_groups = Group.list_from_data(
+        iter_groups_data(groups=3, members=members, people=people)
+    )
+    # assert
+    uids = [
+        member.profile.uid
+        for group in my_groups
+        for member in group.members
+        if member.profile is not None
+    ]
+    assert len(uids) == len(my_groups) * members
+    assert len(set(uids)) <= people < len(uids)